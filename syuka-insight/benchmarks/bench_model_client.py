@@ -0,0 +1,75 @@
+"""웹 서버 → 모델 서버 호출 지연 시간 비교 벤치마크
+
+기존 방식(호출마다 새 연결을 여는 requests / aiohttp 세션)과
+앱 수명 동안 유지하는 httpx.AsyncClient 연결 풀의 지연 시간을 비교합니다.
+모델 서버가 실행 중이어야 합니다.
+
+사용 예시:
+    python benchmarks/bench_model_client.py --url http://localhost:8001 --requests 200 --concurrency 1 8
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+import requests
+
+def summarize(name, concurrency, latencies, elapsed):
+    latencies = sorted(latencies)
+    p = lambda q: latencies[min(len(latencies) - 1, int(len(latencies) * q))] * 1000
+    print(
+        f"{name:>16} {concurrency:>4} {statistics.mean(latencies) * 1000:>9.2f} "
+        f"{p(0.5):>9.2f} {p(0.95):>9.2f} {p(0.99):>9.2f} {len(latencies) / elapsed:>9.1f}"
+    )
+
+async def run_requests(url, total, concurrency):
+    """이전 구현 (비교용): 호출마다 requests로 새 연결을 엽니다."""
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    def call():
+        start = time.perf_counter()
+        requests.get(url, timeout=10).raise_for_status()
+        return time.perf_counter() - start
+
+    async def one():
+        async with semaphore:
+            latencies.append(await asyncio.to_thread(call))
+
+    await asyncio.gather(*[one() for _ in range(total)])
+    return latencies
+
+async def run_pooled(url, total, concurrency):
+    """공유 httpx.AsyncClient (keep-alive 연결 재사용)"""
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+    async with httpx.AsyncClient(limits=httpx.Limits(max_keepalive_connections=concurrency)) as client:
+
+        async def one():
+            async with semaphore:
+                start = time.perf_counter()
+                (await client.get(url)).raise_for_status()
+                latencies.append(time.perf_counter() - start)
+
+        await asyncio.gather(*[one() for _ in range(total)])
+    return latencies
+
+async def main():
+    parser = argparse.ArgumentParser(description="모델 서버 호출 지연 시간 비교")
+    parser.add_argument("--url", default="http://localhost:8001")
+    parser.add_argument("--path", default="/health")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8])
+    args = parser.parse_args()
+    url = args.url.rstrip("/") + args.path
+
+    print(f"{'client':>16} {'conc':>4} {'mean(ms)':>9} {'p50(ms)':>9} {'p95(ms)':>9} {'p99(ms)':>9} {'req/s':>9}")
+    for concurrency in args.concurrency:
+        for name, runner in (("requests", run_requests), ("httpx pooled", run_pooled)):
+            start = time.perf_counter()
+            latencies = await runner(url, args.requests, concurrency)
+            summarize(name, concurrency, latencies, time.perf_counter() - start)
+
+if __name__ == "__main__":
+    asyncio.run(main())
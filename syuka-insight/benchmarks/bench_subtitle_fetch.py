@@ -0,0 +1,67 @@
+"""자막 추출 방식 비교 벤치마크 (네트워크 필요)
+
+기존 방식(extract_info → yt.download로 VTT 파일 저장 → 파일 읽기)과
+extract_info 한 번으로 얻은 자막 URL을 메모리로 바로 읽는 방식의 소요 시간을 비교합니다.
+기존 방식은 임시 디렉토리에서 실행해 작업 디렉토리에 파일을 남기지 않습니다.
+
+사용 예시:
+    python benchmarks/bench_subtitle_fetch.py https://www.youtube.com/watch?v=... --repeat 3
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import yt_dlp
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "web_server", "app"))
+
+from utils.youtube_utils import get_video_info_and_subtitles  # noqa: E402
+from utils.vtt_parser import iter_vtt_cues  # noqa: E402
+
+def legacy_fetch(video_url):
+    """이전 구현 (비교용): 자막을 파일로 다운로드한 뒤 다시 읽습니다."""
+    with tempfile.TemporaryDirectory() as tmp:
+        opts = {
+            "quiet": True,
+            "writesubtitles": True,
+            "writeautomaticsub": True,
+            "skip_download": True,
+            "subtitlesformat": "vtt",
+            "outtmpl": os.path.join(tmp, "%(id)s.%(ext)s"),
+            "subtitleslangs": ["ko"],
+        }
+        with yt_dlp.YoutubeDL(opts) as yt:
+            info = yt.extract_info(video_url, download=False)
+            yt.download([video_url])
+            subtitle_file = os.path.join(tmp, f"{info.get('id', '')}.ko.vtt")
+            if not os.path.exists(subtitle_file):
+                return info, []
+            with open(subtitle_file, "r", encoding="utf-8") as f:
+                return info, list(iter_vtt_cues(f.read()))
+
+def measure(func, video_url, repeat):
+    timings = []
+    cue_count = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        _, cues = func(video_url)
+        timings.append(time.perf_counter() - start)
+        cue_count = len(cues or [])
+    return min(timings), sum(timings) / len(timings), cue_count
+
+def main():
+    parser = argparse.ArgumentParser(description="자막 추출 방식 비교 벤치마크")
+    parser.add_argument("urls", nargs="+")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'video':>12} {'legacy(s)':>10} {'memory(s)':>10} {'saved(s)':>9} {'cues':>6}")
+    for url in args.urls:
+        legacy_best, legacy_mean, _ = measure(legacy_fetch, url, args.repeat)
+        new_best, new_mean, cues = measure(get_video_info_and_subtitles, url, args.repeat)
+        print(f"{url[-11:]:>12} {legacy_mean:>10.2f} {new_mean:>10.2f} {legacy_mean - new_mean:>9.2f} {cues:>6}")
+
+if __name__ == "__main__":
+    main()
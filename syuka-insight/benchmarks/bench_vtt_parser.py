@@ -0,0 +1,79 @@
+"""자막(WebVTT) 정제 마이크로벤치마크
+
+유튜브 자동 자막 형식(이전 줄을 반복하는 rolling 큐)의 긴 VTT를 생성해
+기존 정규식 + sorted(set(...)) 방식과 단일 패스 파서의 처리 시간을 비교합니다.
+
+사용 예시:
+    python benchmarks/bench_vtt_parser.py --hours 1 2 4
+"""
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "web_server", "app"))
+
+from utils.vtt_parser import vtt_to_text  # noqa: E402
+
+WORDS = ["경제", "금리", "환율", "주식", "부동산", "반도체", "수출", "인플레이션", "미국", "중국",
+         "일본", "정부", "기업", "시장", "투자", "성장", "위기", "정책", "소비", "물가"]
+
+def legacy_clean_subtitle_content(content):
+    """이전 구현 (비교용)"""
+    clean_content = re.sub(r'WEBVTT.*?Kind.*?Language.*?\n', '', content, flags=re.DOTALL)
+    clean_content = re.sub(r'<.*?>', '', clean_content)
+    clean_content = re.sub(r'<\d{2}:\d{2}:\d{2}\.\d{3}>', '', clean_content)
+    clean_content = re.sub(r'\d{2}:\d{2}:\d{2}\.\d{3} --> \d{2}:\d{2}:\d{2}\.\d{3}', '', clean_content)
+    clean_content = re.sub(r'align:start position:\d+%', '', clean_content)
+    clean_content = "\n".join(sorted(set(clean_content.splitlines()), key=lambda x: clean_content.index(x)))
+    clean_content = "\n".join([line.strip() for line in clean_content.splitlines() if line.strip()])
+    return clean_content
+
+def format_timestamp(seconds):
+    ms = int(round(seconds * 1000))
+    return f"{ms // 3600000:02d}:{ms // 60000 % 60:02d}:{ms // 1000 % 60:02d}.{ms % 1000:03d}"
+
+def generate_auto_caption_vtt(hours, seed=0):
+    """유튜브 자동 자막과 같은 구조의 VTT를 생성합니다. (2초마다 새 줄)"""
+    rng = random.Random(seed)
+    parts = ["WEBVTT\nKind: captions\nLanguage: ko\n"]
+    previous = " "
+    t = 0.0
+    while t < hours * 3600:
+        words = [rng.choice(WORDS) + str(rng.randint(0, 999)) for _ in range(6)]
+        tagged = words[0] + "".join(
+            f"<{format_timestamp(t + 0.2 * (i + 1))}><c> {w}</c>" for i, w in enumerate(words[1:])
+        )
+        plain = " ".join(words)
+        # 새 줄이 나오는 큐 + 10ms짜리 스냅샷 큐
+        parts.append(f"{format_timestamp(t)} --> {format_timestamp(t + 1.99)} align:start position:0%\n{previous}\n{tagged}\n")
+        parts.append(f"{format_timestamp(t + 1.99)} --> {format_timestamp(t + 2.0)} align:start position:0%\n{plain}\n \n")
+        previous = plain
+        t += 2.0
+    return "\n".join(parts)
+
+def measure(func, content, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(content)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main():
+    parser = argparse.ArgumentParser(description="WebVTT 정제 마이크로벤치마크")
+    parser.add_argument("--hours", type=float, nargs="+", default=[0.5, 1, 2, 4])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'hours':>6} {'size(KB)':>9} {'legacy(s)':>10} {'parser(s)':>10} {'speedup':>8}")
+    for hours in args.hours:
+        content = generate_auto_caption_vtt(hours)
+        legacy = measure(legacy_clean_subtitle_content, content, args.repeat)
+        new = measure(vtt_to_text, content, args.repeat)
+        print(f"{hours:>6} {len(content.encode('utf-8')) // 1024:>9} {legacy:>10.3f} {new:>10.3f} {legacy / new:>7.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""벤치마크용 로컬 대체 모델 (Gemini API 없이 결정적으로 동작)
+
+- FakeStreamingChatModel: 입력에 따라 정해진 토큰을 설정한 지연 시간으로 스트리밍하는 채팅 모델
+- 임베딩은 모델 서버의 hashing 백엔드(EMBEDDING_BACKEND=hashing)를 사용
+"""
+from typing import Any, AsyncIterator, Iterator, List, Optional
+import asyncio
+import hashlib
+import os
+import time
+
+from langchain_core.callbacks import AsyncCallbackManagerForLLMRun, CallbackManagerForLLMRun
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+
+# 첫 토큰까지의 지연, 토큰 사이 지연 (초), 응답 토큰 수
+BENCH_LLM_FIRST_TOKEN_LATENCY = float(os.getenv("BENCH_LLM_FIRST_TOKEN_LATENCY", "0.3"))
+BENCH_LLM_TOKEN_LATENCY = float(os.getenv("BENCH_LLM_TOKEN_LATENCY", "0.02"))
+BENCH_LLM_TOKENS = int(os.getenv("BENCH_LLM_TOKENS", "80"))
+
+WORDS = ["경제", "금리", "환율", "주식", "시장", "정책", "성장", "물가", "수출", "투자"]
+
+class FakeStreamingChatModel(BaseChatModel):
+    """입력 메시지의 해시로 정해지는 응답을 토큰 단위로 스트리밍합니다."""
+
+    model: str = "fake-chat"
+    first_token_latency: float = BENCH_LLM_FIRST_TOKEN_LATENCY
+    token_latency: float = BENCH_LLM_TOKEN_LATENCY
+    num_tokens: int = BENCH_LLM_TOKENS
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-streaming-chat"
+
+    def _tokens(self, messages: List[BaseMessage]) -> List[str]:
+        digest = hashlib.sha256("".join(str(m.content) for m in messages).encode("utf-8")).digest()
+        return [f"{WORDS[digest[i % len(digest)] % len(WORDS)]} " for i in range(self.num_tokens)]
+
+    def _generate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        time.sleep(self.first_token_latency + self.token_latency * self.num_tokens)
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content="".join(self._tokens(messages))))])
+
+    async def _agenerate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        await asyncio.sleep(self.first_token_latency + self.token_latency * self.num_tokens)
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content="".join(self._tokens(messages))))])
+
+    def _stream(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> Iterator[ChatGenerationChunk]:
+        time.sleep(self.first_token_latency)
+        for i, token in enumerate(self._tokens(messages)):
+            if i:
+                time.sleep(self.token_latency)
+            chunk = ChatGenerationChunk(message=AIMessageChunk(content=token))
+            if run_manager:
+                run_manager.on_llm_new_token(token, chunk=chunk)
+            yield chunk
+
+    async def _astream(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[ChatGenerationChunk]:
+        await asyncio.sleep(self.first_token_latency)
+        for i, token in enumerate(self._tokens(messages)):
+            if i:
+                await asyncio.sleep(self.token_latency)
+            chunk = ChatGenerationChunk(message=AIMessageChunk(content=token))
+            if run_manager:
+                await run_manager.on_llm_new_token(token, chunk=chunk)
+            yield chunk
+
+def install_model_fakes():
+    """모델 서버 모듈을 import하기 전에 호출해 Gemini 채팅 모델을 로컬 대체 모델로, 임베딩을 hashing 백엔드로 바꿉니다."""
+    os.environ.setdefault("GOOGLE_API_KEY", "bench-fake-key")
+    os.environ.setdefault("EMBEDDING_BACKEND", "hashing")
+    import utils.llm_utils as llm_utils
+
+    llm_utils.create_llm = lambda model_name="fake-chat", temperature=0.7, streaming=False: FakeStreamingChatModel(model=model_name)
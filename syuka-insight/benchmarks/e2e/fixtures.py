@@ -0,0 +1,93 @@
+"""벤치마크용 영상 정보/자막(VTT) 픽스처
+
+BENCH_FIXTURE_DIR에 record_fixture.py로 기록한 <video_id>.info.json, <video_id>.ko.vtt가 있으면 그것을 사용하고,
+없으면 video_id로 정해지는 합성 픽스처(자동 자막 형식 VTT + 챕터)를 만듭니다.
+"""
+import hashlib
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from bench_vtt_parser import generate_auto_caption_vtt  # noqa: E402
+
+BENCH_FIXTURE_DIR = os.getenv("BENCH_FIXTURE_DIR", os.path.join(os.path.dirname(__file__), "fixtures"))
+# 합성 픽스처 영상 길이 (시간)와 챕터 수
+BENCH_VIDEO_HOURS = float(os.getenv("BENCH_VIDEO_HOURS", "0.5"))
+BENCH_VIDEO_CHAPTERS = int(os.getenv("BENCH_VIDEO_CHAPTERS", "6"))
+# yt-dlp 추출을 흉내 내는 지연 시간 (초)
+BENCH_YTDLP_LATENCY = float(os.getenv("BENCH_YTDLP_LATENCY", "1.0"))
+
+ID_CHARS = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_"
+
+def make_video_ids(count, run_tag):
+    """run_tag마다 다른 11자리 영상 ID를 만듭니다. (실행마다 새 ID를 써서 이전 실행의 캐시를 피함)"""
+    ids = []
+    for i in range(count):
+        digest = hashlib.sha256(f"{run_tag}:{i}".encode()).digest()
+        ids.append("".join(ID_CHARS[b % len(ID_CHARS)] for b in digest[:11]))
+    return ids
+
+def synthetic_info(video_id, hours=BENCH_VIDEO_HOURS, chapters=BENCH_VIDEO_CHAPTERS):
+    duration = int(hours * 3600)
+    step = duration / chapters
+    return {
+        "id": video_id,
+        "title": f"벤치마크 영상 {video_id}",
+        "channel": "bench",
+        "view_count": random.Random(video_id).randint(1000, 2_000_000),
+        "upload_date": "20240101",
+        "duration": duration,
+        "duration_string": f"{duration // 3600}:{duration // 60 % 60:02d}:{duration % 60:02d}",
+        "chapters": [
+            {"title": f"챕터 {i + 1}", "start_time": i * step, "end_time": (i + 1) * step}
+            for i in range(chapters)
+        ],
+    }
+
+def load_fixture(video_id):
+    """(영상 정보, VTT 문자열)을 반환합니다."""
+    info_path = os.path.join(BENCH_FIXTURE_DIR, f"{video_id}.info.json")
+    vtt_path = os.path.join(BENCH_FIXTURE_DIR, f"{video_id}.ko.vtt")
+    if os.path.exists(info_path) and os.path.exists(vtt_path):
+        with open(info_path, encoding="utf-8") as f:
+            info = json.load(f)
+        with open(vtt_path, encoding="utf-8") as f:
+            return info, f.read()
+
+    seed = int.from_bytes(hashlib.sha256(video_id.encode()).digest()[:4], "big")
+    return synthetic_info(video_id), generate_auto_caption_vtt(BENCH_VIDEO_HOURS, seed=seed)
+
+def recorded_video_ids():
+    """BENCH_FIXTURE_DIR에 기록된 영상 ID 목록"""
+    if not os.path.isdir(BENCH_FIXTURE_DIR):
+        return []
+    return sorted(name[:-len(".info.json")] for name in os.listdir(BENCH_FIXTURE_DIR) if name.endswith(".info.json"))
+
+def install_web_fakes():
+    """웹 서버 모듈을 import하기 전에 호출해 yt-dlp 추출을 픽스처로 바꿉니다.
+
+    추출 프로세스 풀의 워커에는 이 패치가 적용되지 않으므로 EXTRACT_POOL_WORKERS=0(스레드 실행)으로 실행해야 합니다.
+    """
+    os.environ["EXTRACT_POOL_WORKERS"] = "0"
+    import utils.youtube_utils as youtube_utils
+    from utils.vtt_parser import iter_vtt_cues
+
+    def fake_get_video_info_and_subtitles(video_url):
+        time.sleep(BENCH_YTDLP_LATENCY)
+        video_id = youtube_utils.extract_video_id(video_url)
+        if not video_id:
+            return None, "영상 정보를 찾을 수 없습니다."
+        info, vtt = load_fixture(video_id)
+        return info, list(iter_vtt_cues(vtt))
+
+    def fake_get_video_metadata(video_url):
+        time.sleep(BENCH_YTDLP_LATENCY / 2)
+        video_id = youtube_utils.extract_video_id(video_url)
+        return load_fixture(video_id)[0] if video_id else None
+
+    youtube_utils.get_video_info_and_subtitles = fake_get_video_info_and_subtitles
+    youtube_utils.get_video_metadata = fake_get_video_metadata
@@ -0,0 +1,52 @@
+"""로컬 대체 모델/픽스처를 적용한 상태로 모델 서버 또는 웹 서버를 실행합니다.
+
+두 서버는 같은 이름의 패키지(utils, services, routes)를 쓰므로 각각 별도 프로세스로 실행해야 합니다.
+
+사용 예시:
+    python benchmarks/e2e/launch.py model --port 18001 --workdir /tmp/bench-model
+    MODEL_SERVER_URL=http://127.0.0.1:18001 DATABASE_URL=postgresql+asyncpg://... \\
+        python benchmarks/e2e/launch.py web --port 18000
+"""
+import argparse
+import os
+import sys
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.join(BENCH_DIR, "..", "..")
+APP_DIRS = {
+    "model": os.path.join(ROOT_DIR, "model_server", "app"),
+    "web": os.path.join(ROOT_DIR, "web_server", "app"),
+}
+
+def main():
+    parser = argparse.ArgumentParser(description="벤치마크용 서버 실행")
+    parser.add_argument("server", choices=APP_DIRS.keys())
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, required=True)
+    parser.add_argument("--workdir", help="작업 디렉토리 (ChromaDB, 캐시 파일 위치)")
+    args = parser.parse_args()
+
+    app_dir = os.path.abspath(APP_DIRS[args.server])
+    sys.path.insert(0, app_dir)
+    sys.path.insert(1, BENCH_DIR)
+    if args.workdir:
+        os.makedirs(args.workdir, exist_ok=True)
+        os.chdir(args.workdir)
+    else:
+        os.chdir(app_dir)
+
+    # 앱 모듈을 import하기 전에 대체 구현을 적용
+    if args.server == "model":
+        from fakes import install_model_fakes
+        install_model_fakes()
+        from model_server_main import app
+    else:
+        from fixtures import install_web_fakes
+        install_web_fakes()
+        from web_server_main import app
+
+    import uvicorn
+    uvicorn.run(app, host=args.host, port=args.port, log_level=os.getenv("BENCH_UVICORN_LOG_LEVEL", "warning"))
+
+if __name__ == "__main__":
+    main()
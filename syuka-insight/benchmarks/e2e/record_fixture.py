@@ -0,0 +1,42 @@
+"""실제 유튜브 영상의 정보와 한국어 자막을 벤치마크 픽스처로 기록합니다. (네트워크 필요)
+
+사용 예시:
+    python benchmarks/e2e/record_fixture.py https://www.youtube.com/watch?v=...
+"""
+import argparse
+import json
+import os
+import sys
+
+import yt_dlp
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "web_server", "app"))
+
+from services.youtube_service import slim_video_info  # noqa: E402
+from utils.youtube_utils import find_subtitle_url  # noqa: E402
+from fixtures import BENCH_FIXTURE_DIR  # noqa: E402
+
+def main():
+    parser = argparse.ArgumentParser(description="벤치마크 픽스처 기록")
+    parser.add_argument("urls", nargs="+")
+    args = parser.parse_args()
+
+    os.makedirs(BENCH_FIXTURE_DIR, exist_ok=True)
+    opts = {"quiet": True, "writesubtitles": True, "writeautomaticsub": True, "skip_download": True,
+            "subtitlesformat": "vtt", "subtitleslangs": ["ko"]}
+    with yt_dlp.YoutubeDL(opts) as yt:
+        for url in args.urls:
+            info = yt.extract_info(url, download=False)
+            subtitle_url = find_subtitle_url(info)
+            if not subtitle_url:
+                print(f"{info.get('id')}: 한국어 자막이 없어 건너뜁니다.")
+                continue
+            vtt = yt.urlopen(subtitle_url).read().decode("utf-8")
+            with open(os.path.join(BENCH_FIXTURE_DIR, f"{info['id']}.info.json"), "w", encoding="utf-8") as f:
+                json.dump(slim_video_info(info), f, ensure_ascii=False, indent=2)
+            with open(os.path.join(BENCH_FIXTURE_DIR, f"{info['id']}.ko.vtt"), "w", encoding="utf-8") as f:
+                f.write(vtt)
+            print(f"{info['id']}: 기록 완료 ({len(vtt) // 1024}KB)")
+
+if __name__ == "__main__":
+    main()
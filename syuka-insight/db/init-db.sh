@@ -13,6 +13,9 @@ psql -v ON_ERROR_STOP=1 --username "$POSTGRES_USER" --dbname "$POSTGRES_DB" <<-E
         upload_date DATE,
         duration INTEGER,
         view_count BIGINT,
+        duration_string VARCHAR(32),
+        chapters JSON,
+        refreshed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
         created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
     );
 
@@ -28,6 +31,19 @@ psql -v ON_ERROR_STOP=1 --username "$POSTGRES_USER" --dbname "$POSTGRES_DB" <<-E
             REFERENCES videos(video_id)
             ON DELETE CASCADE
     );
+    CREATE INDEX IF NOT EXISTS ix_subtitles_video_id_start_time ON subtitles (video_id, start_time);
+
+    CREATE TABLE IF NOT EXISTS summaries (
+        id SERIAL PRIMARY KEY,
+        video_id VARCHAR(255) NOT NULL,
+        prompt_hash VARCHAR(64) NOT NULL,
+        model_name VARCHAR(255) NOT NULL,
+        mode VARCHAR(32) NOT NULL DEFAULT 'auto',
+        summary_text TEXT NOT NULL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        CONSTRAINT uq_summaries_key UNIQUE (video_id, prompt_hash, model_name, mode)
+    );
+    CREATE INDEX IF NOT EXISTS ix_summaries_video_id ON summaries (video_id);
 EOSQL
 
 
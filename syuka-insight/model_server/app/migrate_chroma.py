@@ -0,0 +1,105 @@
+"""영상별 ChromaDB 디렉토리를 공용 컬렉션(shared 모드)으로 옮기는 마이그레이션 도구
+
+저장된 임베딩을 그대로 복사하므로 다시 임베딩하지 않습니다.
+
+사용 예시 (model-server 컨테이너 안에서):
+    CHROMA_STORAGE_MODE=shared python migrate_chroma.py
+    CHROMA_STORAGE_MODE=shared python migrate_chroma.py --delete-source
+"""
+from utils.chroma_utils import (
+    DB_PATH,
+    SHARED_COLLECTION_NAME,
+    SHARED_DB_PATH,
+    chroma_db_exists,
+    get_chroma_client,
+    is_shared_storage,
+)
+from utils.lexical_index import LEXICAL_INDEX_DIR, LexicalIndex, save_lexical_index
+import argparse
+import chromadb
+import os
+import shutil
+
+# 한 번에 옮길 문서 수
+MIGRATE_BATCH_SIZE = 256
+
+def list_per_video_dirs():
+    """마이그레이션 대상인 영상별 ChromaDB 디렉토리 (video_id, 경로) 목록을 반환합니다.
+
+    영상 ID는 "_"로 시작할 수 있으므로 공용 DB와 BM25 색인 디렉토리만 이름으로 제외합니다.
+    """
+    if not os.path.isdir(DB_PATH):
+        return []
+    reserved = {os.path.abspath(SHARED_DB_PATH), os.path.abspath(LEXICAL_INDEX_DIR)}
+    result = []
+    for name in sorted(os.listdir(DB_PATH)):
+        path = os.path.join(DB_PATH, name)
+        if os.path.abspath(path) in reserved or not os.path.isdir(path):
+            continue
+        result.append((name, path))
+    return result
+
+def chunk_order(video_id, ids):
+    """청크를 자막 순서로 정렬한 인덱스 목록을 반환합니다.
+
+    Chroma의 get()은 순서를 보장하지 않으므로 "{video_id}-{번호}" 형식의 ID는 번호순으로,
+    그 외 ID는 번호 있는 청크 뒤에 원래 순서대로 둡니다.
+    """
+    prefix = f"{video_id}-"
+
+    def key(i):
+        suffix = ids[i][len(prefix):] if ids[i].startswith(prefix) else ""
+        return (0, int(suffix), i) if suffix.isdigit() else (1, 0, i)
+
+    return sorted(range(len(ids)), key=key)
+
+def migrate_video(video_id, path, target):
+    """영상 하나의 문서와 임베딩을 공용 컬렉션으로 복사하고 옮긴 문서 수를 반환합니다.
+
+    청크 ID가 "{video_id}-{순번}"으로 바뀌므로 BM25 색인도 새 ID로 다시 만듭니다.
+    """
+    source = chromadb.PersistentClient(path=path).get_collection(f"chroma_db_{video_id}")
+    data = source.get(include=["embeddings", "documents", "metadatas"])
+
+    order = chunk_order(video_id, data["ids"])
+    embeddings = [data["embeddings"][k] for k in order]
+    documents = [data["documents"][k] for k in order]
+    metadatas = [{**(data["metadatas"][k] or {}), "video_id": video_id} for k in order]
+    ids = [f"{video_id}-{j}" for j in range(len(order))]
+
+    count = len(ids)
+    for i in range(0, count, MIGRATE_BATCH_SIZE):
+        target.upsert(
+            ids=ids[i:i + MIGRATE_BATCH_SIZE],
+            embeddings=embeddings[i:i + MIGRATE_BATCH_SIZE],
+            documents=documents[i:i + MIGRATE_BATCH_SIZE],
+            metadatas=metadatas[i:i + MIGRATE_BATCH_SIZE],
+        )
+    save_lexical_index(video_id, LexicalIndex(ids, documents))
+    return count
+
+def main():
+    parser = argparse.ArgumentParser(description="영상별 ChromaDB를 공용 컬렉션으로 옮깁니다.")
+    parser.add_argument("--force", action="store_true", help="공용 컬렉션에 이미 있는 영상도 다시 복사")
+    parser.add_argument("--delete-source", action="store_true", help="복사 후 영상별 디렉토리 삭제")
+    args = parser.parse_args()
+
+    if not is_shared_storage():
+        raise SystemExit("CHROMA_STORAGE_MODE=shared 로 설정한 뒤 실행해주세요.")
+
+    target = get_chroma_client().get_or_create_collection(SHARED_COLLECTION_NAME)
+    for video_id, path in list_per_video_dirs():
+        if not args.force and chroma_db_exists(video_id):
+            print(f"[건너뜀] {video_id}: 이미 공용 컬렉션에 있습니다.")
+            continue
+        try:
+            count = migrate_video(video_id, path, target)
+        except Exception as e:
+            print(f"[실패] {video_id}: {e}")
+            continue
+        print(f"[완료] {video_id}: 문서 {count}개")
+        if args.delete_source:
+            shutil.rmtree(path, ignore_errors=True)
+
+if __name__ == "__main__":
+    main()
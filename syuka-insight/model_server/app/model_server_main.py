@@ -1,10 +1,15 @@
 from fastapi import FastAPI
-from routes import health, summarize, chat, chromadb
+from routes import health, summarize, chat, chromadb, cache, metrics
+import logging
 import os
 from dotenv import load_dotenv
 
 # 환경 변수 로드
 load_dotenv()
+
+# 로그 레벨 설정 (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO").upper())
+
 GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY")
 if not GOOGLE_API_KEY:
     raise ValueError(
@@ -19,6 +24,8 @@ app.include_router(health.router)
 app.include_router(summarize.router)
 app.include_router(chat.router)
 app.include_router(chromadb.router)
+app.include_router(cache.router)
+app.include_router(metrics.router)
 
 if __name__ == "__main__":
     import uvicorn
@@ -0,0 +1,19 @@
+from fastapi import APIRouter
+from services.rag_service import get_rag_cache_stats
+from utils.translation_cache import translation_cache
+from utils.embedding_cache import embedding_store
+from utils.answer_cache import answer_cache
+from utils.chat_memory import chat_memory
+
+router = APIRouter()
+
+@router.get("/cache/stats")
+def cache_stats():
+    """캐시 적중/미스 통계를 반환합니다."""
+    return {
+        "rag_chain": get_rag_cache_stats(),
+        "translation": translation_cache.stats(),
+        "answer": answer_cache.stats(),
+        "chat_memory": chat_memory.stats(),
+        "embedding_store_size": embedding_store.count(),
+    }
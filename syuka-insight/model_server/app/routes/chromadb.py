@@ -1,7 +1,8 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException
 from schemas.requests import CreateChromaDBRequest
-from schemas.responses import CreateChromaDBResponse
-from services.db_service import create_chromadb, get_chromadb_list
+from schemas.responses import IngestionJobResponse
+from services.db_service import get_chromadb_list, is_video_indexed
+from services.ingestion_jobs import submit_ingestion_job, get_job
 
 router = APIRouter()
 
@@ -9,6 +10,21 @@ router = APIRouter()
 def get_chromadb_videos():
     return get_chromadb_list()
 
-@router.post("/create_chromadb", response_model=CreateChromaDBResponse)
+@router.get("/chromadb_videos/{video_id}")
+def get_chromadb_video(video_id: str):
+    """영상의 ChromaDB 생성 여부를 반환합니다."""
+    return {"video_id": video_id, "exists": is_video_indexed(video_id)}
+
+@router.post("/create_chromadb", response_model=IngestionJobResponse, status_code=202)
 def create_chromadb_endpoint(req: CreateChromaDBRequest):
-    return create_chromadb(req)
\ No newline at end of file
+    """ChromaDB 생성 작업을 백그라운드에 등록하고 작업 정보를 반환합니다."""
+    job, _ = submit_ingestion_job(req)
+    return IngestionJobResponse(**job.to_dict())
+
+@router.get("/jobs/{job_id}", response_model=IngestionJobResponse)
+def get_job_status(job_id: str):
+    """ChromaDB 생성 작업의 상태와 진행률을 반환합니다."""
+    job = get_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
+    return IngestionJobResponse(**job.to_dict())
@@ -1,15 +1,34 @@
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 from schemas.requests import SummarizeRequest
 from schemas.responses import SummarizeResponse
-from services.summarization import generate_summary
+from services.summarization import generate_summary, generate_summary_stream, get_summarize_config
 
 router = APIRouter()
 
 @router.post("/summarize", response_model=SummarizeResponse)
-def summarize(req: SummarizeRequest):
+async def summarize(req: SummarizeRequest):
     try:
-        summarized_text = generate_summary(req)
+        summarized_text = await generate_summary(req)
         return SummarizeResponse(summary=summarized_text)
     except Exception as e:
         print(f"Error in summarize: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Summarize error: {str(e)}")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=f"Summarize error: {str(e)}")
+
+@router.post("/summarize/stream")
+async def summarize_stream(req: SummarizeRequest):
+    """요약을 SSE로 스트리밍합니다. (/chat/stream과 같은 형식)"""
+    async def convert_to_sse():
+        async for chunk in generate_summary_stream(req):
+            yield f"data: {chunk}\n\n"
+        yield "data: [DONE]\n\n"
+
+    return StreamingResponse(
+        convert_to_sse(),
+        media_type="text/event-stream"
+    )
+
+@router.get("/summarize/config")
+def summarize_config():
+    """요약 캐시 키로 사용할 모델 이름과 프롬프트 해시를 반환합니다."""
+    return get_summarize_config()
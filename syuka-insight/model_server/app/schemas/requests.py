@@ -1,12 +1,20 @@
 from pydantic import BaseModel
+from typing import List, Optional
+
+class SummarizeSegment(BaseModel):
+    title: str
+    text: str
 
 class SummarizeRequest(BaseModel):
     timeline: str
     subtitle: str
+    mode: str = "auto"  # auto | single | map_reduce
+    segments: Optional[List[SummarizeSegment]] = None  # 챕터별 자막 (없으면 길이 기준으로 분할)
 
 class ChatHistoryRequest(BaseModel):
     query: str
     video_id: str
+    session_id: Optional[str] = None  # 대화 기록 키 (없으면 이전 대화 없이 답변)
 
 class CreateChromaDBRequest(BaseModel):
     video_id: str
@@ -8,4 +8,17 @@ class ChatHistoryResponse(BaseModel):
 
 class CreateChromaDBResponse(BaseModel):
     success: bool
-    message: str = ""
\ No newline at end of file
+    message: str = ""
+    embeddings_reused: int = 0
+    embeddings_computed: int = 0
+
+class IngestionJobResponse(BaseModel):
+    job_id: str
+    video_id: str
+    title: str
+    status: str
+    embedded: int = 0
+    total: int = 0
+    message: str = ""
+    embeddings_reused: int = 0
+    embeddings_computed: int = 0
@@ -1,8 +1,10 @@
 from typing import List, Dict
 from schemas.requests import CreateChromaDBRequest
 from schemas.responses import CreateChromaDBResponse
-from utils.chroma_utils import create_db_from_transcript
-from utils.llm_utils import get_embeddings_model
+from utils.chroma_utils import create_db_from_transcript, chroma_db_exists
+from utils.embedding_cache import get_cached_embeddings_model
+from utils.metrics import stage_timer
+from services.rag_service import invalidate_rag_cache
 
 # ChromaDB 비디오 목록
 chromadb_list: List[Dict] = []
@@ -11,17 +13,32 @@ def get_chromadb_list() -> List[Dict]:
     """ChromaDB 비디오 목록을 반환합니다."""
     return chromadb_list
 
-def create_chromadb(req: CreateChromaDBRequest) -> CreateChromaDBResponse:
+def is_video_indexed(video_id: str) -> bool:
+    """영상의 ChromaDB가 이미 생성되었는지 확인합니다."""
+    return chroma_db_exists(video_id)
+
+def create_chromadb(req: CreateChromaDBRequest, progress_callback=None) -> CreateChromaDBResponse:
     """ChromaDB를 생성합니다."""
     try:
-        embeddings_model = get_embeddings_model()
-        success = create_db_from_transcript(
-            req.subtitle, req.video_id, embeddings_model
-        )
+        # 이미 임베딩한 텍스트는 캐시에서 재사용
+        embeddings_model = get_cached_embeddings_model()
+        with stage_timer("ingest_total"):
+            success = create_db_from_transcript(
+                req.subtitle, req.video_id, embeddings_model, progress_callback=progress_callback
+            )
         if success:
+            # 재생성된 영상의 기존 캐시 무효화
+            invalidate_rag_cache(req.video_id)
             chromadb_list.append({"video_id": req.video_id, "title": req.title})
+            print(
+                f"임베딩 재사용 {embeddings_model.reused}개, 새로 계산 {embeddings_model.computed}개 "
+                f"(video_id: {req.video_id})"
+            )
             return CreateChromaDBResponse(
-                success=True, message=f"ChromaDB ({req.video_id}) 생성 성공!\n({req.title})"
+                success=True,
+                message=f"ChromaDB ({req.video_id}) 생성 성공!\n({req.title})",
+                embeddings_reused=embeddings_model.reused,
+                embeddings_computed=embeddings_model.computed,
             )
         else:
             return CreateChromaDBResponse(
@@ -0,0 +1,112 @@
+from typing import Dict, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from schemas.requests import CreateChromaDBRequest
+from services.db_service import create_chromadb
+import os
+import threading
+import time
+import traceback
+import uuid
+
+# 동시에 실행할 수 있는 수집(ingestion) 작업 수
+INGEST_MAX_WORKERS = int(os.getenv("INGEST_MAX_WORKERS", "2"))
+# 완료된 작업 상태를 보관하는 시간 (초)
+INGEST_JOB_RETENTION = float(os.getenv("INGEST_JOB_RETENTION", "3600"))
+
+class IngestionJob:
+    """ChromaDB 생성 작업의 상태"""
+
+    def __init__(self, video_id: str, title: str):
+        self.job_id = uuid.uuid4().hex
+        self.video_id = video_id
+        self.title = title
+        self.status = "queued"  # queued | running | succeeded | failed
+        self.embedded = 0  # 임베딩이 끝난 청크 수
+        self.total = 0  # 전체 청크 수
+        self.message = ""
+        self.embeddings_reused = 0
+        self.embeddings_computed = 0
+        self.created_at = time.time()
+        self.finished_at: Optional[float] = None
+
+    @property
+    def done(self) -> bool:
+        return self.status in ("succeeded", "failed")
+
+    def to_dict(self) -> Dict:
+        return {
+            "job_id": self.job_id,
+            "video_id": self.video_id,
+            "title": self.title,
+            "status": self.status,
+            "embedded": self.embedded,
+            "total": self.total,
+            "message": self.message,
+            "embeddings_reused": self.embeddings_reused,
+            "embeddings_computed": self.embeddings_computed,
+        }
+
+# job_id -> 작업, video_id -> 진행 중인 job_id
+jobs: Dict[str, IngestionJob] = {}
+active_jobs: Dict[str, str] = {}
+_lock = threading.Lock()
+_executor = ThreadPoolExecutor(max_workers=INGEST_MAX_WORKERS, thread_name_prefix="ingest")
+
+def _purge_finished_jobs():
+    """보관 시간이 지난 완료 작업을 삭제합니다. (_lock 안에서 호출)"""
+    now = time.time()
+    expired = [
+        job_id for job_id, job in jobs.items()
+        if job.done and job.finished_at is not None and now - job.finished_at > INGEST_JOB_RETENTION
+    ]
+    for job_id in expired:
+        del jobs[job_id]
+
+def _run_job(job: IngestionJob, req: CreateChromaDBRequest):
+    """작업 스레드에서 ChromaDB를 생성합니다."""
+    job.status = "running"
+
+    def on_progress(embedded, total):
+        job.embedded = embedded
+        job.total = total
+
+    status, message = "failed", "ChromaDB 생성 작업이 중단되었습니다."
+    try:
+        result = create_chromadb(req, progress_callback=on_progress)
+        status = "succeeded" if result.success else "failed"
+        message = result.message
+        job.embeddings_reused = result.embeddings_reused
+        job.embeddings_computed = result.embeddings_computed
+    except Exception as e:
+        traceback.print_exc()
+        message = f"ChromaDB 생성 중 오류 발생: {str(e)}"
+    finally:
+        # 완료 상태와 완료 시각을 함께 기록 (purge가 finished_at 없는 완료 작업을 보지 않도록)
+        with _lock:
+            job.finished_at = time.time()
+            job.message = message
+            job.status = status
+            active_jobs.pop(job.video_id, None)
+
+def submit_ingestion_job(req: CreateChromaDBRequest) -> Tuple[IngestionJob, bool]:
+    """수집 작업을 등록합니다. 같은 video_id의 작업이 진행 중이면 그 작업을 반환합니다.
+
+    (작업, 새로 등록되었는지 여부)를 반환합니다.
+    """
+    with _lock:
+        _purge_finished_jobs()
+        active_job_id = active_jobs.get(req.video_id)
+        if active_job_id is not None:
+            return jobs[active_job_id], False
+
+        job = IngestionJob(req.video_id, req.title)
+        job.message = "ChromaDB 생성 작업이 등록되었습니다."
+        jobs[job.job_id] = job
+        active_jobs[req.video_id] = job.job_id
+
+    _executor.submit(_run_job, job, req)
+    return job, True
+
+def get_job(job_id: str) -> Optional[IngestionJob]:
+    """job_id에 해당하는 작업을 반환합니다."""
+    return jobs.get(job_id)
@@ -1,65 +1,177 @@
-from typing import AsyncGenerator, Dict
-from utils.chroma_utils import load_chroma_db
+from typing import AsyncGenerator, Dict, Optional
+from utils.chroma_utils import load_video_retriever, get_video_documents, get_video_document_ids
+from utils.lexical_index import LexicalIndex, load_lexical_index, save_lexical_index
+from utils.hybrid_retriever import HybridRetriever, HYBRID_CANDIDATES
 from utils.llm_utils import create_llm, get_embeddings_model
-from utils.chains import create_stuff_documents_chain, create_retrieval_chain
-from langchain.memory import ChatMessageHistory
+from utils.embedding_backends import EmbeddingBackendMismatch
+from utils.chains import create_stuff_documents_chain, create_retrieval_chain, resolve_retriever_query
+from utils.cache_utils import LRUCache
+from utils.metrics import stage_timer, StreamTimer, ANSWER_CACHE_LOOKUPS
+from utils.answer_cache import answer_cache, ANSWER_CACHE_ENABLED, ANSWER_CACHE_SEMANTIC
+from utils.chat_memory import chat_memory
 import os
+import asyncio
 import traceback
 import logging
 import json
 
-# 로그 설정
-logging.basicConfig(level=logging.DEBUG) # 로그 레벨 설정 (DEBUG, INFO, WARNING, ERROR, CRITICAL)
-logger = logging.getLogger(__name__) # 현재 모듈에 대한 로거 생성
+logger = logging.getLogger(__name__) # 현재 모듈에 대한 로거 생성 (로그 레벨은 LOG_LEVEL 환경 변수로 설정)
 
-# 전역 변수로 video_id별 메모리 저장
-message_histories: Dict[str, ChatMessageHistory] = {}
+# DEBUG 레벨에서 스트리밍 청크를 N개마다 하나씩만 로그로 남김
+LOG_CHUNK_SAMPLE_EVERY = max(1, int(os.getenv("LOG_CHUNK_SAMPLE_EVERY", "20")))  # 1이면 모든 청크
 
 # QA 모델
 llm_qa = create_llm(model_name="gemini-2.0-flash", temperature=0.7, streaming=True)
 
-def get_message_history(video_id: str):
-    """video_id에 해당하는 메시지 히스토리를 가져옵니다."""
-    if video_id not in message_histories:
-        message_histories[video_id] = ChatMessageHistory()
-    return message_histories[video_id]
+# video_id별 벡터 스토어 및 검색 체인 캐시 (크기 및 유휴 시간 제한)
+RAG_CACHE_MAX_SIZE = int(os.getenv("RAG_CACHE_MAX_SIZE", "32"))
+RAG_CACHE_IDLE_TTL = float(os.getenv("RAG_CACHE_IDLE_TTL", "1800"))
+rag_chain_cache = LRUCache(max_size=RAG_CACHE_MAX_SIZE, ttl=RAG_CACHE_IDLE_TTL)
 
-async def get_rag_response_stream(query: str, video_id: str) -> AsyncGenerator[str, None]:
-    """RAG를 사용하여 응답을 생성하고 스트리밍합니다."""
+# 캐시된 답변을 재생할 때 한 번에 보낼 글자 수
+ANSWER_REPLAY_CHUNK_SIZE = int(os.getenv("ANSWER_REPLAY_CHUNK_SIZE", "40"))
+
+def get_message_history(session_id: str, video_id: str):
+    """(session_id, video_id)에 해당하는 메시지 히스토리를 가져옵니다."""
+    return chat_memory.get(session_id, video_id)
+
+def load_or_build_lexical_index(video_id: str, chroma_vector_store):
+    """BM25 색인을 불러옵니다. 색인 기능 이전에 만든 영상은 저장된 청크로 색인을 만들어 저장합니다.
+
+    저장된 색인의 청크 ID가 ChromaDB와 다르면 (마이그레이션 등으로 ID가 바뀐 경우) 다시 만듭니다.
+    """
+    lexical_index = load_lexical_index(video_id)
     try:
-        logger.info(f"ChromaDB 로딩 중... (video_id: {video_id})")
-        db_path = os.path.join("./chroma_db", video_id)
-        collection_name = f"chroma_db_{video_id}"
-        embeddings_model = get_embeddings_model()
-        
-        chroma_vector_store = load_chroma_db(db_path, collection_name, embeddings_model)
-        if chroma_vector_store is None:
+        if lexical_index is not None:
+            if set(lexical_index.ids) == set(get_video_document_ids(chroma_vector_store, video_id)):
+                return lexical_index
+            logger.info(f"BM25 색인의 청크 ID가 ChromaDB와 달라 다시 생성합니다. (video_id: {video_id})")
+        ids, texts = get_video_documents(chroma_vector_store, video_id)
+        lexical_index = LexicalIndex(ids, texts)
+        save_lexical_index(video_id, lexical_index)
+        logger.info(f"BM25 색인 생성 완료 (video_id: {video_id}, 청크 {len(ids)}개)")
+        return lexical_index
+    except Exception as e:
+        logger.warning(f"BM25 색인 생성 실패, 벡터 검색만 사용합니다. (video_id: {video_id}): {e}")
+        return None
+
+def get_retrieval_chain(video_id: str):
+    """video_id에 해당하는 (검색 체인, 하이브리드 검색기)를 캐시에서 가져오거나 새로 생성합니다."""
+    entry = rag_chain_cache.get(video_id)
+    if entry is not None:
+        return entry["chain"], entry["retriever"]
+
+    logger.info(f"ChromaDB 로딩 중... (video_id: {video_id})")
+    embeddings_model = get_embeddings_model()
+
+    with stage_timer("chain_load"):
+        loaded = load_video_retriever(video_id, embeddings_model, k=HYBRID_CANDIDATES)
+        if loaded is None:
+            return None
+        chroma_vector_store, vector_retriever = loaded
+        lexical_index = load_or_build_lexical_index(video_id, chroma_vector_store)
+    retriever = HybridRetriever(vector_retriever, lexical_index, video_id)
+
+    # 체인 생성
+    stuff_chain = create_stuff_documents_chain(llm_qa)
+    retrieval_chain = create_retrieval_chain(
+        retriever,
+        stuff_chain,
+        get_message_history
+    )
+
+    rag_chain_cache.set(video_id, {
+        "vector_store": chroma_vector_store, "lexical_index": lexical_index, "retriever": retriever, "chain": retrieval_chain,
+    })
+    return retrieval_chain, retriever
+
+def invalidate_rag_cache(video_id: str):
+    """재생성된 영상의 캐시된 벡터 스토어, 체인, 답변을 무효화합니다."""
+    rag_chain_cache.pop(video_id)
+    answer_cache.invalidate(video_id)
+
+def get_rag_cache_stats() -> Dict:
+    """검색 체인 캐시의 적중/미스 통계를 반환합니다."""
+    return rag_chain_cache.stats()
+
+async def lookup_cached_answer(query: str, video_id: str, retriever):
+    """같은 영상의 같은(ANSWER_CACHE_SEMANTIC이면 비슷한) 질문에 대한 캐시된 답변을 찾습니다.
+
+    (답변, 벡터 검색용 질문, 그 임베딩)을 반환합니다. 비슷한 질문은 벡터 검색과 같은 (필요하면 번역한) 질문의
+    임베딩으로 찾으므로, 미스일 때 번역과 임베딩을 검색에 그대로 재사용해 추가 호출이 생기지 않습니다.
+    """
+    cached = answer_cache.get_exact(video_id, query)
+    if cached is not None or not ANSWER_CACHE_SEMANTIC:
+        return cached, None, None
+    retriever_query = await resolve_retriever_query(retriever, query)
+    try:
+        query_vector = await asyncio.to_thread(get_embeddings_model().embed_query, retriever_query)
+    except Exception as e:
+        logger.warning(f"질문 임베딩 실패, 비슷한 질문의 답변을 찾지 않습니다: {e}")
+        return None, retriever_query, None
+    return answer_cache.get_similar(video_id, query_vector), retriever_query, query_vector
+
+async def get_rag_response_stream(query: str, video_id: str, session_id: Optional[str] = None) -> AsyncGenerator[str, None]:
+    """RAG를 사용하여 응답을 생성하고 스트리밍합니다.
+
+    대화 기록은 (session_id, video_id)별로 유지되며, session_id가 없으면 기록 없이 한 번의 질문으로 처리합니다.
+    대화 이력이 없는 질문은 답변 캐시를 먼저 확인하고, 적중하면 캐시된 답변을 바로 스트리밍합니다.
+    """
+    try:
+        # ChromaDB 로딩이 이벤트 루프를 막지 않도록 스레드에서 실행 (캐시된 답변도 DB가 있는 영상에만 사용)
+        try:
+            loaded = await asyncio.to_thread(get_retrieval_chain, video_id)
+        except EmbeddingBackendMismatch as e:
+            logger.warning(str(e))
+            yield json.dumps({"content": str(e)})
+            return
+        if loaded is None:
             yield json.dumps({"content": "ChromaDB 오류: DB 로드 실패"})
             return
+        retrieval_chain, retriever = loaded
 
-        retriever = chroma_vector_store.as_retriever(kwargs={"k": 5})
-        
-        # 체인 생성
-        stuff_chain = create_stuff_documents_chain(llm_qa)
-        retrieval_chain = create_retrieval_chain(
-            retriever, 
-            stuff_chain,
-            get_message_history
-        )
+        history = get_message_history(session_id, video_id)
+        # 이전 대화에 따라 답이 달라질 수 있으므로 대화 이력이 있으면 답변 캐시를 사용하지 않음
+        use_answer_cache = ANSWER_CACHE_ENABLED and not history.messages
+        retriever_query, query_vector = None, None
+        if use_answer_cache:
+            cached, retriever_query, query_vector = await lookup_cached_answer(query, video_id, retriever)
+            ANSWER_CACHE_LOOKUPS.labels(result="miss" if cached is None else "hit").inc()
+            if cached is not None:
+                history.add_user_message(query)
+                history.add_ai_message(cached)
+                timer = StreamTimer("chat_cached")
+                for i in range(0, len(cached), ANSWER_REPLAY_CHUNK_SIZE):
+                    timer.chunk()
+                    yield json.dumps({"content": cached[i:i + ANSWER_REPLAY_CHUNK_SIZE]})
+                timer.finish()
+                return
+        else:
+            ANSWER_CACHE_LOOKUPS.labels(result="bypass").inc()
 
         try:
-            logger.info("스트리밍 응답 시작")
+            logger.debug("스트리밍 응답 시작 (video_id: %s)", video_id)
             
-            # config에 session_id 추가
-            config = {"configurable": {"session_id": video_id}}
+            # 대화 기록 키 (session_id, video_id)
+            config = {"configurable": {"session_id": session_id or "", "video_id": video_id}}
 
+            timer = StreamTimer("chat")
+            answer_parts = []
             async for chunk in retrieval_chain.astream(
-                {"input": query},  # 번역하지 않은 원본 쿼리 사용
+                {"input": query, "retriever_query": retriever_query, "query_vector": query_vector},  # 번역하지 않은 원본 쿼리 사용
                 config=config
             ):
                 if chunk:
-                    logger.info(f"전송할 content: {chunk}")
+                    timer.chunk()
+                    if (timer.chunks - 1) % LOG_CHUNK_SAMPLE_EVERY == 0 and logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("전송할 content #%d: %s", timer.chunks, chunk)
+                    answer_parts.append(chunk)
                     yield json.dumps({"content": chunk})
+            timer.finish()
+
+            # 정상적으로 끝난 답변만 캐시 (임베딩이 없으면 정확히 같은 질문에만 적중)
+            if use_answer_cache and answer_parts:
+                answer_cache.set(video_id, query, query_vector, "".join(answer_parts))
 
         except Exception as e:
             logger.error(f"스트리밍 처리 중 오류 발생: {str(e)}")
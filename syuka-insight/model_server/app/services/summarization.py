@@ -1,20 +1,118 @@
+from typing import AsyncGenerator, List, Tuple
 from schemas.requests import SummarizeRequest
 from utils.llm_utils import create_llm
-from utils.prompt_templates import get_summarize_prompt
+from utils.metrics import stage_timer, StreamTimer
+from utils.prompt_templates import (
+    get_summarize_prompt,
+    get_summarize_prompt_hash,
+    partial_summarize_prompt,
+    reduce_summarize_prompt,
+)
 from langchain_core.output_parsers import StrOutputParser
+from langchain.text_splitter import RecursiveCharacterTextSplitter
+import asyncio
+import json
+import os
 
-def generate_summary(req: SummarizeRequest) -> str:
-    """요약을 생성하는 함수"""
-    try:
-        model = create_llm(model_name="gemini-2.0-flash", temperature=0.7)
-        
+SUMMARY_MODEL_NAME = "gemini-2.0-flash"
+# 요약 캐시 키에 사용할 프롬프트 버전
+SUMMARY_PROMPT_HASH = get_summarize_prompt_hash()
+
+# auto 모드에서 자막이 이 길이(문자 수)를 넘으면 구간별 요약 후 합치는 map-reduce 방식 사용
+SUMMARY_MAP_REDUCE_THRESHOLD = int(os.getenv("SUMMARY_MAP_REDUCE_THRESHOLD", "20000"))
+# 챕터 정보가 없을 때 한 구간의 최대 길이 (한국어 기준 대략 문자 1~2개가 토큰 1개)
+SUMMARY_SEGMENT_CHARS = int(os.getenv("SUMMARY_SEGMENT_CHARS", "8000"))
+# 동시에 요약할 구간 수
+SUMMARY_MAX_CONCURRENCY = int(os.getenv("SUMMARY_MAX_CONCURRENCY", "4"))
+
+segment_splitter = RecursiveCharacterTextSplitter(chunk_size=SUMMARY_SEGMENT_CHARS, chunk_overlap=0)
+
+def get_summarize_config() -> dict:
+    """요약 결과를 식별하는 모델 이름과 프롬프트 해시를 반환합니다."""
+    return {"model_name": SUMMARY_MODEL_NAME, "prompt_hash": SUMMARY_PROMPT_HASH}
+
+def use_map_reduce(req: SummarizeRequest) -> bool:
+    """요청에 map-reduce 요약을 사용할지 결정합니다."""
+    if req.mode == "map_reduce":
+        return True
+    if req.mode == "single":
+        return False
+    return len(req.subtitle) > SUMMARY_MAP_REDUCE_THRESHOLD
+
+def split_into_segments(req: SummarizeRequest) -> List[Tuple[str, str]]:
+    """자막을 (구간 제목, 구간 자막) 목록으로 나눕니다. 챕터 정보가 있으면 챕터 단위로 나눕니다."""
+    if req.segments:
+        return [(seg.title, seg.text) for seg in req.segments if seg.text.strip()]
+    texts = segment_splitter.split_text(req.subtitle)
+    return [(f"구간 {i + 1}", text) for i, text in enumerate(texts)]
+
+async def summarize_segments(segments: List[Tuple[str, str]], model) -> List[str]:
+    """구간별 요약을 동시 실행 수 제한 안에서 병렬로 생성합니다."""
+    chain = partial_summarize_prompt | model | StrOutputParser()
+    semaphore = asyncio.Semaphore(SUMMARY_MAX_CONCURRENCY)
+
+    async def summarize_one(index, title, text):
+        async with semaphore:
+            return await chain.ainvoke({
+                "segment_title": title,
+                "segment_index": index + 1,
+                "segment_count": len(segments),
+                "subtitle": text,
+            })
+
+    return await asyncio.gather(*[
+        summarize_one(i, title, text) for i, (title, text) in enumerate(segments)
+    ])
+
+def format_partial_summaries(segments: List[Tuple[str, str]], partials: List[str]) -> str:
+    """구간별 요약을 reduce 프롬프트에 넣을 형태로 합칩니다."""
+    return "\n\n".join(
+        f"[{title}]\n{partial}" for (title, _), partial in zip(segments, partials)
+    )
+
+async def build_summary_chain(req: SummarizeRequest, model):
+    """요약 체인과 입력을 준비합니다. map-reduce 방식이면 구간별 요약(map)을 먼저 생성합니다."""
+    if not use_map_reduce(req):
         # 요약 프롬프트 템플릿 얻기
         chatprompt = get_summarize_prompt(req.timeline, req.subtitle)
-        
+        return chatprompt | model | StrOutputParser(), {}
+
+    # 긴 영상: 구간별 요약(map) 후 기존 형식으로 합치기(reduce)
+    segments = split_into_segments(req)
+    with stage_timer("summarize_map"):
+        partials = await summarize_segments(segments, model)
+    reduce_chain = reduce_summarize_prompt | model | StrOutputParser()
+    return reduce_chain, {
+        "timeline": req.timeline,
+        "partial_summaries": format_partial_summaries(segments, partials),
+    }
+
+async def generate_summary(req: SummarizeRequest) -> str:
+    """요약을 생성하는 함수"""
+    try:
+        model = create_llm(model_name=SUMMARY_MODEL_NAME, temperature=0.7)
+
         # 체인 생성 및 실행
-        chain = chatprompt | model | StrOutputParser()
-        response = chain.invoke({})
-        return response
+        with stage_timer("summarize_total"):
+            chain, inputs = await build_summary_chain(req, model)
+            return await chain.ainvoke(inputs)
     except Exception as e:
         print(f"Error in generate_summary: {str(e)}")
-        raise e
\ No newline at end of file
+        raise e
+
+async def generate_summary_stream(req: SummarizeRequest) -> AsyncGenerator[str, None]:
+    """요약을 생성하며 최종 요약을 스트리밍합니다. (map-reduce 방식은 reduce 단계를 스트리밍)"""
+    try:
+        model = create_llm(model_name=SUMMARY_MODEL_NAME, temperature=0.7, streaming=True)
+
+        # 첫 청크까지의 시간에는 map 단계가 포함됨
+        timer = StreamTimer("summarize")
+        chain, inputs = await build_summary_chain(req, model)
+        async for chunk in chain.astream(inputs):
+            if chunk:
+                timer.chunk()
+                yield json.dumps({"content": chunk})
+        timer.finish()
+    except Exception as e:
+        print(f"Error in generate_summary_stream: {str(e)}")
+        yield json.dumps({"error": f"요약 처리 중 오류가 발생했습니다: {str(e)}"})
@@ -0,0 +1,31 @@
+"""모델 서버 테스트 공통 설정
+
+앱 모듈은 import 시점에 환경 변수를 읽고 Gemini 모델을 만들기 때문에,
+테스트 모듈보다 먼저 로드되는 이 파일에서 환경 변수와 대체 LLM을 적용합니다.
+
+실행 (model_server/app에서):
+    pip install pytest httpx
+    python -m pytest -q tests
+"""
+import importlib.util
+import os
+import sys
+import tempfile
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, APP_DIR)
+
+# 캐시/ChromaDB 파일은 임시 디렉토리에 만들고 네트워크를 쓰는 백엔드는 사용하지 않음
+_TMP_DIR = tempfile.mkdtemp(prefix="model-server-test-")
+os.environ.setdefault("GOOGLE_API_KEY", "test-key")
+os.environ.setdefault("EMBEDDING_BACKEND", "hashing")
+os.environ.setdefault("TRANSLATION_CACHE_PATH", os.path.join(_TMP_DIR, "translation_cache.sqlite3"))
+os.environ.setdefault("EMBEDDING_CACHE_PATH", os.path.join(_TMP_DIR, "embedding_cache.sqlite3"))
+os.environ.setdefault("LEXICAL_INDEX_DIR", os.path.join(_TMP_DIR, "lexical"))
+
+# 의존성이 없는 환경에서는 대체 LLM을 적용하지 않음 (테스트 모듈이 importorskip으로 건너뜀)
+if importlib.util.find_spec("langchain_core") and importlib.util.find_spec("langchain_google_genai"):
+    from tests.fakes import SlowChatModel
+    import utils.llm_utils as llm_utils
+
+    llm_utils.create_llm = lambda model_name="slow-test-chat", temperature=0.7, streaming=False: SlowChatModel()
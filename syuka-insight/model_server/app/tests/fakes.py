@@ -0,0 +1,63 @@
+"""테스트용 대체 모델"""
+import asyncio
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, AsyncIterator, List, Optional
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+
+class StageTracker:
+    """동시에 실행 중인 단계(LLM 호출, 검색) 수와 그 최댓값을 기록합니다."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.active = 0
+        self.max_active = 0
+
+    def reset(self):
+        with self._lock:
+            self.active = 0
+            self.max_active = 0
+
+    @contextmanager
+    def track(self):
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            yield
+        finally:
+            with self._lock:
+                self.active -= 1
+
+# 대체 모델과 테스트 리트리버가 함께 사용하는 전역 기록
+stage_tracker = StageTracker()
+
+class SlowChatModel(BaseChatModel):
+    """응답마다 delay초가 걸리는 대체 LLM (비동기 호출은 이벤트 루프를 막지 않음)"""
+
+    delay: float = 0.3
+    reply: str = "테스트 답변입니다."
+
+    @property
+    def _llm_type(self) -> str:
+        return "slow-test-chat"
+
+    def _generate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None, run_manager=None, **kwargs: Any) -> ChatResult:
+        with stage_tracker.track():
+            time.sleep(self.delay)
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=self.reply))])
+
+    async def _agenerate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None, run_manager=None, **kwargs: Any) -> ChatResult:
+        with stage_tracker.track():
+            await asyncio.sleep(self.delay)
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=self.reply))])
+
+    async def _astream(self, messages: List[BaseMessage], stop: Optional[List[str]] = None, run_manager=None, **kwargs: Any) -> AsyncIterator[ChatGenerationChunk]:
+        with stage_tracker.track():
+            await asyncio.sleep(self.delay)
+        for token in self.reply.split(" "):
+            yield ChatGenerationChunk(message=AIMessageChunk(content=token + " "))
@@ -0,0 +1,77 @@
+"""/chat/stream 동시 요청이 이벤트 루프에서 겹쳐 실행되는지 확인합니다.
+
+번역(LLM) → 검색(동기 리트리버) → 답변 생성(LLM) 단계가 각각 STAGE_DELAY초씩 걸리도록 만들고,
+N개 요청을 동시에 보냈을 때 여러 요청의 단계가 동시에 실행되었는지(최대 동시 실행 수 > 1) 확인합니다.
+"""
+import pytest
+
+pytest.importorskip("langchain_core")
+pytest.importorskip("langchain_google_genai")
+pytest.importorskip("fastapi")
+httpx = pytest.importorskip("httpx")
+
+import asyncio
+import time
+from typing import List
+
+from fastapi import FastAPI
+from langchain_core.callbacks import CallbackManagerForRetrieverRun
+from langchain_core.documents import Document
+from langchain_core.retrievers import BaseRetriever
+
+from routes import chat
+from services import rag_service
+from utils.chains import create_retrieval_chain, create_stuff_documents_chain
+from utils.hybrid_retriever import HybridRetriever
+from tests.fakes import SlowChatModel, stage_tracker
+
+STAGE_DELAY = 0.1
+CONCURRENCY = 4
+
+class SlowVectorRetriever(BaseRetriever):
+    """동기 API만 있는 느린 벡터 스토어 (ainvoke는 executor에서 실행되어야 함)"""
+
+    def _get_relevant_documents(self, query: str, *, run_manager: CallbackManagerForRetrieverRun) -> List[Document]:
+        with stage_tracker.track():
+            time.sleep(STAGE_DELAY)
+        return [Document(page_content=f"{query}에 대한 자막 내용", metadata={"video_id": "test"})]
+
+def build_test_app(monkeypatch) -> FastAPI:
+    monkeypatch.setattr(rag_service, "ANSWER_CACHE_ENABLED", False)
+    monkeypatch.setattr("utils.chains.TRANSLATE_QUERIES", "always")
+    monkeypatch.setattr("utils.text_utils.llm_translate", SlowChatModel(delay=STAGE_DELAY, reply="translated"))
+
+    retriever = HybridRetriever(SlowVectorRetriever(), None, "test")
+    chain = create_retrieval_chain(
+        retriever,
+        create_stuff_documents_chain(SlowChatModel(delay=STAGE_DELAY)),
+        rag_service.get_message_history,
+    )
+    monkeypatch.setattr(rag_service, "get_retrieval_chain", lambda video_id: (chain, retriever))
+
+    app = FastAPI()
+    app.include_router(chat.router)
+    return app
+
+async def post_chat(client, i: int) -> str:
+    # 질문마다 번역 캐시에 없는 다른 문장을 사용
+    response = await client.post("/chat/stream", json={"query": f"질문 {i} {time.time_ns()}", "video_id": "test"})
+    assert response.status_code == 200
+    assert response.text.rstrip().endswith("data: [DONE]")
+    return response.text
+
+async def concurrent_calls(app: FastAPI, count: int) -> List[str]:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        return await asyncio.gather(*[post_chat(client, i) for i in range(count)])
+
+def test_parallel_chat_streams_overlap(monkeypatch):
+    app = build_test_app(monkeypatch)
+    stage_tracker.reset()
+
+    bodies = asyncio.run(concurrent_calls(app, CONCURRENCY))
+
+    for body in bodies:
+        assert "테스트" in body
+    # 이벤트 루프가 막혀 요청이 하나씩 처리되면 동시에 실행되는 단계는 항상 1개
+    assert stage_tracker.max_active > 1, f"max_active={stage_tracker.max_active}"
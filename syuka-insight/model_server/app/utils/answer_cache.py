@@ -0,0 +1,117 @@
+from utils.cache_utils import LRUCache
+from utils.translation_cache import normalize_query
+from typing import Dict, List, Optional
+import numpy as np
+import os
+import threading
+import time
+
+# 답변 캐시 설정
+ANSWER_CACHE_ENABLED = os.getenv("ANSWER_CACHE_ENABLED", "true").lower() == "true"
+ANSWER_CACHE_MAX_VIDEOS = int(os.getenv("ANSWER_CACHE_MAX_VIDEOS", "128"))  # 캐시할 영상 수
+ANSWER_CACHE_MAX_PER_VIDEO = int(os.getenv("ANSWER_CACHE_MAX_PER_VIDEO", "64"))  # 영상당 최대 답변 수
+ANSWER_CACHE_TTL = float(os.getenv("ANSWER_CACHE_TTL", "3600"))  # 답변 보관 시간 (초)
+# 비슷한 질문(임베딩 유사도)까지 찾을지 여부. 끄면 정규화한 질문이 같을 때만 적중
+ANSWER_CACHE_SEMANTIC = os.getenv("ANSWER_CACHE_SEMANTIC", "true").lower() == "true"
+# 질문 임베딩의 코사인 유사도가 이 값 이상이면 같은 질문으로 간주
+ANSWER_CACHE_SIMILARITY = float(os.getenv("ANSWER_CACHE_SIMILARITY", "0.92"))
+
+class AnswerEntry:
+    def __init__(self, query: str, vector: Optional[np.ndarray], answer: str):
+        self.query = query
+        self.vector = vector
+        self.answer = answer
+        self.created_at = time.monotonic()
+
+class SemanticAnswerCache:
+    """video_id와 질문 임베딩으로 이전 답변을 찾는 캐시
+
+    정규화한 질문이 같으면 바로 적중하고, 아니면 같은 영상의 질문들 중 코사인 유사도가 가장 높은 답변을 사용합니다.
+    임베딩 없이 저장한 답변은 정확히 같은 질문에만 적중합니다.
+    영상 단위로 LRU 제거되고, 영상마다 최근 답변 max_per_video개만 보관합니다.
+    """
+
+    def __init__(self, max_videos: int, max_per_video: int, ttl: float, threshold: float):
+        self.max_per_video = max_per_video
+        self.ttl = ttl
+        self.threshold = threshold
+        self.videos = LRUCache(max_size=max_videos, ttl=ttl)  # video_id -> [AnswerEntry]
+        self._lock = threading.Lock()
+        self.exact_hits = 0
+        self.semantic_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _normalize_vector(vector) -> np.ndarray:
+        array = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(array)
+        return array / norm if norm else array
+
+    def _live_entries(self, video_id: str) -> List[AnswerEntry]:
+        entries = self.videos.get(video_id) or []
+        now = time.monotonic()
+        return [entry for entry in entries if now - entry.created_at <= self.ttl]
+
+    def get_exact(self, video_id: str, query: str) -> Optional[str]:
+        """정규화한 질문이 같은 답변을 반환합니다. (임베딩 없이 확인)"""
+        key = normalize_query(query)
+        with self._lock:
+            for entry in self._live_entries(video_id):
+                if entry.query == key:
+                    self.exact_hits += 1
+                    return entry.answer
+        return None
+
+    def get_similar(self, video_id: str, vector) -> Optional[str]:
+        """질문 임베딩과 가장 비슷한 질문의 답변을 반환합니다. 유사도가 기준 미만이면 None을 반환합니다."""
+        vector = self._normalize_vector(vector)
+        with self._lock:
+            best, best_score = None, self.threshold
+            for entry in self._live_entries(video_id):
+                if entry.vector is None or entry.vector.shape != vector.shape:
+                    continue
+                score = float(np.dot(entry.vector, vector))
+                if score >= best_score:
+                    best, best_score = entry, score
+            if best is None:
+                self.misses += 1
+                return None
+            self.semantic_hits += 1
+            return best.answer
+
+    def set(self, video_id: str, query: str, vector, answer: str):
+        key = normalize_query(query)
+        vector = self._normalize_vector(vector) if vector is not None else None
+        with self._lock:
+            entries = [entry for entry in self._live_entries(video_id) if entry.query != key]
+            entries.append(AnswerEntry(key, vector, answer))
+            self.videos.set(video_id, entries[-self.max_per_video:])
+
+    def invalidate(self, video_id: str):
+        """영상의 답변을 모두 삭제합니다. (ChromaDB 재생성 시)"""
+        with self._lock:
+            self.videos.pop(video_id)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            lookups = self.exact_hits + self.semantic_hits + self.misses
+            return {
+                "enabled": ANSWER_CACHE_ENABLED,
+                "semantic": ANSWER_CACHE_SEMANTIC,
+                "videos": len(self.videos),
+                "max_videos": self.videos.max_size,
+                "max_per_video": self.max_per_video,
+                "threshold": self.threshold,
+                "exact_hits": self.exact_hits,
+                "semantic_hits": self.semantic_hits,
+                "misses": self.misses,
+                "hit_rate": round((self.exact_hits + self.semantic_hits) / lookups, 4) if lookups else 0.0,
+            }
+
+# 프로세스 전역 답변 캐시
+answer_cache = SemanticAnswerCache(
+    max_videos=ANSWER_CACHE_MAX_VIDEOS,
+    max_per_video=ANSWER_CACHE_MAX_PER_VIDEO,
+    ttl=ANSWER_CACHE_TTL,
+    threshold=ANSWER_CACHE_SIMILARITY,
+)
@@ -0,0 +1,84 @@
+from collections import OrderedDict
+import threading
+import time
+
+class LRUCache:
+    """크기 제한과 유휴 시간 만료를 지원하는 스레드 안전 LRU 캐시
+
+    항목은 마지막으로 조회하거나 저장한 뒤 ttl초 동안 사용하지 않으면 만료됩니다.
+    """
+
+    def __init__(self, max_size=128, ttl=None):
+        self.max_size = max_size
+        self.ttl = ttl  # 초 단위, None이면 만료 없음
+        self._data = OrderedDict()  # key -> (value, 마지막 사용 시각)
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _is_expired(self, timestamp, now):
+        return self.ttl is not None and now - timestamp > self.ttl
+
+    def get(self, key, default=None):
+        """키에 해당하는 값을 반환합니다. 없거나 만료되었으면 default를 반환합니다."""
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                self.misses += 1
+                return default
+
+            value, timestamp = item
+            now = time.monotonic()
+            if self._is_expired(timestamp, now):
+                del self._data[key]
+                self.evictions += 1
+                self.misses += 1
+                return default
+
+            self._data[key] = (value, now)
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key, value):
+        """값을 저장하고, 크기 제한을 넘으면 가장 오래 사용되지 않은 항목을 제거합니다."""
+        with self._lock:
+            self._data[key] = (value, time.monotonic())
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def pop(self, key, default=None):
+        """항목을 제거하고 값을 반환합니다."""
+        with self._lock:
+            item = self._data.pop(key, None)
+            return default if item is None else item[0]
+
+    def purge_expired(self):
+        """만료된 항목을 모두 제거하고 제거한 개수를 반환합니다."""
+        with self._lock:
+            now = time.monotonic()
+            expired = [k for k, (_, ts) in self._data.items() if self._is_expired(ts, now)]
+            for key in expired:
+                del self._data[key]
+            self.evictions += len(expired)
+            return len(expired)
+
+    def stats(self):
+        """캐시 통계를 반환합니다."""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "max_size": self.max_size,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / total, 4) if total else 0.0,
+            }
+
+    def __len__(self):
+        return len(self._data)
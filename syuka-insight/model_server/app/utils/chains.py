@@ -1,8 +1,30 @@
 from langchain_core.output_parsers import StrOutputParser
-from langchain_core.runnables import RunnablePassthrough, RunnableWithMessageHistory
+from langchain_core.runnables import ConfigurableFieldSpec, RunnablePassthrough, RunnableWithMessageHistory
 from operator import itemgetter
 from utils.prompt_templates import qa_prompt
-from utils.text_utils import translate_text
+from utils.text_utils import atranslate_text
+from utils.metrics import stage_timer, QUERY_TRANSLATIONS
+import os
+
+# 검색 전 질문 번역: auto (키워드 매칭이 약할 때만) | always | never
+TRANSLATE_QUERIES = os.getenv("TRANSLATE_QUERIES", "auto")
+
+def should_translate(retriever, query):
+    """검색 전 질문 번역 여부 (translated | skipped_lexical | disabled)"""
+    if TRANSLATE_QUERIES == "never":
+        return "disabled"
+    if TRANSLATE_QUERIES == "auto" and retriever.has_strong_lexical_match(query):
+        return "skipped_lexical"
+    return "translated"
+
+async def resolve_retriever_query(retriever, query):
+    """벡터 검색에 사용할 질문을 반환합니다. (필요하면 영어로 번역)"""
+    decision = should_translate(retriever, query)
+    QUERY_TRANSLATIONS.labels(decision=decision).inc()
+    if decision != "translated":
+        return query
+    with stage_timer("translate"):
+        return await atranslate_text(query)
 
 def create_stuff_documents_chain(llm):
     """LCEL을 사용하여 문서를 결합하는 체인을 생성합니다."""
@@ -23,23 +45,38 @@ def create_stuff_documents_chain(llm):
     return chain
 
 def create_retrieval_chain(retriever, combine_docs_chain, memory_store):
-    """LCEL을 사용하여 검색 기반 질의응답 체인을 생성합니다."""
-    def split_query(input_dict):
-        """쿼리를 번역하여 리트리버용과 메모리용으로 분리"""
+    """LCEL을 사용하여 검색 기반 질의응답 체인을 생성합니다.
+    
+    retriever는 HybridRetriever이며, 번역과 검색은 비동기로 실행되므로 astream/ainvoke로 호출해야 합니다.
+    입력에 retriever_query(벡터 검색용 질문)와 query_vector(그 임베딩)가 있으면 번역/임베딩을 다시 하지 않습니다.
+    대화 기록은 config의 configurable.session_id, configurable.video_id로 memory_store(session_id, video_id)에서 가져옵니다.
+    """
+    async def split_query(input_dict):
+        """쿼리를 (필요하면 번역하여) 벡터 검색용과 키워드 검색/메모리용으로 분리"""
         original_query = input_dict["input"]
-        translated_query = translate_text(original_query)
+        retriever_query = input_dict.get("retriever_query")
+        if retriever_query is None:
+            retriever_query = await resolve_retriever_query(retriever, original_query)
         return {
-            "retriever_query": translated_query,
+            "retriever_query": retriever_query,
             "memory_query": original_query,
+            "query_vector": input_dict.get("query_vector"),  # 답변 캐시 조회에 쓴 retriever_query 임베딩 (없으면 None)
             "chat_history": input_dict.get("chat_history", [])
         }
 
+    async def retrieve_documents(x):
+        """원본 쿼리로 키워드 검색, (번역된) 쿼리로 벡터 검색한 결과를 결합"""
+        with stage_timer("retrieve"):
+            return await retriever.aretrieve(
+                x["split_query"]["memory_query"], x["split_query"]["retriever_query"], x["split_query"]["query_vector"]
+            )
+
     base_chain = (
         RunnablePassthrough.assign(
             split_query=split_query
         )
         | {
-            "context": lambda x: retriever.get_relevant_documents(x["split_query"]["retriever_query"]),
+            "context": retrieve_documents,
             "chat_history": lambda x: x["split_query"]["chat_history"],
             "input": lambda x: x["split_query"]["memory_query"]  # 원본 한글 쿼리 사용
         }
@@ -52,6 +89,10 @@ def create_retrieval_chain(retriever, combine_docs_chain, memory_store):
         memory_store,
         input_messages_key="input",
         history_messages_key="chat_history",
+        history_factory_config=[
+            ConfigurableFieldSpec(id="session_id", annotation=str, name="Session ID", default="", is_shared=True),
+            ConfigurableFieldSpec(id="video_id", annotation=str, name="Video ID", default="", is_shared=True),
+        ],
     )
     
     return chain_with_memory
@@ -0,0 +1,86 @@
+from langchain_core.chat_history import InMemoryChatMessageHistory
+from langchain_core.messages import BaseMessage, HumanMessage
+from utils.cache_utils import LRUCache
+from typing import Dict, Sequence
+import os
+import threading
+
+# 대화 하나에 보관할 최근 질문/답변 쌍 수와 토큰 수 (토큰은 글자 수로 근사)
+CHAT_MEMORY_MAX_TURNS = int(os.getenv("CHAT_MEMORY_MAX_TURNS", "6"))
+CHAT_MEMORY_MAX_TOKENS = int(os.getenv("CHAT_MEMORY_MAX_TOKENS", "2000"))
+# 이 시간 동안 사용하지 않은 대화는 삭제 (초)
+CHAT_MEMORY_IDLE_TTL = float(os.getenv("CHAT_MEMORY_IDLE_TTL", "1800"))
+# 프로세스 전체에서 보관할 최대 대화 수 (넘으면 가장 오래 사용하지 않은 대화부터 삭제)
+CHAT_MEMORY_MAX_SESSIONS = int(os.getenv("CHAT_MEMORY_MAX_SESSIONS", "1000"))
+
+# 한국어는 대략 2글자에 1토큰
+CHARS_PER_TOKEN = 2
+
+def estimate_tokens(message: BaseMessage) -> int:
+    return len(str(message.content)) // CHARS_PER_TOKEN + 1
+
+class BoundedChatMessageHistory(InMemoryChatMessageHistory):
+    """최근 max_turns개 질문과 max_tokens 토큰까지만 보관하는 대화 기록
+
+    가장 오래된 메시지부터 삭제하며, 기록은 항상 사용자 질문으로 시작합니다.
+    """
+
+    max_turns: int = CHAT_MEMORY_MAX_TURNS
+    max_tokens: int = CHAT_MEMORY_MAX_TOKENS
+
+    def _trim(self):
+        messages = self.messages
+        turns = sum(isinstance(message, HumanMessage) for message in messages)
+        tokens = sum(estimate_tokens(message) for message in messages)
+        start = 0
+        # 마지막 질문/답변 쌍은 길어도 남김
+        while start < len(messages) - 2 and (turns > self.max_turns or tokens > self.max_tokens):
+            turns -= isinstance(messages[start], HumanMessage)
+            tokens -= estimate_tokens(messages[start])
+            start += 1
+        while start < len(messages) and not isinstance(messages[start], HumanMessage):
+            start += 1
+        if start:
+            self.messages = messages[start:]
+
+    def add_message(self, message: BaseMessage) -> None:
+        super().add_message(message)
+        self._trim()
+
+    def add_messages(self, messages: Sequence[BaseMessage]) -> None:
+        self.messages.extend(messages)
+        self._trim()
+
+class ChatMemoryStore:
+    """(session_id, video_id)별 대화 기록 저장소 (유휴 시간 만료, 전체 대화 수 제한)"""
+
+    def __init__(self, max_sessions: int, idle_ttl: float):
+        self.histories = LRUCache(max_size=max_sessions, ttl=idle_ttl)
+        self._lock = threading.Lock()
+
+    def get(self, session_id: str, video_id: str) -> BoundedChatMessageHistory:
+        """대화 기록을 가져오거나 새로 만듭니다. session_id가 없으면 저장하지 않는 빈 기록을 반환합니다."""
+        if not session_id:
+            return BoundedChatMessageHistory()
+        key = (session_id, video_id)
+        with self._lock:
+            history = self.histories.get(key)
+            if history is None:
+                # 새 대화를 만들 때 만료된 대화를 정리해 유휴 대화가 메모리에 남지 않게 함
+                self.histories.purge_expired()
+                history = BoundedChatMessageHistory()
+                self.histories.set(key, history)
+            return history
+
+    def clear(self, session_id: str, video_id: str):
+        self.histories.pop((session_id, video_id))
+
+    def stats(self) -> Dict:
+        return {
+            **self.histories.stats(),
+            "max_turns": CHAT_MEMORY_MAX_TURNS,
+            "max_tokens": CHAT_MEMORY_MAX_TOKENS,
+        }
+
+# 프로세스 전역 대화 기록 저장소
+chat_memory = ChatMemoryStore(max_sessions=CHAT_MEMORY_MAX_SESSIONS, idle_ttl=CHAT_MEMORY_IDLE_TTL)
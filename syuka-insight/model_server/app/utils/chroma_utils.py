@@ -1,6 +1,17 @@
 from langchain_chroma import Chroma
 from langchain.text_splitter import RecursiveCharacterTextSplitter
+from urllib.parse import urlparse
+from utils.embedding_backends import (
+    EMBEDDING_BACKEND_KEY,
+    EmbeddingBackendMismatch,
+    check_embedding_backend,
+    embedding_backend_id,
+)
+from utils.lexical_index import LexicalIndex, delete_lexical_index, save_lexical_index
+import chromadb
 import os
+import shutil
+import threading
 
 # 텍스트 분할기
 text_splitter = RecursiveCharacterTextSplitter(chunk_size=1000, chunk_overlap=200)
@@ -8,16 +19,100 @@ text_splitter = RecursiveCharacterTextSplitter(chunk_size=1000, chunk_overlap=20
 # ChromaDB 기본 경로
 DB_PATH = "./chroma_db"
 
-def create_chroma_db_from_documents(docs, persist_directory, collection_name, embedding_model):
-    """문서들로부터 ChromaDB를 생성합니다."""
-    chroma_vector_store = Chroma.from_documents(
-        documents=docs,
-        embedding=embedding_model,
-        persist_directory=persist_directory,
-        collection_name=collection_name
+# 한 번에 임베딩/저장할 문서 수 (진행률 보고 단위)
+EMBED_BATCH_SIZE = int(os.getenv("EMBED_BATCH_SIZE", "32"))
+
+# 저장 방식: per_video (영상별 디렉토리/컬렉션) | shared (단일 컬렉션 + video_id 메타데이터 필터)
+CHROMA_STORAGE_MODE = os.getenv("CHROMA_STORAGE_MODE", "per_video")
+SHARED_COLLECTION_NAME = os.getenv("CHROMA_SHARED_COLLECTION", "syuka_videos")
+# shared 모드에서 설정되어 있으면 chromadb 서버(HTTP)에, 없으면 로컬 persistent DB에 저장
+CHROMADB_URL = os.getenv("CHROMADB_URL", "")
+SHARED_DB_PATH = os.path.join(DB_PATH, "_shared")
+
+_chroma_client = None
+_chroma_client_lock = threading.Lock()
+
+def is_shared_storage():
+    return CHROMA_STORAGE_MODE == "shared"
+
+def get_chroma_client():
+    """shared 모드에서 프로세스 전체가 함께 쓰는 ChromaDB 클라이언트를 반환합니다.
+
+    클라이언트를 재사용하므로 HTTP 연결도 keep-alive로 재사용됩니다.
+    """
+    global _chroma_client
+    with _chroma_client_lock:
+        if _chroma_client is None:
+            if CHROMADB_URL:
+                url = urlparse(CHROMADB_URL)
+                _chroma_client = chromadb.HttpClient(
+                    host=url.hostname,
+                    port=url.port or (443 if url.scheme == "https" else 8000),
+                    ssl=url.scheme == "https",
+                )
+            else:
+                _chroma_client = chromadb.PersistentClient(path=SHARED_DB_PATH)
+        return _chroma_client
+
+def get_shared_chroma_db(embedding_model):
+    """모든 영상이 저장되는 공용 컬렉션을 반환합니다."""
+    return Chroma(
+        client=get_chroma_client(),
+        embedding_function=embedding_model,
+        collection_name=SHARED_COLLECTION_NAME
     )
+
+def get_recorded_backend(chroma_vector_store, video_id=None):
+    """컬렉션(shared 모드에서는 video_id의 문서, 없으면 아무 문서)을 만든 임베딩 백엔드를 반환합니다."""
+    metadata = chroma_vector_store._collection.metadata or {}
+    if EMBEDDING_BACKEND_KEY in metadata:
+        return metadata[EMBEDDING_BACKEND_KEY]
+    where = {"video_id": video_id} if video_id else None
+    found = chroma_vector_store.get(where=where, limit=1, include=["metadatas"])
+    metadatas = found.get("metadatas") or []
+    return (metadatas[0] or {}).get(EMBEDDING_BACKEND_KEY) if metadatas else None
+
+def create_chroma_db_from_documents(docs, persist_directory, collection_name, embedding_model, progress_callback=None, ids=None):
+    """문서들로부터 ChromaDB를 생성합니다. progress_callback(완료 수, 전체 수)로 진행률을 알립니다."""
+    if is_shared_storage():
+        chroma_vector_store = get_shared_chroma_db(embedding_model)
+        # 공용 컬렉션의 벡터는 모두 같은 백엔드로 만들어야 하므로 기존 문서와 비교
+        if chroma_vector_store.get(limit=1, include=[])["ids"]:
+            check_embedding_backend(get_recorded_backend(chroma_vector_store), embedding_model, SHARED_COLLECTION_NAME)
+    else:
+        chroma_vector_store = Chroma(
+            embedding_function=embedding_model,
+            persist_directory=persist_directory,
+            collection_name=collection_name,
+            collection_metadata={EMBEDDING_BACKEND_KEY: embedding_backend_id(embedding_model)}
+        )
+
+    total = len(docs)
+    if progress_callback:
+        progress_callback(0, total)
+    for i in range(0, total, EMBED_BATCH_SIZE):
+        batch_ids = ids[i:i + EMBED_BATCH_SIZE] if ids else None
+        chroma_vector_store.add_documents(docs[i:i + EMBED_BATCH_SIZE], ids=batch_ids)
+        if progress_callback:
+            progress_callback(min(i + EMBED_BATCH_SIZE, total), total)
     return chroma_vector_store
 
+def chroma_db_exists(video_id):
+    """video_id에 해당하는 ChromaDB가 이미 있는지 확인합니다."""
+    if is_shared_storage():
+        collection = get_chroma_client().get_or_create_collection(SHARED_COLLECTION_NAME)
+        return bool(collection.get(where={"video_id": video_id}, limit=1, include=[])["ids"])
+    return os.path.exists(os.path.join(DB_PATH, video_id))
+
+def delete_video_documents(video_id):
+    """video_id에 해당하는 문서를 모두 삭제합니다."""
+    if is_shared_storage():
+        collection = get_chroma_client().get_or_create_collection(SHARED_COLLECTION_NAME)
+        collection.delete(where={"video_id": video_id})
+    else:
+        shutil.rmtree(os.path.join(DB_PATH, video_id), ignore_errors=True)
+    delete_lexical_index(video_id)
+
 def load_chroma_db(persist_directory, collection_name, embedding_model):
     """ChromaDB를 로드합니다."""
     if not os.path.exists(persist_directory):
@@ -34,38 +129,92 @@ def load_chroma_db(persist_directory, collection_name, embedding_model):
         print(f"ChromaDB 로딩 에러: {e}")
         return None
 
-def create_db_from_transcript(subtitle, video_id, embedding_model):
+def load_video_retriever(video_id, embedding_model, k=5):
+    """video_id의 문서만 검색하는 (벡터 스토어, 리트리버)를 반환합니다. 없으면 None을 반환합니다.
+
+    ChromaDB를 만든 임베딩 백엔드가 현재 백엔드와 다르면 EmbeddingBackendMismatch를 발생시킵니다.
+    """
+    if is_shared_storage():
+        try:
+            if not chroma_db_exists(video_id):
+                return None
+            chroma_vector_store = get_shared_chroma_db(embedding_model)
+        except Exception as e:
+            print(f"ChromaDB 로딩 에러: {e}")
+            return None
+        search_kwargs = {"k": k, "filter": {"video_id": video_id}}
+    else:
+        db_path = os.path.join(DB_PATH, video_id)
+        collection_name = f"chroma_db_{video_id}"
+        chroma_vector_store = load_chroma_db(db_path, collection_name, embedding_model)
+        if chroma_vector_store is None:
+            return None
+        search_kwargs = {"k": k}
+
+    check_embedding_backend(get_recorded_backend(chroma_vector_store, video_id), embedding_model, video_id)
+    return chroma_vector_store, chroma_vector_store.as_retriever(search_kwargs=search_kwargs)
+
+def get_video_documents(chroma_vector_store, video_id):
+    """저장된 영상 청크의 (ID 목록, 본문 목록)을 반환합니다."""
+    where = {"video_id": video_id} if is_shared_storage() else None
+    data = chroma_vector_store.get(where=where, include=["documents"])
+    return data["ids"], data["documents"]
+
+def get_video_document_ids(chroma_vector_store, video_id):
+    """저장된 영상 청크의 ID 목록을 반환합니다. (본문은 읽지 않음)"""
+    where = {"video_id": video_id} if is_shared_storage() else None
+    return chroma_vector_store.get(where=where, include=[])["ids"]
+
+def create_db_from_transcript(subtitle, video_id, embedding_model, progress_callback=None):
     """영상의 자막을 사용해 ChromaDB를 생성하는 함수."""
     global chroma_vector_store
 
     # DB 경로 및 Collection 이름 동적 생성 (video_id 기반)
-    db_path = os.path.join(DB_PATH, video_id)  # 예시: ./chroma_db/videoId123 
+    db_path = os.path.join(DB_PATH, video_id)  # 예시: ./chroma_db/videoId123
     collection_name = f"chroma_db_{video_id}"  # 예시: chroma_db_videoId123
 
-    # DB 경로 확인: 이미 존재하면 중복 생성 방지
-    if os.path.exists(db_path):
-        print(f"ChromaDB already exists at {db_path}. Skipping creation.")
+    # 이미 존재하면 중복 생성 방지
+    if chroma_db_exists(video_id):
+        print(f"ChromaDB already exists for {video_id}. Skipping creation.")
         raise FileExistsError(f"이미 ChromaDB 존재합니다.")
 
 
     if subtitle:  # 자막이 있으면 Chroma DB 생성
-        docs = split_text_into_documents(subtitle, text_splitter)  # 자막을 문서로 분할
+        docs = split_text_into_documents(subtitle, text_splitter, video_id, embedding_backend_id(embedding_model))  # 자막을 문서로 분할
+        ids = [f"{video_id}-{i}" for i in range(len(docs))]
 
         # Chroma DB 생성
         try:
             chroma_vector_store = create_chroma_db_from_documents(
-                docs, db_path, collection_name, embedding_model  # 동적 경로 및 이름 사용
+                docs, db_path, collection_name, embedding_model,  # 동적 경로 및 이름 사용
+                progress_callback=progress_callback,
+                ids=ids
             )
-            return True  # DB 생성 성공 시 True 반환
+        except EmbeddingBackendMismatch:
+            raise
         except Exception as e:
             print(f"ChromaDB 생성 에러: {e}") # 에러 로그 출력
+            delete_video_documents(video_id) # 불완전한 DB는 삭제해 재시도 가능하게 함
             return False # DB 생성 실패 시 False 반환
+
+        # 같은 청크 ID로 키워드 검색용 BM25 색인 생성 (실패해도 첫 검색 때 다시 만듦)
+        try:
+            save_lexical_index(video_id, LexicalIndex(ids, [doc.page_content for doc in docs]))
+        except Exception as e:
+            print(f"BM25 색인 생성 에러: {e}")
+        return True  # DB 생성 성공 시 True 반환
     else:  # 자막이 없으면 실패 처리
         print("자막이 없어 ChromaDB를 생성할 수 없습니다.") # 로그 출력
         return False # DB 생성 실패 시 False 반환
 
-def split_text_into_documents(text, text_splitter):
-    """텍스트를 문서로 분할합니다."""
+def split_text_into_documents(text, text_splitter, video_id=None, backend_id=None):
+    """텍스트를 문서로 분할합니다. video_id와 임베딩 백엔드가 있으면 메타데이터로 저장합니다."""
     texts = text_splitter.split_text(text)
-    docs = text_splitter.create_documents(texts)
-    return docs
\ No newline at end of file
+    metadata = {}
+    if video_id:
+        metadata["video_id"] = video_id
+    if backend_id:
+        metadata[EMBEDDING_BACKEND_KEY] = backend_id
+    metadatas = [dict(metadata) for _ in texts] if metadata else None
+    docs = text_splitter.create_documents(texts, metadatas=metadatas)
+    return docs
@@ -0,0 +1,162 @@
+from langchain_core.embeddings import Embeddings
+from langchain_google_genai import GoogleGenerativeAIEmbeddings
+from typing import Callable, Dict, List
+import math
+import os
+import re
+import threading
+import zlib
+
+# 사용할 임베딩 백엔드: gemini | sentence_transformers | hashing
+EMBEDDING_BACKEND = os.getenv("EMBEDDING_BACKEND", "gemini")
+GEMINI_EMBEDDING_MODEL = os.getenv("GEMINI_EMBEDDING_MODEL", "models/text-embedding-004")
+# sentence_transformers 백엔드의 모델 경로 (컨테이너 안에 미리 받아 둔 로컬 디렉토리 권장)
+LOCAL_EMBEDDING_MODEL_PATH = os.getenv("LOCAL_EMBEDDING_MODEL_PATH", "./models/multilingual-e5-small")
+LOCAL_EMBEDDING_DEVICE = os.getenv("LOCAL_EMBEDDING_DEVICE", "cpu")
+LOCAL_EMBEDDING_BATCH_SIZE = int(os.getenv("LOCAL_EMBEDDING_BATCH_SIZE", "32"))
+# e5 계열 모델은 질의/문서 앞에 접두어가 필요 (다른 모델은 빈 문자열로 설정)
+LOCAL_EMBEDDING_QUERY_PREFIX = os.getenv("LOCAL_EMBEDDING_QUERY_PREFIX", "query: ")
+LOCAL_EMBEDDING_DOCUMENT_PREFIX = os.getenv("LOCAL_EMBEDDING_DOCUMENT_PREFIX", "passage: ")
+# hashing 백엔드의 벡터 차원
+HASHING_EMBEDDING_DIM = int(os.getenv("HASHING_EMBEDDING_DIM", "1024"))
+
+# 컬렉션/문서 메타데이터에 임베딩 백엔드를 기록하는 키
+EMBEDDING_BACKEND_KEY = "embedding_backend"
+# 백엔드 기록이 없는 기존 컬렉션은 Gemini로 만든 것으로 간주
+LEGACY_EMBEDDING_BACKEND_ID = "gemini:models/text-embedding-004"
+
+class EmbeddingBackendMismatch(Exception):
+    """컬렉션을 만든 임베딩 백엔드와 현재 백엔드가 다를 때 발생합니다."""
+
+class SentenceTransformerEmbeddings(Embeddings):
+    """로컬 sentence-transformers 모델로 CPU에서 배치 임베딩합니다."""
+
+    backend_name = "sentence_transformers"
+
+    def __init__(self, model_path: str, device: str = "cpu", batch_size: int = 32,
+                 query_prefix: str = "", document_prefix: str = ""):
+        try:
+            from sentence_transformers import SentenceTransformer
+        except ImportError as e:
+            raise RuntimeError(
+                "EMBEDDING_BACKEND=sentence_transformers를 사용하려면 sentence-transformers 패키지를 설치해야 합니다."
+            ) from e
+        self._model = SentenceTransformer(model_path, device=device)
+        self._lock = threading.Lock()  # 수집 작업과 질의가 같은 모델을 동시에 쓰지 않도록
+        self.model = os.path.basename(os.path.normpath(model_path))
+        self.batch_size = batch_size
+        self.query_prefix = query_prefix
+        self.document_prefix = document_prefix
+
+    def _encode(self, texts: List[str]) -> List[List[float]]:
+        with self._lock:
+            vectors = self._model.encode(
+                texts, batch_size=self.batch_size, normalize_embeddings=True, convert_to_numpy=True
+            )
+        return vectors.tolist()
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return self._encode([self.document_prefix + text for text in texts])
+
+    def embed_query(self, text: str) -> List[float]:
+        return self._encode([self.query_prefix + text])[0]
+
+# 영문/숫자 단어와 한글 단어
+_WORD_PATTERN = re.compile(r"[0-9a-zA-Z]+|[가-힣]+")
+
+class HashingEmbeddings(Embeddings):
+    """단어와 한글 음절 bigram을 해시해 고정 차원 벡터로 만드는 임베딩 (모델 파일, 네트워크 불필요)
+
+    조사가 붙은 한국어 단어("금리가", "금리는")도 bigram이 겹쳐 비슷한 벡터가 됩니다.
+    """
+
+    backend_name = "hashing"
+
+    def __init__(self, dim: int = HASHING_EMBEDDING_DIM):
+        self.dim = dim
+        self.model = f"hashing-{dim}"
+
+    def _features(self, text: str):
+        for word in _WORD_PATTERN.findall(text.lower()):
+            yield word
+            if len(word) > 2 and "가" <= word[0] <= "힣":
+                for i in range(len(word) - 1):
+                    yield "#" + word[i:i + 2]
+
+    def _embed(self, text: str) -> List[float]:
+        counts: Dict[int, float] = {}
+        for feature in self._features(text):
+            h = zlib.crc32(feature.encode("utf-8"))
+            sign = 1.0 if h & 0x80000000 else -1.0
+            index = h % self.dim
+            counts[index] = counts.get(index, 0.0) + sign
+        vector = [0.0] * self.dim
+        for index, value in counts.items():
+            # 자주 나오는 단어가 벡터를 독차지하지 않도록 log 스케일 적용
+            vector[index] = math.copysign(1.0 + math.log(abs(value)), value) if value else 0.0
+        norm = math.sqrt(sum(v * v for v in vector)) or 1.0
+        return [v / norm for v in vector]
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return [self._embed(text) for text in texts]
+
+    def embed_query(self, text: str) -> List[float]:
+        return self._embed(text)
+
+def _create_gemini():
+    return GoogleGenerativeAIEmbeddings(model=GEMINI_EMBEDDING_MODEL)
+
+def _create_sentence_transformers():
+    return SentenceTransformerEmbeddings(
+        LOCAL_EMBEDDING_MODEL_PATH,
+        device=LOCAL_EMBEDDING_DEVICE,
+        batch_size=LOCAL_EMBEDDING_BATCH_SIZE,
+        query_prefix=LOCAL_EMBEDDING_QUERY_PREFIX,
+        document_prefix=LOCAL_EMBEDDING_DOCUMENT_PREFIX,
+    )
+
+def _create_hashing():
+    return HashingEmbeddings(HASHING_EMBEDDING_DIM)
+
+# 백엔드 이름 -> 임베딩 모델 생성 함수
+EMBEDDING_BACKENDS: Dict[str, Callable[[], Embeddings]] = {
+    "gemini": _create_gemini,
+    "sentence_transformers": _create_sentence_transformers,
+    "hashing": _create_hashing,
+}
+
+_embedding_models: Dict[str, Embeddings] = {}
+_embedding_models_lock = threading.Lock()
+
+def register_embedding_backend(name: str, factory: Callable[[], Embeddings]):
+    """임베딩 백엔드를 등록합니다."""
+    EMBEDDING_BACKENDS[name] = factory
+
+def create_embeddings_model(name: str = None) -> Embeddings:
+    """설정된 백엔드의 임베딩 모델을 반환합니다. 모델 로딩 비용이 크므로 백엔드마다 한 번만 생성합니다."""
+    name = name or EMBEDDING_BACKEND
+    if name not in EMBEDDING_BACKENDS:
+        raise ValueError(f"알 수 없는 임베딩 백엔드: {name} (사용 가능: {', '.join(EMBEDDING_BACKENDS)})")
+    with _embedding_models_lock:
+        if name not in _embedding_models:
+            _embedding_models[name] = EMBEDDING_BACKENDS[name]()
+        return _embedding_models[name]
+
+def embedding_backend_id(embeddings_model: Embeddings) -> str:
+    """임베딩 모델이 만든 벡터를 구분하는 식별자 (백엔드:모델)를 반환합니다."""
+    # 캐시 래퍼(CachedEmbeddings)는 실제 모델 기준으로 판단
+    model = getattr(embeddings_model, "base_model", embeddings_model)
+    if isinstance(model, GoogleGenerativeAIEmbeddings):
+        backend = "gemini"
+    else:
+        backend = getattr(model, "backend_name", model.__class__.__name__)
+    return f"{backend}:{getattr(model, 'model', '')}"
+
+def check_embedding_backend(recorded: str, embeddings_model: Embeddings, video_id: str = ""):
+    """기록된 백엔드와 현재 임베딩 모델이 다르면 EmbeddingBackendMismatch를 발생시킵니다."""
+    current = embedding_backend_id(embeddings_model)
+    if (recorded or LEGACY_EMBEDDING_BACKEND_ID) != current:
+        raise EmbeddingBackendMismatch(
+            f"ChromaDB({video_id})는 {recorded or LEGACY_EMBEDDING_BACKEND_ID} 임베딩으로 생성되어 "
+            f"현재 임베딩({current})으로 검색할 수 없습니다. 같은 백엔드로 다시 생성해주세요."
+        )
@@ -0,0 +1,112 @@
+from langchain_core.embeddings import Embeddings
+from utils.llm_utils import get_embeddings_model
+from utils.metrics import stage_timer
+import hashlib
+import numpy as np
+import os
+import sqlite3
+import threading
+
+# 임베딩 캐시 경로
+EMBEDDING_CACHE_PATH = os.getenv("EMBEDDING_CACHE_PATH", "./cache/embedding_cache.sqlite3")
+
+# SQLite IN 절 파라미터 제한을 넘지 않도록 나누어 조회
+LOOKUP_BATCH_SIZE = 500
+
+class EmbeddingStore:
+    """텍스트 해시를 키로 float32 벡터를 저장하는 디스크 저장소"""
+
+    def __init__(self, path):
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings ("
+                "key TEXT PRIMARY KEY, dim INTEGER NOT NULL, vector BLOB NOT NULL)"
+            )
+            self._conn.commit()
+
+    def get_many(self, keys):
+        """키 목록에 해당하는 벡터를 {key: vector} 형태로 반환합니다."""
+        keys = list(keys)
+        found = {}
+        with self._lock:
+            for i in range(0, len(keys), LOOKUP_BATCH_SIZE):
+                batch = keys[i:i + LOOKUP_BATCH_SIZE]
+                placeholders = ",".join("?" * len(batch))
+                rows = self._conn.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})", batch
+                ).fetchall()
+                for key, blob in rows:
+                    found[key] = np.frombuffer(blob, dtype=np.float32).tolist()
+        return found
+
+    def put_many(self, items):
+        """(key, vector) 목록을 저장합니다."""
+        rows = []
+        for key, vector in items:
+            array = np.asarray(vector, dtype=np.float32)
+            rows.append((key, int(array.shape[0]), array.tobytes()))
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, dim, vector) VALUES (?, ?, ?)", rows
+            )
+            self._conn.commit()
+
+    def count(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+
+class CachedEmbeddings(Embeddings):
+    """이미 임베딩한 텍스트는 저장소에서 재사용하는 임베딩 모델 래퍼
+
+    인스턴스마다 재사용/계산 개수를 집계하므로 수집(ingestion) 작업마다 새로 생성해서 사용합니다.
+    """
+
+    def __init__(self, base_model, store, namespace=None):
+        self.base_model = base_model
+        self.store = store
+        # 모델이 다르면 같은 텍스트라도 벡터가 다르므로 모델 이름을 키에 포함
+        self.namespace = namespace or getattr(base_model, "model", base_model.__class__.__name__)
+        self.reused = 0
+        self.computed = 0
+
+    def _key(self, text):
+        return hashlib.sha256(f"{self.namespace}\0{text}".encode("utf-8")).hexdigest()
+
+    def embed_documents(self, texts):
+        keys = [self._key(text) for text in texts]
+        vectors = self.store.get_many(set(keys))
+
+        # 저장소에 없는 텍스트만 (배치 내 중복 제거 후) 임베딩
+        missing = {}
+        for key, text in zip(keys, texts):
+            if key not in vectors and key not in missing:
+                missing[key] = text
+
+        if missing:
+            with stage_timer("embed_batch"):
+                new_vectors = self.base_model.embed_documents(list(missing.values()))
+            new_items = list(zip(missing.keys(), new_vectors))
+            self.store.put_many(new_items)
+            vectors.update(new_items)
+
+        self.computed += len(missing)
+        self.reused += len(texts) - len(missing)
+        return [list(vectors[key]) for key in keys]
+
+    def embed_query(self, text):
+        # 질의 임베딩은 문서 임베딩과 task type이 달라 캐시하지 않음
+        return self.base_model.embed_query(text)
+
+    def stats(self):
+        return {"reused": self.reused, "computed": self.computed}
+
+# 프로세스 전역 임베딩 저장소
+embedding_store = EmbeddingStore(EMBEDDING_CACHE_PATH)
+
+def get_cached_embeddings_model():
+    """임베딩 캐시가 적용된 임베딩 모델을 반환합니다."""
+    return CachedEmbeddings(get_embeddings_model(), embedding_store)
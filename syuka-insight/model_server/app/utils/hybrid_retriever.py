@@ -0,0 +1,94 @@
+from langchain_core.documents import Document
+from typing import Dict, List, Optional
+from utils.lexical_index import LexicalIndex, tokenize
+from utils.metrics import stage_timer
+import os
+
+# 최종으로 돌려줄 문서 수, 각 검색기에서 가져올 후보 수
+HYBRID_TOP_K = int(os.getenv("HYBRID_TOP_K", "5"))
+HYBRID_CANDIDATES = int(os.getenv("HYBRID_CANDIDATES", "20"))
+# Reciprocal Rank Fusion 상수 (클수록 하위 순위의 영향이 커짐)
+RRF_K = int(os.getenv("RRF_K", "60"))
+# 질문 토큰의 이 비율 이상이 BM25 1위 문서에 있으면 키워드 검색만으로 충분하다고 판단
+LEXICAL_STRONG_MATCH = float(os.getenv("LEXICAL_STRONG_MATCH", "0.6"))
+# 질문 토큰이 이보다 적으면 키워드 신호를 신뢰하지 않음 (한두 글자 질문 등)
+LEXICAL_MIN_QUERY_TOKENS = int(os.getenv("LEXICAL_MIN_QUERY_TOKENS", "2"))
+
+def reciprocal_rank_fusion(rankings: List[List[str]], k: int = RRF_K) -> List[str]:
+    """여러 검색 결과 순위(ID 목록)를 RRF 점수로 합쳐 정렬된 ID 목록을 반환합니다."""
+    scores: Dict[str, float] = {}
+    for ranking in rankings:
+        for rank, doc_id in enumerate(ranking):
+            scores[doc_id] = scores.get(doc_id, 0.0) + 1.0 / (k + rank + 1)
+    return sorted(scores, key=scores.get, reverse=True)
+
+class HybridRetriever:
+    """BM25(원문 질문)와 벡터 검색 결과를 청크 ID 기준으로 RRF 결합하는 검색기
+
+    BM25 색인이 없으면 벡터 검색 결과만 사용합니다.
+    """
+
+    def __init__(self, vector_retriever, lexical_index: Optional[LexicalIndex], video_id: str,
+                 top_k: int = HYBRID_TOP_K, candidates: int = HYBRID_CANDIDATES):
+        self.vector_retriever = vector_retriever  # 후보 수(candidates)만큼 반환하도록 생성된 리트리버
+        self.lexical_index = lexical_index
+        self.video_id = video_id
+        self.top_k = top_k
+        self.candidates = candidates
+        # 벡터 검색 결과에 ID가 없을 때 본문으로 청크 ID를 찾기 위한 색인
+        self._id_by_text = {text: doc_id for doc_id, text in zip(lexical_index.ids, lexical_index.texts)} if lexical_index else {}
+
+    def lexical_search(self, query: str):
+        if self.lexical_index is None:
+            return []
+        return self.lexical_index.search(query, k=self.candidates)
+
+    def has_strong_lexical_match(self, query: str) -> bool:
+        """질문의 핵심 단어가 자막에 그대로 나와 번역 없이 검색해도 되는지 판단합니다."""
+        if self.lexical_index is None:
+            return False
+        if len(set(tokenize(query, query=True))) < LEXICAL_MIN_QUERY_TOKENS:
+            return False
+        top = self.lexical_index.search(query, k=1)
+        return self.lexical_index.match_ratio(query, top) >= LEXICAL_STRONG_MATCH
+
+    async def vector_search(self, query: str, query_vector: Optional[List[float]] = None) -> List[Document]:
+        """벡터 검색 결과를 반환합니다. query_vector(query의 임베딩)가 있으면 다시 임베딩하지 않습니다."""
+        vector_store = getattr(self.vector_retriever, "vectorstore", None)
+        if query_vector is None or vector_store is None:
+            return await self.vector_retriever.ainvoke(query)
+        return await vector_store.asimilarity_search_by_vector(query_vector, **self.vector_retriever.search_kwargs)
+
+    async def aretrieve(self, query: str, vector_query: Optional[str] = None,
+                        query_vector: Optional[List[float]] = None) -> List[Document]:
+        """query로 BM25 검색, vector_query(없으면 query)로 벡터 검색한 뒤 결합한 상위 문서를 반환합니다.
+
+        query_vector는 vector_query의 임베딩으로, 있으면 벡터 검색에 그대로 사용합니다.
+        """
+        with stage_timer("retrieve_vector"):
+            vector_docs = await self.vector_search(vector_query or query, query_vector)
+        if self.lexical_index is None:
+            return vector_docs[:self.top_k]
+
+        with stage_timer("retrieve_lexical"):
+            lexical_hits = self.lexical_search(query)
+
+        docs_by_id: Dict[str, Document] = {}
+        vector_ranking = []
+        for doc in vector_docs:
+            doc_id = getattr(doc, "id", None) or self._id_by_text.get(doc.page_content) or doc.page_content
+            if doc_id not in docs_by_id:
+                docs_by_id[doc_id] = doc
+                vector_ranking.append(doc_id)
+
+        lexical_ranking = []
+        for i, _ in lexical_hits:
+            doc_id = self.lexical_index.ids[i]
+            lexical_ranking.append(doc_id)
+            if doc_id not in docs_by_id:
+                docs_by_id[doc_id] = Document(
+                    page_content=self.lexical_index.texts[i], metadata={"video_id": self.video_id}
+                )
+
+        fused = reciprocal_rank_fusion([vector_ranking, lexical_ranking])
+        return [docs_by_id[doc_id] for doc_id in fused[:self.top_k]]
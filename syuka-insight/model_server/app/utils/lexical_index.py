@@ -0,0 +1,125 @@
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+import json
+import math
+import os
+import re
+
+# 영상별 BM25 색인 저장 경로 (ChromaDB 경로 아래, 마이그레이션 도구가 이 경로를 제외함)
+LEXICAL_INDEX_DIR = os.getenv("LEXICAL_INDEX_DIR", "./chroma_db/_lexical")
+LEXICAL_INDEX_VERSION = 1
+
+# BM25 파라미터
+BM25_K1 = float(os.getenv("BM25_K1", "1.5"))
+BM25_B = float(os.getenv("BM25_B", "0.75"))
+
+# 영문/숫자 단어와 한글 단어
+_WORD_PATTERN = re.compile(r"[0-9a-z]+|[가-힣]+")
+
+# 질문에서 검색 의미가 없는 단어 (의문사, 요청 표현 등)
+QUERY_STOPWORDS = {
+    "어떻게", "되나요", "되나", "무엇", "무엇인가요", "무엇을", "뭔가요", "뭐야", "뭐", "왜", "언제", "어디", "누구",
+    "알려줘", "알려주세요", "설명해줘", "설명해주세요", "요약해줘", "요약해주세요", "대해", "대해서", "있나요",
+    "인가요", "했나요", "하나요", "이", "그", "저", "영상", "영상에서", "what", "how", "why", "is", "the", "a",
+}
+
+def tokenize(text: str, query: bool = False) -> List[str]:
+    """검색용 토큰으로 분리합니다. 한글은 음절 bigram으로 나눠 조사/어미가 붙어도 매칭되게 합니다.
+
+    예: "금리가 오르면" -> ["금리", "리가", "오르", "르면"]
+    """
+    tokens = []
+    for word in _WORD_PATTERN.findall(text.lower()):
+        if query and word in QUERY_STOPWORDS:
+            continue
+        if "가" <= word[0] <= "힣" and len(word) > 1:
+            tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+        else:
+            tokens.append(word)
+    return tokens
+
+class LexicalIndex:
+    """영상 하나의 자막 청크에 대한 BM25 색인"""
+
+    def __init__(self, ids: List[str], texts: List[str], doc_terms: Optional[List[Dict[str, int]]] = None):
+        self.ids = ids
+        self.texts = texts
+        self.doc_terms = doc_terms if doc_terms is not None else [dict(Counter(tokenize(text))) for text in texts]
+        self.doc_lens = [sum(terms.values()) for terms in self.doc_terms]
+        self.avgdl = (sum(self.doc_lens) / len(self.doc_lens)) if self.doc_lens else 0.0
+
+        # 단어 -> [(문서 번호, 출현 횟수)]
+        self.postings: Dict[str, List[Tuple[int, int]]] = {}
+        for i, terms in enumerate(self.doc_terms):
+            for term, tf in terms.items():
+                self.postings.setdefault(term, []).append((i, tf))
+
+    def __len__(self):
+        return len(self.ids)
+
+    def idf(self, term: str) -> float:
+        df = len(self.postings.get(term, ()))
+        return math.log(1 + (len(self.ids) - df + 0.5) / (df + 0.5))
+
+    def search(self, query: str, k: int = 10) -> List[Tuple[int, float]]:
+        """BM25 점수 상위 k개 문서의 (문서 번호, 점수)를 반환합니다."""
+        scores: Dict[int, float] = {}
+        for term in set(tokenize(query, query=True)):
+            postings = self.postings.get(term)
+            if not postings:
+                continue
+            idf = self.idf(term)
+            for i, tf in postings:
+                norm = BM25_K1 * (1 - BM25_B + BM25_B * self.doc_lens[i] / (self.avgdl or 1.0))
+                scores[i] = scores.get(i, 0.0) + idf * tf * (BM25_K1 + 1) / (tf + norm)
+        return sorted(scores.items(), key=lambda item: item[1], reverse=True)[:k]
+
+    def match_ratio(self, query: str, top: Optional[List[Tuple[int, float]]] = None) -> float:
+        """질문 토큰 중 BM25 1위 문서에 들어 있는 비율 (idf 가중, 0~1)"""
+        terms = set(tokenize(query, query=True))
+        top = top if top is not None else self.search(query, k=1)
+        if not terms or not top:
+            return 0.0
+        doc = self.doc_terms[top[0][0]]
+        total = sum(self.idf(term) for term in terms)
+        matched = sum(self.idf(term) for term in terms if term in doc)
+        return matched / total if total else 0.0
+
+    def to_dict(self) -> Dict:
+        return {"version": LEXICAL_INDEX_VERSION, "ids": self.ids, "texts": self.texts, "doc_terms": self.doc_terms}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "LexicalIndex":
+        return cls(data["ids"], data["texts"], data["doc_terms"])
+
+def _index_path(video_id: str) -> str:
+    return os.path.join(LEXICAL_INDEX_DIR, f"{video_id}.json")
+
+def save_lexical_index(video_id: str, index: LexicalIndex):
+    """색인을 파일로 저장합니다. (임시 파일에 쓴 뒤 교체)"""
+    os.makedirs(LEXICAL_INDEX_DIR, exist_ok=True)
+    path = _index_path(video_id)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(index.to_dict(), f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+def load_lexical_index(video_id: str) -> Optional[LexicalIndex]:
+    """저장된 색인을 불러옵니다. 없거나 형식이 다르면 None을 반환합니다."""
+    try:
+        with open(_index_path(video_id), encoding="utf-8") as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        print(f"BM25 색인 로딩 에러 ({video_id}): {e}")
+        return None
+    if data.get("version") != LEXICAL_INDEX_VERSION:
+        return None
+    return LexicalIndex.from_dict(data)
+
+def delete_lexical_index(video_id: str):
+    try:
+        os.remove(_index_path(video_id))
+    except FileNotFoundError:
+        pass
@@ -1,4 +1,5 @@
-from langchain_google_genai import ChatGoogleGenerativeAI, GoogleGenerativeAIEmbeddings
+from langchain_google_genai import ChatGoogleGenerativeAI
+from utils.embedding_backends import create_embeddings_model
 from dotenv import load_dotenv
 import os
 
@@ -15,5 +16,5 @@ def create_llm(model_name="gemini-2.0-flash", temperature=0.7, streaming=False):
     )
 
 def get_embeddings_model():
-    """임베딩 모델을 반환합니다."""
-    return GoogleGenerativeAIEmbeddings(model="models/text-embedding-004")
\ No newline at end of file
+    """EMBEDDING_BACKEND로 설정한 임베딩 모델을 반환합니다."""
+    return create_embeddings_model()
\ No newline at end of file
@@ -0,0 +1,65 @@
+from contextlib import contextmanager
+from fastapi import Response
+from prometheus_client import CONTENT_TYPE_LATEST, Counter, Histogram, generate_latest
+import time
+
+# 단계별 지연 시간 버킷 (초)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+
+# stage: translate | retrieve | retrieve_vector | retrieve_lexical | chat_first_chunk | chat_total
+#        | chat_cached_first_chunk | chat_cached_total | summarize_first_chunk | summarize_total
+#        | summarize_map | ingest_total | embed_batch | chain_load
+STAGE_SECONDS = Histogram(
+    "model_stage_seconds", "모델 서버 단계별 소요 시간 (초)", ["stage"], buckets=LATENCY_BUCKETS
+)
+
+# 스트리밍 응답의 초당 청크 수 (Gemini 스트림 청크 단위, 토큰 처리량의 근사치)
+STREAM_CHUNKS_PER_SECOND = Histogram(
+    "model_stream_chunks_per_second", "스트리밍 응답의 초당 청크 수", ["stream"],
+    buckets=(1, 2, 5, 10, 20, 50, 100, 200, 500),
+)
+
+# 검색 질문 번역 여부: translated | skipped_lexical | disabled
+QUERY_TRANSLATIONS = Counter(
+    "model_query_translations_total", "검색 질문 번역 여부별 요청 수", ["decision"]
+)
+
+# 답변 캐시 조회 결과: hit | miss | bypass (대화 이력이 있어 캐시를 사용하지 않음)
+ANSWER_CACHE_LOOKUPS = Counter(
+    "model_answer_cache_lookups_total", "답변 캐시 조회 결과별 요청 수", ["result"]
+)
+
+def observe_stage(stage: str, seconds: float):
+    STAGE_SECONDS.labels(stage=stage).observe(seconds)
+
+@contextmanager
+def stage_timer(stage: str):
+    """with 블록의 소요 시간을 stage 단계로 기록합니다."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe_stage(stage, time.perf_counter() - start)
+
+class StreamTimer:
+    """스트리밍 응답의 첫 청크까지의 시간, 전체 시간, 초당 청크 수를 기록합니다."""
+
+    def __init__(self, stream: str):
+        self.stream = stream
+        self.start = time.perf_counter()
+        self.chunks = 0
+
+    def chunk(self):
+        if self.chunks == 0:
+            observe_stage(f"{self.stream}_first_chunk", time.perf_counter() - self.start)
+        self.chunks += 1
+
+    def finish(self):
+        elapsed = time.perf_counter() - self.start
+        observe_stage(f"{self.stream}_total", elapsed)
+        if self.chunks and elapsed > 0:
+            STREAM_CHUNKS_PER_SECOND.labels(stream=self.stream).observe(self.chunks / elapsed)
+
+def metrics_response() -> Response:
+    """Prometheus 텍스트 형식의 지표 응답을 만듭니다."""
+    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
@@ -1,4 +1,5 @@
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
+import hashlib
 
 qa_prompt = ChatPromptTemplate.from_messages([
     # 시스템 역할 정의
@@ -25,11 +26,8 @@ qa_prompt = ChatPromptTemplate.from_messages([
     """)
 ])
 
-def get_summarize_prompt(timeline, subtitle):
-    """요약 프롬프트 템플릿을 생성합니다."""
-    system_prompt = f"""당신은 YouTube 영상의 자막과 타임라인을 분석하여 구조화된 요약을 제공하는 전문가입니다.
-    
-    다음 규칙을 따라 요약을 작성해주세요:
+# 최종 요약(markdown) 형식 규칙
+SUMMARY_FORMAT_RULES = """다음 규칙을 따라 요약을 작성해주세요:
     1. 전체 영상의 주제를 대표하는 제목을 ### 형식으로 작성하세요.
     2. 전체 내용에 대한 간단한 소개를 작성하세요.
     3. 타임라인의 각 구간별로 다음 형식으로 요약하세요:
@@ -40,7 +38,13 @@ def get_summarize_prompt(timeline, subtitle):
     - 소제목 마다 중간 요약으로 한줄 정리
     4. 마지막에 전체 내용의 핵심 포인트를 3줄로 정리해주세요:
     #### ✅ 핵심 요약:
-    번호 붙여서 3줄 정리
+    번호 붙여서 3줄 정리"""
+
+def get_summarize_prompt(timeline, subtitle):
+    """요약 프롬프트 템플릿을 생성합니다."""
+    system_prompt = f"""당신은 YouTube 영상의 자막과 타임라인을 분석하여 구조화된 요약을 제공하는 전문가입니다.
+    
+    {SUMMARY_FORMAT_RULES}
     
     타임라인 정보:
     {timeline}
@@ -52,4 +56,47 @@ def get_summarize_prompt(timeline, subtitle):
     return ChatPromptTemplate.from_messages([
         ("system", system_prompt),
         ("human", "위 내용을 요약해주세요.")
-    ])
\ No newline at end of file
+    ])
+
+# 구간별(map) 요약 프롬프트
+partial_summarize_prompt = ChatPromptTemplate.from_messages([
+    ("system", """당신은 YouTube 영상 자막의 한 구간을 정리하는 전문가입니다.
+    이 결과는 나중에 다른 구간의 정리와 합쳐 전체 요약을 만드는 데 사용됩니다.
+    
+    다음 규칙을 따라 정리해주세요:
+    1. 구간의 핵심 내용을 bullet points로 빠짐없이 정리하세요.
+    2. 구체적인 수치, 사례, 인물, 고유명사는 그대로 남기세요.
+    3. 중요한 키워드를 함께 적어주세요.
+    4. 자막에 없는 내용은 추가하지 마세요.
+    
+    구간 정보: {segment_title} ({segment_index}/{segment_count})
+    
+    자막 내용:
+    {subtitle}
+    """),
+    ("human", "이 구간의 내용을 정리해주세요.")
+])
+
+# 구간별 요약을 합치는(reduce) 프롬프트
+reduce_summarize_prompt = ChatPromptTemplate.from_messages([
+    ("system", """당신은 YouTube 영상의 구간별 정리 내용과 타임라인을 바탕으로 구조화된 요약을 제공하는 전문가입니다.
+    
+    """ + SUMMARY_FORMAT_RULES + """
+    
+    타임라인 정보:
+    {timeline}
+    
+    구간별 정리 내용:
+    {partial_summaries}
+    """),
+    ("human", "위 내용을 요약해주세요.")
+])
+
+def get_summarize_prompt_hash():
+    """요약 프롬프트 템플릿들의 해시를 반환합니다. 프롬프트가 바뀌면 요약 캐시 키도 바뀝니다."""
+    templates = [
+        get_summarize_prompt("<timeline>", "<subtitle>").pretty_repr(),
+        partial_summarize_prompt.pretty_repr(),
+        reduce_summarize_prompt.pretty_repr(),
+    ]
+    return hashlib.sha256("\n".join(templates).encode("utf-8")).hexdigest()[:16]
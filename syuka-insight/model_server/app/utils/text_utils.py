@@ -1,5 +1,7 @@
 from utils.llm_utils import create_llm
+from utils.translation_cache import translation_cache, normalize_query
 from langchain_core.prompts import ChatPromptTemplate
+import asyncio
 
 # 번역 모델
 llm_translate = create_llm(model_name="gemini-2.0-flash")
@@ -14,6 +16,27 @@ Answer: Only translate in English.""")
 
 def translate_text(input_text):
     """텍스트를 영어로 번역합니다."""
+    key = normalize_query(input_text)
+    cached = translation_cache.get(key)
+    if cached is not None:
+        return cached
+
     chain = translate_prompt | llm_translate
     result = chain.invoke({"input": input_text})
-    return result.content
\ No newline at end of file
+    translation_cache.set(key, result.content)
+    return result.content
+
+async def atranslate_text(input_text):
+    """텍스트를 영어로 번역합니다. (비동기)"""
+    key = normalize_query(input_text)
+    # 메모리 캐시는 바로 확인하고, 디스크 조회/저장은 스레드에서 실행
+    cached = translation_cache.get_from_memory(key)
+    if cached is None:
+        cached = await asyncio.to_thread(translation_cache.get_from_disk, key)
+    if cached is not None:
+        return cached
+
+    chain = translate_prompt | llm_translate
+    result = await chain.ainvoke({"input": input_text})
+    await asyncio.to_thread(translation_cache.set, key, result.content)
+    return result.content
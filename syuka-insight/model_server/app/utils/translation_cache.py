@@ -0,0 +1,131 @@
+from utils.cache_utils import LRUCache
+import os
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+
+# 번역 캐시 설정
+TRANSLATION_CACHE_PATH = os.getenv("TRANSLATION_CACHE_PATH", "./cache/translation_cache.sqlite3")
+TRANSLATION_CACHE_MAX_SIZE = int(os.getenv("TRANSLATION_CACHE_MAX_SIZE", "1024"))  # 메모리 LRU 최대 항목 수
+TRANSLATION_CACHE_MAX_ROWS = int(os.getenv("TRANSLATION_CACHE_MAX_ROWS", "50000"))  # 디스크 최대 행 수
+TRANSLATION_CACHE_TTL = float(os.getenv("TRANSLATION_CACHE_TTL", str(7 * 24 * 3600)))  # 초 단위
+
+# 디스크 정리(만료/크기 제한) 주기
+PRUNE_EVERY_N_WRITES = 100
+
+def normalize_query(text):
+    """캐시 키로 사용할 수 있도록 질문을 정규화합니다."""
+    text = unicodedata.normalize("NFKC", text)
+    text = re.sub(r"\s+", " ", text).strip()
+    text = text.rstrip("?!.~ ")
+    return text.lower()
+
+class TranslationCache:
+    """메모리 LRU와 SQLite 디스크 저장소를 결합한 번역 캐시"""
+
+    def __init__(self, path, max_size, max_rows, ttl):
+        self.max_rows = max_rows
+        self.ttl = ttl
+        # 메모리 항목은 (번역, 생성 시각)으로 저장해 디스크와 동일한 TTL 기준을 사용
+        self.memory = LRUCache(max_size=max_size)
+        self.disk_hits = 0
+        self.disk_misses = 0
+        self._writes = 0
+        self._lock = threading.Lock()
+
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS translations ("
+                "query TEXT PRIMARY KEY, translation TEXT NOT NULL, created_at REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS ix_translations_created_at ON translations (created_at)"
+            )
+            self._conn.commit()
+
+    def _is_expired(self, created_at):
+        return time.time() - created_at > self.ttl
+
+    def get_from_memory(self, key):
+        """메모리 캐시에서 번역을 조회합니다."""
+        item = self.memory.get(key)
+        if item is None:
+            return None
+        translation, created_at = item
+        if self._is_expired(created_at):
+            self.memory.pop(key)
+            return None
+        return translation
+
+    def get_from_disk(self, key):
+        """디스크 캐시에서 번역을 조회하고, 적중 시 메모리에 올립니다."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT translation, created_at FROM translations WHERE query = ?", (key,)
+            ).fetchone()
+
+        if row is None or self._is_expired(row[1]):
+            self.disk_misses += 1
+            return None
+
+        self.disk_hits += 1
+        self.memory.set(key, (row[0], row[1]))
+        return row[0]
+
+    def get(self, key):
+        """메모리 → 디스크 순서로 번역을 조회합니다."""
+        translation = self.get_from_memory(key)
+        if translation is None:
+            translation = self.get_from_disk(key)
+        return translation
+
+    def set(self, key, translation):
+        """번역을 메모리와 디스크에 저장합니다."""
+        created_at = time.time()
+        self.memory.set(key, (translation, created_at))
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO translations (query, translation, created_at) VALUES (?, ?, ?)",
+                (key, translation, created_at),
+            )
+            self._conn.commit()
+            self._writes += 1
+            if self._writes % PRUNE_EVERY_N_WRITES == 0:
+                self._prune()
+
+    def _prune(self):
+        """만료된 행을 삭제하고, 최대 행 수를 넘으면 오래된 행부터 삭제합니다."""
+        self._conn.execute("DELETE FROM translations WHERE created_at < ?", (time.time() - self.ttl,))
+        self._conn.execute(
+            "DELETE FROM translations WHERE query IN ("
+            "SELECT query FROM translations ORDER BY created_at DESC LIMIT -1 OFFSET ?)",
+            (self.max_rows,),
+        )
+        self._conn.commit()
+
+    def stats(self):
+        """번역 캐시 통계를 반환합니다."""
+        memory_stats = self.memory.stats()
+        with self._lock:
+            disk_rows = self._conn.execute("SELECT COUNT(*) FROM translations").fetchone()[0]
+        lookups = memory_stats["hits"] + memory_stats["misses"]
+        hits = memory_stats["hits"] + self.disk_hits
+        return {
+            "memory": memory_stats,
+            "disk_rows": disk_rows,
+            "disk_hits": self.disk_hits,
+            "disk_misses": self.disk_misses,
+            "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+        }
+
+translation_cache = TranslationCache(
+    TRANSLATION_CACHE_PATH,
+    max_size=TRANSLATION_CACHE_MAX_SIZE,
+    max_rows=TRANSLATION_CACHE_MAX_ROWS,
+    ttl=TRANSLATION_CACHE_TTL,
+)
@@ -11,8 +11,11 @@ APP_ICON = "👋"
 API_ENDPOINTS = {
     "video_info": f"{WEB_SERVER_URL}/video/info",
     "playlist_videos": f"{WEB_SERVER_URL}/playlist_videos",
+    "playlist_page": f"{WEB_SERVER_URL}/playlist/videos",
     "summarize": f"{WEB_SERVER_URL}/summarize",
+    "summarize_stream": f"{WEB_SERVER_URL}/summarize/stream",
     "chat_stream": f"{WEB_SERVER_URL}/chat/stream",
     "create_chromadb": f"{WEB_SERVER_URL}/create_chromadb",
+    "jobs": f"{WEB_SERVER_URL}/jobs",
     "chromadb_videos": f"{WEB_SERVER_URL}/chromadb_videos" 
 }
\ No newline at end of file
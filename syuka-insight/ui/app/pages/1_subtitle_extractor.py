@@ -1,10 +1,14 @@
 import streamlit as st
 from components import video_input
 from utils.formatters import format_subtitle
-from utils.api import summarize_with_api
+from utils.api import summarize_stream_with_api, create_chromadb_with_api, get_job_status, get_playlist_page_with_api
 import requests
 from config import API_ENDPOINTS
 import os
+import time
+
+# ChromaDB 생성 작업 상태 확인 주기 (초)
+JOB_POLL_INTERVAL = 1.0
 
 st.set_page_config(page_title="YouTube 자막 추출 & 요약", page_icon="📝")
 
@@ -43,13 +47,32 @@ if 'summaries' not in st.session_state:
 if 'db_created' not in st.session_state:
     st.session_state['db_created'] = False
 
+if 'playlist_videos' not in st.session_state:
+    st.session_state['playlist_videos'] = None  # 지금까지 불러온 플레이리스트 영상 목록
+
+if 'playlist_cursor' not in st.session_state:
+    st.session_state['playlist_cursor'] = None  # 다음 페이지 커서
+
 # 슈카월드 플레이리스트 표시
+def load_playlist_page(playlist_url):
+    """플레이리스트의 다음 페이지를 불러와 세션에 이어 붙입니다. 실패하면 False를 반환합니다."""
+    page = get_playlist_page_with_api(playlist_url, st.session_state['playlist_cursor'])
+    if "error" in page:
+        return False
+    st.session_state['playlist_videos'] = (st.session_state['playlist_videos'] or []) + page['videos']
+    st.session_state['playlist_cursor'] = page.get('next_cursor')
+    return True
+
 def display_video_list(playlist_url):
     try:
-        response = requests.post(API_ENDPOINTS["playlist_videos"], json={"playlist_url": playlist_url, "start": 0, "end": 6})
-        if response.status_code == 200:
-            videos = response.json()
-            video_list = videos['videos']
+        # 첫 페이지만 서버에서 가져오고, 이후 rerun에서는 세션에 저장된 목록을 사용
+        if st.session_state['playlist_videos'] is None:
+            loaded = load_playlist_page(playlist_url)
+        else:
+            loaded = True
+
+        if loaded:
+            video_list = st.session_state['playlist_videos']
             
             # 비디오를 3개씩 열에 나누어 표시
             num_columns = 3
@@ -106,6 +129,13 @@ def display_video_list(playlist_url):
                 
                 # 각 비디오마다 세로 구분선 추가
                 col.markdown("---")
+
+            # 다음 페이지 불러오기
+            if st.session_state['playlist_cursor'] and st.button("더 보기", key="playlist_more"):
+                if load_playlist_page(playlist_url):
+                    st.rerun()
+                else:
+                    st.error("플레이리스트 비디오 목록을 불러오는데 실패했습니다.")
         else:
             st.error("플레이리스트 비디오 목록을 불러오는데 실패했습니다.")
     except Exception as e:
@@ -152,22 +182,29 @@ if video_loaded or (st.session_state.video_info is not None):
             
             # ChromaDB 생성 버튼
             if st.button("ChromaDB 생성", disabled=st.session_state['db_created']):
-                with st.spinner("ChromaDB를 생성 중입니다..."):
-                    response = requests.post(
-                        API_ENDPOINTS["create_chromadb"], 
-                        json={
-                            "video_id": video_id, 
-                            "title": title, 
-                            "subtitle": subtitle
-                        }
-                    )
-                    
-                    if response.status_code == 200:
-                        res = response.json()
+                job = create_chromadb_with_api(video_id, title)  # 자막은 서버에 저장된 것을 사용
+
+                if "error" in job:
+                    st.info("ChromaDB 생성 실패.")
+                    st.session_state['db_created'] = False
+                else:
+                    # 작업이 끝날 때까지 진행률을 주기적으로 확인
+                    progress_bar = st.progress(0.0, text="ChromaDB를 생성 중입니다...")
+                    while job.get("status") in ("queued", "running"):
+                        time.sleep(JOB_POLL_INTERVAL)
+                        job = get_job_status(job["job_id"])
+                        if job.get("total"):
+                            progress_bar.progress(
+                                job["embedded"] / job["total"],
+                                text=f"임베딩 중... ({job['embedded']}/{job['total']})"
+                            )
+                    progress_bar.empty()
+
+                    if job.get("status") == "succeeded":
                         st.session_state['db_created'] = True
-                        st.success(f"{res['message']}")
+                        st.success(f"{job['message']}")
                     else:
-                        st.info("ChromaDB 생성 실패.")
+                        st.info(f"ChromaDB 생성 실패. {job.get('message', job.get('error', ''))}")
                         st.session_state['db_created'] = False
         
         with tab2:
@@ -194,12 +231,21 @@ if video_loaded or (st.session_state.video_info is not None):
             
             current_url = st.session_state['video_url']
             
-            # 현재 URL에 대한 요약이 없을 때만 새로 요약 실행
+            # 현재 URL에 대한 요약이 없을 때만 새로 요약 실행 (생성되는 대로 표시)
             if current_url not in st.session_state['summaries']:
-                with st.spinner("영상을 요약 중입니다..."):
-                    summary = summarize_with_api(subtitle, timeline)
+                placeholder = st.empty()
+                summary = ""
+                try:
+                    with st.spinner("영상을 요약 중입니다..."):
+                        for chunk in summarize_stream_with_api(subtitle, timeline, video_id):
+                            summary += chunk
+                            placeholder.markdown(summary + "▌")
+                    placeholder.empty()
                     if summary:  # 요약이 성공적으로 생성된 경우에만 저장
                         st.session_state['summaries'][current_url] = summary
+                except Exception as e:
+                    placeholder.empty()
+                    st.error(f"요약에 실패했습니다. 오류: {str(e)}")
             
             # 요약 결과 표시 (저장된 요약이 있으면 바로 표시)
             if current_url in st.session_state['summaries']:
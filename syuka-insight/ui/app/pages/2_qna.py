@@ -2,7 +2,7 @@ import streamlit as st
 from utils.api import chat_stream_with_api
 from utils.chat_utils import display_chat_message
 from components.video_list import video_list_component
-from utils.session import get_current_video
+from utils.session import get_current_video, get_chat_session_id
 
 
 st.set_page_config(page_title="QnA", page_icon="❓", layout="wide")
@@ -43,7 +43,7 @@ else:
                 
                 # 스트리밍 응답 처리
                 full_response = ""
-                for response_chunk in chat_stream_with_api(query, video_id):                    
+                for response_chunk in chat_stream_with_api(query, video_id, get_chat_session_id()):                    
                     full_response += response_chunk
                     placeholder.markdown(full_response + "▌", unsafe_allow_html=True)
                 placeholder.markdown(full_response, unsafe_allow_html=True)
@@ -17,15 +17,33 @@ def get_video_info(video_url):
     except Exception as e:
         return {"error": str(e)}
 
-def summarize_with_api(transcript_text, timeline_text):
+def get_playlist_page_with_api(playlist_url, cursor=None, limit=6):
+    """플레이리스트 영상 목록을 한 페이지씩 가져옵니다."""
+    try:
+        params = {"playlist_url": playlist_url, "limit": limit}
+        if cursor:
+            params["cursor"] = cursor
+        response = requests.get(API_ENDPOINTS["playlist_page"], params=params)
+        response.raise_for_status()
+        return response.json()
+    except requests.RequestException as e:
+        return {"error": str(e)}
+
+def build_summarize_request(transcript_text, timeline_text, video_id=None):
+    """요약 요청 데이터를 만듭니다. video_id가 있으면 서버에 저장된 자막을 사용하므로 자막을 보내지 않습니다."""
+    if video_id:
+        return {"video_id": video_id}
+    return {
+        "summary_info": json.dumps({
+            "timeline": timeline_text,
+            "subtitle": transcript_text
+        })
+    }
+
+def summarize_with_api(transcript_text, timeline_text, video_id=None):
     """자막과 타임라인을 활용해 요약합니다."""
     try:
-        request_data = {
-            "summary_info": json.dumps({
-                "timeline": timeline_text,
-                "subtitle": transcript_text
-            })
-        }
+        request_data = build_summarize_request(transcript_text, timeline_text, video_id)
         
         response = requests.post(
             API_ENDPOINTS["summarize"],
@@ -39,11 +57,40 @@ def summarize_with_api(transcript_text, timeline_text):
     except Exception as e:
         return f"요약에 실패했습니다. 오류: {str(e)}"
 
-def chat_stream_with_api(query, video_id):
-    """모델과 채팅합니다."""
+def summarize_stream_with_api(transcript_text, timeline_text, video_id=None):
+    """자막과 타임라인을 활용해 요약하고, 요약을 스트리밍으로 받습니다.
+
+    요약에 실패하면 RuntimeError를 발생시킵니다.
+    """
+    request_data = build_summarize_request(transcript_text, timeline_text, video_id)
+
+    with requests.post(API_ENDPOINTS["summarize_stream"], json=request_data, stream=True) as response:
+        if response.status_code != 200:
+            raise RuntimeError(f"요약에 실패했습니다. 오류: {response.status_code}")
+
+        for line in response.iter_lines():
+            if not line:
+                continue
+            line = line.decode('utf-8')
+            if not line.startswith('data:'):
+                continue
+            data = line[6:] # 'data: ' 제거
+            if data == "[DONE]":
+                break
+            try:
+                chunk_data = json.loads(data)
+            except json.JSONDecodeError:
+                raise RuntimeError(f"요약에 실패했습니다. 오류: {data}")
+            if "error" in chunk_data:
+                raise RuntimeError(chunk_data["error"])
+            yield chunk_data.get("content", "")
+
+def chat_stream_with_api(query, video_id, session_id=None):
+    """모델과 채팅합니다. session_id별로 서버에 대화 기록이 유지됩니다."""
     request_data = {
         "query": query,
-        "video_id": video_id
+        "video_id": video_id,
+        "session_id": session_id
     }
     
     print(f"Sending request data: {request_data}")  # 디버깅용 로그
@@ -72,6 +119,30 @@ def chat_stream_with_api(query, video_id):
             print(f"Error response: {error_detail}")  # 디버깅용 로그
             yield f"응답 실패. 오류: {response.status_code} - {error_detail}"
 
+def create_chromadb_with_api(video_id, title, subtitle=None):
+    """ChromaDB 생성 작업을 등록합니다. subtitle이 없으면 서버에 저장된 자막을 사용합니다."""
+    try:
+        request_data = {"video_id": video_id, "title": title}
+        if subtitle:
+            request_data["subtitle"] = subtitle
+        response = requests.post(
+            API_ENDPOINTS["create_chromadb"],
+            json=request_data
+        )
+        response.raise_for_status()
+        return response.json()
+    except requests.RequestException as e:
+        return {"error": str(e)}
+
+def get_job_status(job_id):
+    """ChromaDB 생성 작업의 상태를 가져옵니다."""
+    try:
+        response = requests.get(f"{API_ENDPOINTS['jobs']}/{job_id}")
+        response.raise_for_status()
+        return response.json()
+    except requests.RequestException as e:
+        return {"error": str(e)}
+
 def get_chromadb_video_list():
     """ChromaDB에서 영상 목록을 가져오는 함수"""
     try:
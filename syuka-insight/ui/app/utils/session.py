@@ -1,9 +1,17 @@
 import streamlit as st
+import uuid
 
 def set_current_video(video_id):
-    """현재 선택한 비디오 ID를 세션에 저장"""
+    """현재 선택한 비디오 ID를 세션에 저장하고 새 대화를 시작"""
     st.session_state["current_video_id"] = video_id
     st.session_state.messages = []
+    st.session_state["chat_session_id"] = uuid.uuid4().hex  # 화면의 대화와 서버의 대화 기록을 함께 초기화
+
+def get_chat_session_id():
+    """현재 대화의 세션 ID를 반환 (서버가 사용자별로 대화 기록을 구분하는 키)"""
+    if "chat_session_id" not in st.session_state:
+        st.session_state["chat_session_id"] = uuid.uuid4().hex
+    return st.session_state["chat_session_id"]
 
 def get_current_video():
     """현재 선택한 비디오 ID를 반환"""
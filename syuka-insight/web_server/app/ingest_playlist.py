@@ -0,0 +1,47 @@
+"""플레이리스트 일괄 수집 CLI
+
+사용 예시 (web-server 컨테이너 안에서):
+    python ingest_playlist.py "https://www.youtube.com/playlist?list=..." --start 1 --end 50
+"""
+from services.playlist_ingestion import (
+    run_playlist_ingestion,
+    PLAYLIST_EXTRACT_CONCURRENCY,
+    PLAYLIST_INGEST_CONCURRENCY,
+)
+from services.extraction_pool import extraction_pool
+from utils.http_client import close_model_client
+import argparse
+import asyncio
+import json
+
+async def run_and_close(*args):
+    try:
+        return await run_playlist_ingestion(*args)
+    finally:
+        await close_model_client()
+        extraction_pool.shutdown()
+
+def main():
+    parser = argparse.ArgumentParser(description="플레이리스트 영상들의 자막을 추출해 ChromaDB를 일괄 생성합니다.")
+    parser.add_argument("playlist_url", help="유튜브 플레이리스트 URL")
+    parser.add_argument("--start", type=int, default=1, help="시작 인덱스 (1부터)")
+    parser.add_argument("--end", type=int, required=True, help="끝 인덱스 (포함)")
+    parser.add_argument("--extract-concurrency", type=int, default=PLAYLIST_EXTRACT_CONCURRENCY, help="자막 추출 동시 실행 수")
+    parser.add_argument("--ingest-concurrency", type=int, default=PLAYLIST_INGEST_CONCURRENCY, help="ChromaDB 생성 동시 실행 수")
+    args = parser.parse_args()
+    if args.extract_concurrency < 1 or args.ingest_concurrency < 1:
+        parser.error("--extract-concurrency와 --ingest-concurrency는 1 이상이어야 합니다.")
+
+    run = asyncio.run(
+        run_and_close(
+            args.playlist_url,
+            args.start,
+            args.end,
+            args.extract_concurrency,
+            args.ingest_concurrency,
+        )
+    )
+    print(json.dumps(run.to_dict(), ensure_ascii=False, indent=2))
+
+if __name__ == "__main__":
+    main()
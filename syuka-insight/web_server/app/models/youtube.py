@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, Date, DateTime, Float, BigInteger, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, Date, DateTime, Float, BigInteger, ForeignKey, UniqueConstraint, Index, JSON
 from datetime import datetime
 from .database import Base
 
@@ -11,13 +11,41 @@ class Video(Base):
     upload_date = Column(Date)
     duration = Column(Integer)
     view_count = Column(BigInteger)
+    duration_string = Column(String)
+    chapters = Column(JSON)  # yt-dlp chapters (타임라인 생성용)
+    refreshed_at = Column(DateTime, default=datetime.utcnow)  # 조회수 등 변하는 정보를 마지막으로 갱신한 시각
     created_at = Column(DateTime, default=datetime.utcnow)
 
 class Subtitle(Base):
     __tablename__ = "subtitles"
+    __table_args__ = (
+        Index("ix_subtitles_video_id_start_time", "video_id", "start_time"),
+    )
     id = Column(Integer, primary_key=True, index=True)
     video_id = Column(String, ForeignKey("videos.video_id"), nullable=False)
     start_time = Column(Float, nullable=False)
     end_time = Column(Float, nullable=False)
     subtitle_text = Column(Text, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
\ No newline at end of file
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+class Summary(Base):
+    __tablename__ = "summaries"
+    __table_args__ = (
+        UniqueConstraint("video_id", "prompt_hash", "model_name", "mode", name="uq_summaries_key"),
+    )
+    id = Column(Integer, primary_key=True, index=True)
+    video_id = Column(String, index=True, nullable=False)
+    prompt_hash = Column(String, nullable=False)  # 요약 프롬프트 템플릿 해시
+    model_name = Column(String, nullable=False)
+    mode = Column(String, nullable=False, default="auto")  # 요약 방식 (auto | single | map_reduce)
+    summary_text = Column(Text, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+
+# 이미 만들어진 테이블에 적용할 스키마 변경 (create_all은 기존 테이블을 수정하지 않음)
+SCHEMA_PATCHES = [
+    "CREATE INDEX IF NOT EXISTS ix_subtitles_video_id_start_time ON subtitles (video_id, start_time)",
+    "ALTER TABLE videos ADD COLUMN IF NOT EXISTS duration_string VARCHAR",
+    "ALTER TABLE videos ADD COLUMN IF NOT EXISTS chapters JSON",
+    "ALTER TABLE videos ADD COLUMN IF NOT EXISTS refreshed_at TIMESTAMP",
+]
@@ -0,0 +1,19 @@
+from fastapi import APIRouter
+from services.video_info_service import video_info_cache
+from services.extraction_pool import extraction_pool
+from services.playlist_cache import get_playlist_cache_stats
+from utils.singleflight import request_coalescer
+from utils.http_client import get_latency_stats
+
+router = APIRouter(tags=["Cache"])
+
+@router.get("/cache/stats")
+def cache_stats():
+    """캐시 적중/미스와 병합된 요청 수 통계를 반환합니다."""
+    return {
+        "video_info": video_info_cache.stats(),
+        "playlist": get_playlist_cache_stats(),
+        "singleflight": request_coalescer.stats(),
+        "extraction_pool": extraction_pool.stats(),
+        "model_server_latency": get_latency_stats(),
+    }
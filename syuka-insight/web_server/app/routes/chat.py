@@ -2,14 +2,13 @@ from fastapi import APIRouter, HTTPException
 from fastapi.responses import StreamingResponse
 from schemas.requests import QnARequest
 from services.model_service import stream_chat
+from utils.metrics import StreamTimer
 import json
 import traceback
 import asyncio
 import logging
 
-# 로그 설정
-logging.basicConfig(level=logging.DEBUG) # 로그 레벨 설정 (DEBUG, INFO, WARNING, ERROR, CRITICAL)
-logger = logging.getLogger(__name__) # 현재 모듈에 대한 로거 생성
+logger = logging.getLogger(__name__) # 현재 모듈에 대한 로거 생성 (로그 레벨은 LOG_LEVEL 환경 변수로 설정)
 
 
 router = APIRouter(tags=["Chat"])
@@ -22,9 +21,12 @@ async def chat_stream(request: QnARequest):
             raise HTTPException(status_code=400, detail="Query is required.")
         
         async def generate():
-            async for chunk in stream_chat(request.query, request.video_id):
-                # logger.info(f"[WEB] 모델 서버에서 받은 원본 chunk: {chunk}")
+            timer = StreamTimer("chat")
+            async for chunk in stream_chat(request.query, request.video_id, request.session_id):
+                if chunk.startswith("data:"):
+                    timer.chunk()
                 yield chunk
+            timer.finish()
         
         return StreamingResponse(
             generate(),
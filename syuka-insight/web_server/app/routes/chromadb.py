@@ -1,34 +1,64 @@
 from fastapi import APIRouter, HTTPException
-import requests
-import os
+import httpx
 from schemas.requests import ChromaDBRequest
+from utils.http_client import model_get, model_post, SUBMIT_TIMEOUT
+from utils.singleflight import request_coalescer
+from services.video_info_service import get_video_source
 from typing import List, Dict, Any
 
 router = APIRouter(tags=["ChromaDB"])
 
-MODEL_SERVER_URL = os.getenv("MODEL_SERVER_URL", "http://model-server:8001")
+async def submit_chromadb_job(payload: Dict[str, Any]):
+    """모델 서버에 ChromaDB 생성 작업을 등록합니다."""
+    response = await model_post("/create_chromadb", name="create_chromadb", json=payload, timeout=SUBMIT_TIMEOUT)
+    response.raise_for_status()
+    return response.json()
 
-@router.post("/create_chromadb")
-def create_chromadb(request: ChromaDBRequest):
-    """ChromaDB에 자막 데이터를 저장합니다."""
+@router.post("/create_chromadb", status_code=202)
+async def create_chromadb(request: ChromaDBRequest):
+    """ChromaDB 생성 작업을 모델 서버에 등록합니다. 진행 상황은 /jobs/{job_id}로 확인합니다.
+
+    subtitle를 보내지 않으면 서버에 저장된 자막을 사용합니다.
+    같은 영상에 대한 동시 요청은 자막을 한 번만 전송하고 같은 작업 정보를 받습니다.
+    """
     try:
+        title, subtitle = request.title, request.subtitle
+        if not subtitle:
+            source = await get_video_source(request.video_id)
+            if source is None:
+                raise HTTPException(status_code=404, detail="저장된 자막이 없습니다. 먼저 /video/info로 영상 정보를 가져와주세요.")
+            title, subtitle = title or source["title"], source["subtitle"]
+
         payload = {
-            "video_id": request.video_id, 
-            "title": request.title, 
-            "subtitle": request.subtitle
+            "video_id": request.video_id,
+            "title": title,
+            "subtitle": subtitle
         }
-        response = requests.post(f"{MODEL_SERVER_URL}/create_chromadb", json=payload, timeout=60)
+        return await request_coalescer.do(
+            ("create_chromadb", request.video_id),
+            lambda: submit_chromadb_job(payload),
+        )
+    except httpx.HTTPError as e:
+        raise HTTPException(status_code=502, detail=str(e))
+
+@router.get("/jobs/{job_id}")
+async def get_job_status(job_id: str):
+    """ChromaDB 생성 작업의 상태와 진행률을 가져옵니다."""
+    try:
+        response = await model_get(f"/jobs/{job_id}", name="jobs")
+        if response.status_code == 404:
+            raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
         response.raise_for_status()
         return response.json()
-    except requests.RequestException as e:
+    except httpx.HTTPError as e:
         raise HTTPException(status_code=502, detail=str(e))
 
 @router.get("/chromadb_videos", response_model=List[Dict])
-def get_chromadb_videos():
+async def get_chromadb_videos():
     """저장된 ChromaDB 비디오 목록을 가져옵니다."""
     try:
-        response = requests.get(f"{MODEL_SERVER_URL}/chromadb_videos")
+        response = await model_get("/chromadb_videos", name="chromadb_videos")
         response.raise_for_status()
         return response.json()
-    except requests.RequestException as e:
-        raise HTTPException(status_code=502, detail=f"ChromaDB 목록 가져오기 실패: {str(e)}")
\ No newline at end of file
+    except httpx.HTTPError as e:
+        raise HTTPException(status_code=502, detail=f"ChromaDB 목록 가져오기 실패: {str(e)}")
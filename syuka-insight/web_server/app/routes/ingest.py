@@ -0,0 +1,28 @@
+from fastapi import APIRouter, HTTPException
+from schemas.requests import PlaylistIngestRequest
+from services.playlist_ingestion import start_playlist_ingestion, get_playlist_run
+
+router = APIRouter(tags=["Ingest"])
+
+@router.post("/playlist/ingest", status_code=202)
+async def ingest_playlist(request: PlaylistIngestRequest):
+    """플레이리스트 영상들의 자막 추출 및 ChromaDB 생성을 일괄로 시작합니다."""
+    try:
+        run = start_playlist_ingestion(
+            request.playlist_url,
+            request.start,
+            request.end,
+            request.extract_concurrency,
+            request.ingest_concurrency,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return run.to_dict()
+
+@router.get("/playlist/ingest/{run_id}")
+async def get_ingest_status(run_id: str):
+    """일괄 수집의 진행 상황과 처리량(videos/min)을 반환합니다."""
+    run = get_playlist_run(run_id)
+    if run is None:
+        raise HTTPException(status_code=404, detail="일괄 수집 실행을 찾을 수 없습니다.")
+    return run.to_dict()
@@ -0,0 +1,9 @@
+from fastapi import APIRouter
+from utils.metrics import metrics_response
+
+router = APIRouter(tags=["Metrics"])
+
+@router.get("/metrics", include_in_schema=False)
+def metrics():
+    """Prometheus 지표를 반환합니다."""
+    return metrics_response()
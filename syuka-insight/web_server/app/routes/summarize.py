@@ -1,20 +1,157 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Depends
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from schemas.requests import TextRequest
-from services.model_service import summarize_text
+from services.model_service import summarize_text, stream_summarize, get_summarize_config
+from services.db_service import get_cached_summary, save_summary, delete_summaries
+from services.video_info_service import get_video_source
+from models.database import get_db, AsyncSessionLocal
+from utils.singleflight import request_coalescer
+from utils.metrics import StreamTimer
 import json
 
 router = APIRouter(tags=["Summarize"])
 
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "Connection": "keep-alive",
+    "X-Accel-Buffering": "no"
+}
+
+def parse_summary_info(request: TextRequest):
+    """요청에서 타임라인과 자막 정보를 분리합니다."""
+    data = json.loads(request.summary_info)
+    timeline = data.get("timeline", "타임라인 정보가 없습니다.")
+    subtitle = data.get("subtitle", "")
+    return timeline, subtitle
+
+async def resolve_summary_input(request: TextRequest):
+    """요약에 사용할 (타임라인, 자막, 챕터별 자막)을 가져옵니다.
+
+    summary_info가 없으면 video_id로 서버에 저장된 자막과 챕터를 사용합니다.
+    """
+    if request.summary_info:
+        timeline, subtitle = parse_summary_info(request)
+        return timeline, subtitle, None
+    if not request.video_id:
+        raise HTTPException(status_code=400, detail="summary_info 또는 video_id가 필요합니다.")
+
+    source = await get_video_source(request.video_id)
+    if source is None:
+        raise HTTPException(status_code=404, detail="저장된 자막이 없습니다. 먼저 /video/info로 영상 정보를 가져와주세요.")
+    return source["timeline"], source["subtitle"], source["segments"]
+
+def parse_sse_data(line: str):
+    """SSE 한 줄에서 data JSON을 꺼냅니다. data 줄이 아니거나 [DONE]이면 None을 반환합니다."""
+    line = line.strip()
+    if not line.startswith("data:"):
+        return None
+    data = line[len("data:"):].strip()
+    if data == "[DONE]":
+        return None
+    try:
+        return json.loads(data)
+    except json.JSONDecodeError:
+        return {"error": data}
+
+async def load_cached_summary(request: TextRequest, config: dict):
+    """저장된 요약을 조회합니다. (조회가 끝나면 바로 세션을 닫음)"""
+    async with AsyncSessionLocal() as db:
+        return await get_cached_summary(db, request.video_id, config["prompt_hash"], config["model_name"], request.mode)
+
+async def store_summary(request: TextRequest, config: dict, summary: str):
+    """요약을 새 세션으로 저장합니다."""
+    async with AsyncSessionLocal() as db:
+        await save_summary(db, request.video_id, config["prompt_hash"], config["model_name"], summary, request.mode)
+
+async def summarize_and_store(request: TextRequest):
+    """저장된 요약이 있으면 반환하고, 없으면 모델 서버에 요청해 저장합니다.
+
+    모델 호출(최대 수 분) 동안 DB 연결을 붙잡지 않도록 조회와 저장에 각각 짧은 세션을 사용합니다.
+    """
+    config = await get_summarize_config()
+    cached = await load_cached_summary(request, config)
+    if cached is not None:
+        return {"summary": cached}
+
+    # 모델 서버에 요약 요청
+    timeline, subtitle, segments = await resolve_summary_input(request)
+    result = await summarize_text(timeline, subtitle, segments, request.mode)
+
+    if result.get("summary"):
+        await store_summary(request, config, result["summary"])
+    return result
+
 @router.post("/summarize")
-def summarize(request: TextRequest):
-    """텍스트 요약을 처리합니다."""
+async def summarize(request: TextRequest):
+    """텍스트 요약을 처리합니다. video_id가 있으면 저장된 요약을 먼저 확인합니다.
+
+    summary_info 없이 video_id만 보내면 서버에 저장된 자막으로 요약합니다.
+    같은 영상에 대한 동시 요약 요청은 하나의 모델 호출 결과를 함께 받습니다.
+    """
     try:
-        # 타임라인과 자막 정보를 분리
-        data = json.loads(request.summary_info)
-        timeline = data.get("timeline", "타임라인 정보가 없습니다.")
-        subtitle = data.get("subtitle", "")
+        if request.video_id:
+            return await request_coalescer.do(
+                ("summarize", request.video_id, request.mode),
+                lambda: summarize_and_store(request),
+            )
 
         # 모델 서버에 요약 요청
-        return summarize_text(timeline, subtitle)
+        timeline, subtitle, segments = await resolve_summary_input(request)
+        return await summarize_text(timeline, subtitle, segments, request.mode)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.post("/summarize/stream")
+async def summarize_stream(request: TextRequest):
+    """요약을 SSE로 스트리밍합니다. 완료된 요약은 저장해 다음 요청에서 재사용합니다.
+
+    summary_info 없이 video_id만 보내면 서버에 저장된 자막으로 요약합니다.
+    """
+    try:
+        config = None
+        if request.video_id:
+            config = await get_summarize_config()
+            cached = await load_cached_summary(request, config)
+            if cached is not None:
+                async def replay():
+                    yield f"data: {json.dumps({'content': cached}, ensure_ascii=False)}\n\n"
+                    yield "data: [DONE]\n\n"
+
+                return StreamingResponse(replay(), media_type="text/event-stream", headers=SSE_HEADERS)
+
+        timeline, subtitle, segments = await resolve_summary_input(request)
+    except HTTPException:
+        raise
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=str(e))
+
+    async def generate():
+        parts = []
+        failed = False
+        timer = StreamTimer("summarize")
+        async for line in stream_summarize(timeline, subtitle, segments, request.mode):
+            yield line
+            data = parse_sse_data(line)
+            if data is None:
+                continue
+            timer.chunk()
+            if "error" in data:
+                failed = True
+            else:
+                parts.append(data.get("content", ""))
+        timer.finish()
+
+        # 스트림이 끝까지 정상 완료된 경우에만 저장
+        if config and parts and not failed:
+            await store_summary(request, config, "".join(parts))
+
+    return StreamingResponse(generate(), media_type="text/event-stream", headers=SSE_HEADERS)
+
+@router.delete("/summarize/{video_id}")
+async def invalidate_summary(video_id: str, db: AsyncSession = Depends(get_db)):
+    """영상의 저장된 요약을 삭제합니다."""
+    deleted = await delete_summaries(db, video_id)
+    return {"video_id": video_id, "deleted": deleted}
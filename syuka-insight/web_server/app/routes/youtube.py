@@ -1,30 +1,86 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
 from schemas.requests import VideoRequest, PlaylistRequest
-from services.youtube_service import process_video_url, process_playlist
+from services.playlist_cache import get_playlist_page, get_playlist_range, InvalidCursor, PLAYLIST_PAGE_SIZE
+from schemas.responses import PlaylistResponse, PlaylistPageResponse
+from services.extraction_pool import extraction_pool, ExtractionQueueFull
+from services.video_info_service import load_video_info, get_video_source
+from services.db_service import get_subtitle_cues
+from models.database import get_db
+import asyncio
 
 router = APIRouter(tags=["Youtube"])
 
-# 전역 캐시
-processed_videos = {}
-
 @router.post("/video/info")
-def get_video_info(request: VideoRequest):
-    """유튜브 비디오 정보와 자막을 가져옵니다."""
+async def get_video_info(request: VideoRequest):
+    """유튜브 비디오 정보와 자막을 가져옵니다. (메모리 캐시 → DB → yt-dlp)
+
+    같은 영상에 대한 동시 요청은 하나의 추출 결과를 함께 받습니다.
+    include_subtitle이 False면 자막 본문을 빼고 반환합니다. (요약/ChromaDB 생성은 video_id만으로 요청 가능)
+    """
     try:
-        video_url = request.video_url
-        if video_url in processed_videos:
-            return processed_videos[video_url]
-        else:
-            result = process_video_url(video_url)
-            processed_videos[video_url] = result
-            return result
+        result = await load_video_info(request.video_url)
+        if result is None:
+            return {"error": "영상 정보를 가져오는데 실패했습니다."}
+        if not request.include_subtitle:
+            return result.model_copy(update={"subtitle": None})
+        return result
+    except ExtractionQueueFull as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except asyncio.TimeoutError:
+        raise HTTPException(status_code=504, detail="영상 정보 추출 시간이 초과되었습니다.")
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@router.get("/video/{video_id}/subtitle")
+async def get_video_subtitle_text(video_id: str):
+    """서버에 저장된 자막 전체를 일반 텍스트로 가져옵니다."""
+    source = await get_video_source(video_id)
+    if source is None:
+        raise HTTPException(status_code=404, detail="저장된 자막이 없습니다.")
+    return {"video_id": video_id, "subtitle": source["subtitle"]}
+
+@router.get("/video/{video_id}/subtitles")
+async def get_video_subtitles(
+    video_id: str,
+    start: Optional[float] = None,
+    end: Optional[float] = None,
+    db: AsyncSession = Depends(get_db),
+):
+    """저장된 자막을 큐 단위로 가져옵니다. start/end(초)로 구간을 지정할 수 있습니다."""
+    cues = await get_subtitle_cues(db, video_id, start, end)
+    return {
+        "video_id": video_id,
+        "cues": [{"start": cue.start, "end": cue.end, "text": cue.text} for cue in cues],
+    }
+
 @router.post("/playlist_videos")
-def get_playlist_info(request: PlaylistRequest):
-    """유튜브 플레이리스트 정보를 가져옵니다."""
+async def get_playlist_info(request: PlaylistRequest):
+    """유튜브 플레이리스트 정보를 가져옵니다. (캐시된 목록에서 start~end 범위를 반환)"""
     try:
-        return process_playlist(request.playlist_url, request.start, request.end)
+        videos = await get_playlist_range(request.playlist_url, request.start, request.end)
+        if not videos:
+            return {"error": "플레이리스트 정보를 가져오는데 실패했습니다."}
+        return PlaylistResponse(videos=videos)
+    except ExtractionQueueFull as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except asyncio.TimeoutError:
+        raise HTTPException(status_code=504, detail="플레이리스트 정보 추출 시간이 초과되었습니다.")
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.get("/playlist/videos", response_model=PlaylistPageResponse)
+async def get_playlist_videos_page(playlist_url: str, cursor: Optional[str] = None, limit: int = PLAYLIST_PAGE_SIZE):
+    """캐시된 플레이리스트 영상 목록을 페이지 단위로 가져옵니다. 다음 페이지는 next_cursor로 요청합니다."""
+    try:
+        page = await get_playlist_page(playlist_url, cursor, limit)
+    except InvalidCursor as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except ExtractionQueueFull as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except asyncio.TimeoutError:
+        raise HTTPException(status_code=504, detail="플레이리스트 정보 추출 시간이 초과되었습니다.")
+    if not page["total"]:
+        raise HTTPException(status_code=502, detail="플레이리스트 정보를 가져오는데 실패했습니다.")
+    return page
@@ -1,21 +1,33 @@
 from pydantic import BaseModel
+from typing import Optional
 
 class VideoRequest(BaseModel):
     video_url: str
+    include_subtitle: bool = True  # False면 자막 본문 없이 영상 정보만 반환
 
 class TextRequest(BaseModel):
-    summary_info: str
+    summary_info: Optional[str] = None  # 없으면 video_id로 서버에 저장된 자막을 사용
+    video_id: Optional[str] = None  # 있으면 요약 결과를 DB에 캐시
+    mode: str = "auto"  # auto | single | map_reduce
 
 class ChromaDBRequest(BaseModel):
     video_id: str
-    title: str
-    subtitle: str
+    title: Optional[str] = None  # 없으면 서버에 저장된 영상 정보를 사용
+    subtitle: Optional[str] = None
 
 class QnARequest(BaseModel):
     query: str
     video_id: str
+    session_id: Optional[str] = None  # 대화 기록 키 (UI 세션마다 생성, 없으면 이전 대화 없이 답변)
 
 class PlaylistRequest(BaseModel):
     playlist_url: str
     start: int 
-    end: int
\ No newline at end of file
+    end: int
+
+class PlaylistIngestRequest(BaseModel):
+    playlist_url: str
+    start: int = 1
+    end: int
+    extract_concurrency: Optional[int] = None
+    ingest_concurrency: Optional[int] = None
@@ -14,5 +14,12 @@ class VideoInfoResponse(BaseModel):
 class PlaylistResponse(BaseModel):
     videos: List[Dict[str, Any]]
 
+class PlaylistPageResponse(BaseModel):
+    videos: List[Dict[str, Any]]
+    next_cursor: Optional[str] = None  # 마지막 페이지면 None
+    total: int
+    fetched_at: float
+    stale: bool = False  # TTL이 지나 백그라운드에서 갱신 중인 목록
+
 class SummarizeResponse(BaseModel):
     summary: str
\ No newline at end of file
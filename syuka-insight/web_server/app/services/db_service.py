@@ -1,11 +1,14 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, delete, update
+from sqlalchemy.dialects.postgresql import insert
 from datetime import datetime
-from models.youtube import Video, Subtitle
+from typing import List, Optional
+from models.youtube import Video, Subtitle, Summary
+from utils.vtt_parser import Cue
 
-async def save_video_info(db: AsyncSession, video_id: str, info: dict, subtitle: str):
-    """DB에 영상 정보 및 자막을 저장합니다."""
-    # videos 테이블에 영상 정보 저장
+async def save_video_info(db: AsyncSession, video_id: str, info: dict, cues: List[Cue]):
+    """DB에 영상 정보 및 자막(큐 단위)을 저장합니다."""
+    # videos 테이블에 영상 정보 저장 (이미 있으면 최신 정보로 갱신)
     result = await db.execute(select(Video).where(Video.video_id == video_id))
     video_obj = result.scalars().first()
     
@@ -17,26 +20,97 @@ async def save_video_info(db: AsyncSession, video_id: str, info: dict, subtitle:
             
         video_obj = Video(
             video_id=video_id,
-            title=info.get("title", ""),
             channel=info.get("channel", ""),
             upload_date=upload_date,
-            duration=int(info.get("duration", 0)),
-            view_count=int(info.get("view_count", 0)),
+            duration=int(info.get("duration") or 0),
         )
         db.add(video_obj)
-        await db.commit()
+
+    video_obj.title = info.get("title", "")
+    video_obj.view_count = int(info.get("view_count") or 0)
+    video_obj.duration_string = info.get("duration_string", "")
+    video_obj.chapters = info.get("chapters")
+    video_obj.refreshed_at = datetime.utcnow()
+    await db.commit()
     
-    # subtitles 테이블에 자막 정보 저장
-    if subtitle and subtitle.strip() and subtitle != "자막이 없습니다.":
-        result = await db.execute(select(Subtitle).where(Subtitle.video_id == video_id))
-        subtitle_obj = result.scalars().first()
-        
-        if not subtitle_obj:
-            subtitle_obj = Subtitle(
-                video_id=video_id,
-                start_time=0,
-                end_time=0,
-                subtitle_text=subtitle
-            )
-            db.add(subtitle_obj)
-            await db.commit()
\ No newline at end of file
+    # subtitles 테이블에 자막 저장: 기존 자막을 지우고 큐마다 한 행씩 일괄 삽입
+    if cues:
+        await db.execute(delete(Subtitle).where(Subtitle.video_id == video_id))
+        now = datetime.utcnow()
+        await db.execute(
+            insert(Subtitle),
+            [
+                {
+                    "video_id": video_id,
+                    "start_time": cue.start,
+                    "end_time": cue.end,
+                    "subtitle_text": cue.text,
+                    "created_at": now,
+                }
+                for cue in cues
+            ],
+        )
+        await db.commit()
+
+async def get_video(db: AsyncSession, video_id: str) -> Optional[Video]:
+    """저장된 영상 정보를 가져옵니다."""
+    result = await db.execute(select(Video).where(Video.video_id == video_id))
+    return result.scalars().first()
+
+async def update_video_stats(db: AsyncSession, video_id: str, info: dict):
+    """조회수 등 자주 바뀌는 영상 정보만 갱신합니다."""
+    await db.execute(
+        update(Video)
+        .where(Video.video_id == video_id)
+        .values(
+            title=info.get("title", ""),
+            view_count=int(info.get("view_count") or 0),
+            refreshed_at=datetime.utcnow(),
+        )
+    )
+    await db.commit()
+
+async def get_subtitle_cues(db: AsyncSession, video_id: str, start: Optional[float] = None, end: Optional[float] = None) -> List[Cue]:
+    """저장된 자막 큐를 시간순으로 가져옵니다. start/end(초)를 주면 그 구간과 겹치는 큐만 가져옵니다."""
+    stmt = select(Subtitle.start_time, Subtitle.end_time, Subtitle.subtitle_text).where(Subtitle.video_id == video_id)
+    if start is not None:
+        stmt = stmt.where(Subtitle.end_time >= start)
+    if end is not None:
+        stmt = stmt.where(Subtitle.start_time <= end)
+    result = await db.execute(stmt.order_by(Subtitle.start_time))
+    return [Cue(row.start_time, row.end_time, row.subtitle_text) for row in result]
+
+async def get_cached_summary(db: AsyncSession, video_id: str, prompt_hash: str, model_name: str, mode: str = "auto") -> Optional[str]:
+    """저장된 요약이 있으면 반환합니다."""
+    result = await db.execute(
+        select(Summary.summary_text).where(
+            Summary.video_id == video_id,
+            Summary.prompt_hash == prompt_hash,
+            Summary.model_name == model_name,
+            Summary.mode == mode,
+        )
+    )
+    return result.scalar_one_or_none()
+
+async def save_summary(db: AsyncSession, video_id: str, prompt_hash: str, model_name: str, summary: str, mode: str = "auto"):
+    """요약을 저장합니다. 같은 키의 요약이 있으면 덮어씁니다."""
+    stmt = insert(Summary).values(
+        video_id=video_id,
+        prompt_hash=prompt_hash,
+        model_name=model_name,
+        mode=mode,
+        summary_text=summary,
+        created_at=datetime.utcnow(),
+    )
+    stmt = stmt.on_conflict_do_update(
+        constraint="uq_summaries_key",
+        set_={"summary_text": stmt.excluded.summary_text, "created_at": stmt.excluded.created_at},
+    )
+    await db.execute(stmt)
+    await db.commit()
+
+async def delete_summaries(db: AsyncSession, video_id: str) -> int:
+    """영상의 저장된 요약을 모두 삭제하고 삭제한 개수를 반환합니다."""
+    result = await db.execute(delete(Summary).where(Summary.video_id == video_id))
+    await db.commit()
+    return result.rowcount
@@ -0,0 +1,139 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Optional
+import asyncio
+import multiprocessing
+import os
+import time
+from utils.metrics import EXTRACTION_SECONDS
+
+# yt-dlp 추출 전용 프로세스 수 (0이면 프로세스 대신 스레드에서 실행)
+EXTRACT_POOL_WORKERS = int(os.getenv("EXTRACT_POOL_WORKERS", "2"))
+# 실행 중 + 대기 중인 추출 작업의 최대 수 (넘으면 ExtractionQueueFull)
+EXTRACT_QUEUE_SIZE = int(os.getenv("EXTRACT_QUEUE_SIZE", "16"))
+# 추출 작업 하나의 최대 대기 시간 (초). 스레드 모드(EXTRACT_POOL_WORKERS=0)에서는 응답만 먼저 반환하고
+# 실행 중인 추출은 중단할 수 없어 스레드가 끝날 때까지 계속 실행됩니다.
+EXTRACT_TASK_TIMEOUT = float(os.getenv("EXTRACT_TASK_TIMEOUT", "120"))
+# 워커 하나가 이만큼 작업을 처리하면 풀을 새로 만들어 메모리 누수를 막음
+EXTRACT_MAX_TASKS_PER_WORKER = int(os.getenv("EXTRACT_MAX_TASKS_PER_WORKER", "50"))
+
+class ExtractionQueueFull(Exception):
+    """추출 대기열이 가득 찼을 때 발생합니다."""
+
+class ExtractionPool:
+    """yt-dlp 추출을 요청 스레드풀과 분리된 프로세스 풀에서 실행합니다.
+
+    - 대기열 크기를 넘는 요청은 바로 ExtractionQueueFull로 거절합니다.
+    - 작업마다 timeout을 적용하고, 시간이 초과되면 해당 풀의 워커 프로세스를 종료하고 이후 작업은 새 워커에서 실행합니다.
+      (같은 풀에서 실행 중이던 다른 작업도 함께 실패합니다.)
+    - 스레드 모드(workers=0)에서는 timeout이 지나도 실행 중인 추출을 취소할 수 없습니다.
+    - 워커당 max_tasks_per_worker개 작업을 처리하면 풀을 교체합니다. (Python 3.10에는 max_tasks_per_child가 없음)
+    """
+
+    def __init__(self, workers: int, queue_size: int, timeout: float, max_tasks_per_worker: int):
+        self.workers = workers
+        self.queue_size = queue_size
+        self.timeout = timeout
+        self.max_tasks_per_worker = max_tasks_per_worker
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._submitted = 0  # 현재 풀에 제출된 작업 수
+        self._pending = 0  # 실행 중 + 대기 중인 작업 수
+        self.completed = 0
+        self.rejected = 0
+        self.timed_out = 0
+        self.recycled = 0
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is not None and self._submitted >= self.workers * self.max_tasks_per_worker:
+            self._retire()
+        if self._executor is None:
+            # fork는 이벤트 루프/DB 연결 상태까지 복사하므로 spawn 사용
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")
+            )
+            self._submitted = 0
+        return self._executor
+
+    def _retire(self, terminate: bool = False):
+        """현재 풀을 새 작업에서 제외합니다.
+
+        terminate가 False면 실행 중인 작업이 끝난 뒤 워커가 종료됩니다.
+        True면 종료할 워커 프로세스 목록을 반환하며, 호출한 쪽에서 _terminate_processes로 종료해야 합니다.
+        """
+        executor = self._executor
+        if executor is None:
+            return []
+        self._executor = None
+        self.recycled += 1
+        # shutdown 이후에는 _processes가 비워질 수 있으므로 먼저 복사
+        processes = list((getattr(executor, "_processes", None) or {}).values()) if terminate else []
+        executor.shutdown(wait=False, cancel_futures=terminate)
+        return processes
+
+    @staticmethod
+    def _terminate_processes(processes, grace: float = 1.0):
+        """워커 프로세스를 종료합니다. grace초 안에 끝나지 않으면 강제 종료합니다."""
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+        for process in processes:
+            process.join(grace)
+            if process.is_alive():
+                process.kill()
+                process.join(grace)
+
+    async def run(self, func: Callable, *args):
+        """func(*args)를 추출 풀에서 실행하고 결과를 기다립니다. func는 모듈 수준 함수여야 합니다."""
+        if self._pending >= self.queue_size:
+            self.rejected += 1
+            raise ExtractionQueueFull("추출 대기열이 가득 찼습니다. 잠시 후 다시 시도해주세요.")
+
+        self._pending += 1
+        start = time.perf_counter()
+        outcome = "error"
+        try:
+            if self.workers <= 0:
+                future = asyncio.ensure_future(asyncio.to_thread(func, *args))
+                executor = None
+            else:
+                executor = self._get_executor()
+                future = asyncio.wrap_future(executor.submit(func, *args))
+                self._submitted += 1
+            try:
+                result = await asyncio.wait_for(future, self.timeout)
+            except asyncio.TimeoutError:
+                self.timed_out += 1
+                # 멈춘 워커 프로세스를 종료하고 다음 작업은 새 풀에서 실행
+                if executor is not None and executor is self._executor:
+                    processes = self._retire(terminate=True)
+                    await asyncio.to_thread(self._terminate_processes, processes)
+                outcome = "timeout"
+                raise
+            self.completed += 1
+            outcome = "ok"
+            return result
+        finally:
+            self._pending -= 1
+            EXTRACTION_SECONDS.labels(task=getattr(func, "__name__", "unknown"), outcome=outcome).observe(
+                time.perf_counter() - start
+            )
+
+    def shutdown(self):
+        self._terminate_processes(self._retire(terminate=True))
+
+    def stats(self):
+        return {
+            "workers": self.workers,
+            "queue_size": self.queue_size,
+            "pending": self._pending,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "timed_out": self.timed_out,
+            "recycled": self.recycled,
+        }
+
+extraction_pool = ExtractionPool(
+    workers=EXTRACT_POOL_WORKERS,
+    queue_size=EXTRACT_QUEUE_SIZE,
+    timeout=EXTRACT_TASK_TIMEOUT,
+    max_tasks_per_worker=EXTRACT_MAX_TASKS_PER_WORKER,
+)
@@ -1,49 +1,90 @@
-import requests
-import os
+from typing import List, Optional
+import time
+import json
+import httpx
 from fastapi import HTTPException
-import aiohttp
+from utils.http_client import (
+    model_get,
+    model_post,
+    model_stream,
+    SUMMARIZE_TIMEOUT,
+    CHAT_STREAM_TIMEOUT,
+    SUMMARIZE_STREAM_TIMEOUT,
+)
 
-MODEL_SERVER_URL = os.getenv("MODEL_SERVER_URL", "http://model-server:8001")
+# 요약 설정(모델 이름, 프롬프트 해시) 캐시 유지 시간 (초)
+SUMMARIZE_CONFIG_TTL = 60
+_summarize_config = {"value": None, "fetched_at": 0.0}
 
-def summarize_text(timeline: str, subtitle: str):
-    """텍스트 요약을 모델 서버에 요청합니다."""
+async def get_summarize_config():
+    """요약 캐시 키에 사용할 모델 서버의 모델 이름과 프롬프트 해시를 가져옵니다."""
+    now = time.monotonic()
+    if _summarize_config["value"] is None or now - _summarize_config["fetched_at"] > SUMMARIZE_CONFIG_TTL:
+        try:
+            response = await model_get("/summarize/config", name="summarize_config")
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            raise HTTPException(status_code=502, detail=str(e))
+        _summarize_config["value"] = response.json()
+        _summarize_config["fetched_at"] = now
+    return _summarize_config["value"]
+
+async def summarize_text(timeline: str, subtitle: str, segments: Optional[List[dict]] = None, mode: str = "auto"):
+    """텍스트 요약을 모델 서버에 요청합니다. segments(챕터별 자막)가 있으면 챕터 단위로 나눠 요약합니다."""
     try:
         # 요약 요청 페이로드 구성
         payload = {
             "timeline": timeline,
-            "subtitle": subtitle
+            "subtitle": subtitle,
+            "segments": segments,
+            "mode": mode
         }
 
         # 모델 서버에 요청
-        response = requests.post(f"{MODEL_SERVER_URL}/summarize", json=payload, timeout=30)
+        response = await model_post("/summarize", name="summarize", json=payload, timeout=SUMMARIZE_TIMEOUT)
         response.raise_for_status()
         return response.json()
-    except requests.RequestException as e:
+    except httpx.HTTPError as e:
         raise HTTPException(status_code=502, detail=str(e))
-    
-async def stream_chat(query: str, video_id: str):
+
+async def stream_chat(query: str, video_id: str, session_id: Optional[str] = None):
     """모델과의 스트리밍 채팅을 처리합니다."""
     try:
         # 요청 페이로드 구성
         payload = {
             "query": query,
-            "video_id": video_id
+            "video_id": video_id,
+            "session_id": session_id
         }
 
         # 모델 서버에 요청
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                f"{MODEL_SERVER_URL}/chat/stream", 
-                json=payload, 
-                timeout=60
-            ) as response:
-                if response.status != 200:
-                    error_text = await response.text()
-                    raise HTTPException(status_code=response.status, detail=error_text)
-                
-                # 모델 서버로부터 받은 스트리밍 응답을 그대로 클라이언트에 전달
-                async for chunk in response.content:
-                    if chunk:
-                        yield chunk.decode('utf-8')
+        async with model_stream("/chat/stream", name="chat_stream", json=payload, timeout=CHAT_STREAM_TIMEOUT) as response:
+            if response.status_code != 200:
+                error_text = (await response.aread()).decode("utf-8", errors="replace")
+                raise HTTPException(status_code=response.status_code, detail=error_text)
+
+            # 모델 서버로부터 받은 스트리밍 응답을 그대로 클라이언트에 전달
+            async for line in response.aiter_lines():
+                yield line + "\n"
+    except Exception as e:
+        yield f"data: 오류가 발생했습니다: {str(e)}"
+
+async def stream_summarize(timeline: str, subtitle: str, segments: Optional[List[dict]] = None, mode: str = "auto"):
+    """모델 서버의 요약 스트림(SSE)을 그대로 전달합니다."""
+    try:
+        payload = {
+            "timeline": timeline,
+            "subtitle": subtitle,
+            "segments": segments,
+            "mode": mode
+        }
+
+        async with model_stream("/summarize/stream", name="summarize_stream", json=payload, timeout=SUMMARIZE_STREAM_TIMEOUT) as response:
+            if response.status_code != 200:
+                error_text = (await response.aread()).decode("utf-8", errors="replace")
+                raise HTTPException(status_code=response.status_code, detail=error_text)
+
+            async for line in response.aiter_lines():
+                yield line + "\n"
     except Exception as e:
-        yield f"data: 오류가 발생했습니다: {str(e)}"
\ No newline at end of file
+        yield f"data: {json.dumps({'error': f'오류가 발생했습니다: {str(e)}'}, ensure_ascii=False)}\n\n"
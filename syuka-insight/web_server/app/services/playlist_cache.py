@@ -0,0 +1,125 @@
+from typing import Dict, List, Optional, Set, Tuple
+from services.extraction_pool import extraction_pool
+from services.youtube_service import list_playlist_videos
+from utils.cache_utils import LRUCache
+from utils.singleflight import request_coalescer
+import asyncio
+import base64
+import os
+import time
+
+# 이 시간(초)이 지나기 전에는 캐시된 목록을 그대로 사용
+PLAYLIST_CACHE_TTL = float(os.getenv("PLAYLIST_CACHE_TTL", "600"))
+# TTL이 지났어도 이 시간(초)까지는 캐시된 목록을 먼저 반환하고 백그라운드에서 갱신 (stale-while-revalidate)
+PLAYLIST_CACHE_STALE_TTL = float(os.getenv("PLAYLIST_CACHE_STALE_TTL", "86400"))
+# 플레이리스트마다 캐시할 최대 영상 수 (앞에서부터)
+PLAYLIST_CACHE_MAX_ITEMS = int(os.getenv("PLAYLIST_CACHE_MAX_ITEMS", "200"))
+# 캐시할 플레이리스트 수
+PLAYLIST_CACHE_MAX_SIZE = int(os.getenv("PLAYLIST_CACHE_MAX_SIZE", "32"))
+# 한 페이지 기본/최대 영상 수
+PLAYLIST_PAGE_SIZE = 6
+PLAYLIST_MAX_PAGE_SIZE = 50
+
+class InvalidCursor(ValueError):
+    """해석할 수 없는 페이지 커서"""
+
+# playlist_url -> (영상 목록, 가져온 시각)
+playlist_cache = LRUCache(max_size=PLAYLIST_CACHE_MAX_SIZE, ttl=PLAYLIST_CACHE_STALE_TTL)
+
+# 백그라운드 갱신 태스크 (태스크가 GC되지 않도록 참조 유지)
+_refresh_tasks: Set[asyncio.Task] = set()
+
+def encode_cursor(offset: int, last_url: str) -> str:
+    """다음 페이지 위치와 마지막으로 반환한 영상 URL을 커서로 만듭니다."""
+    return base64.urlsafe_b64encode(f"a:{offset}:{last_url}".encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: str) -> Tuple[int, str]:
+    """커서를 (다음 페이지 위치, 마지막으로 반환한 영상 URL)로 해석합니다."""
+    try:
+        value = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        prefix, offset, last_url = value.split(":", 2)
+        if prefix != "a" or int(offset) < 1 or not last_url:
+            raise ValueError(value)
+        return int(offset), last_url
+    except (ValueError, UnicodeDecodeError) as e:
+        raise InvalidCursor(f"잘못된 커서입니다: {cursor}") from e
+
+def resolve_cursor(videos: List[Dict], offset: int, last_url: str) -> int:
+    """현재 목록에서 커서가 가리키는 다음 위치를 찾습니다.
+
+    갱신으로 앞쪽에 새 영상이 추가되면 위치가 밀리므로 마지막으로 반환한 영상 바로 다음부터 이어갑니다.
+    그 영상이 목록에서 사라졌으면 저장된 위치를 사용합니다.
+    """
+    if 0 < offset <= len(videos) and videos[offset - 1].get("url") == last_url:
+        return offset
+    for i, video in enumerate(videos):
+        if video.get("url") == last_url:
+            return i + 1
+    return offset
+
+async def _fetch_playlist(playlist_url: str) -> List[Dict]:
+    """yt-dlp로 플레이리스트를 가져와 캐시에 저장합니다. 같은 플레이리스트의 동시 요청은 한 번만 가져옵니다."""
+    async def fetch():
+        videos = await extraction_pool.run(list_playlist_videos, playlist_url, 1, PLAYLIST_CACHE_MAX_ITEMS)
+        if videos:
+            playlist_cache.set(playlist_url, (videos, time.time()))
+        return videos
+
+    return await request_coalescer.do(("playlist", playlist_url), fetch)
+
+async def _refresh_playlist(playlist_url: str):
+    try:
+        await _fetch_playlist(playlist_url)
+    except Exception as e:
+        print(f"플레이리스트 갱신 중 오류 발생: {e}")
+
+async def get_playlist_videos(playlist_url: str) -> Tuple[List[Dict], float, bool]:
+    """캐시된 플레이리스트 영상 목록을 (목록, 가져온 시각, stale 여부)로 반환합니다.
+
+    TTL이 지난 목록은 바로 반환하고 백그라운드에서 갱신합니다. 캐시에 없으면 yt-dlp로 가져옵니다.
+    """
+    cached = playlist_cache.get(playlist_url)
+    if cached is not None:
+        videos, fetched_at = cached
+        stale = time.time() - fetched_at > PLAYLIST_CACHE_TTL
+        if stale:
+            task = asyncio.create_task(_refresh_playlist(playlist_url))
+            _refresh_tasks.add(task)
+            task.add_done_callback(_refresh_tasks.discard)
+        return videos, fetched_at, stale
+
+    videos = await _fetch_playlist(playlist_url)
+    return videos, time.time(), False
+
+async def get_playlist_page(playlist_url: str, cursor: Optional[str] = None, limit: int = PLAYLIST_PAGE_SIZE) -> Dict:
+    """플레이리스트 영상 목록의 한 페이지와 다음 페이지 커서를 반환합니다.
+
+    커서는 마지막으로 반환한 영상을 기준으로 하므로 목록이 갱신되어도 영상이 반복되거나 빠지지 않습니다.
+    """
+    anchor = decode_cursor(cursor) if cursor else None
+    limit = max(1, min(limit, PLAYLIST_MAX_PAGE_SIZE))
+
+    videos, fetched_at, stale = await get_playlist_videos(playlist_url)
+    offset = resolve_cursor(videos, *anchor) if anchor else 0
+    page = videos[offset:offset + limit]
+    next_offset = offset + len(page)
+
+    return {
+        "videos": page,
+        "next_cursor": encode_cursor(next_offset, page[-1]["url"]) if page and next_offset < len(videos) else None,
+        "total": len(videos),
+        "fetched_at": fetched_at,
+        "stale": stale,
+    }
+
+async def get_playlist_range(playlist_url: str, start: int, end: int) -> List[Dict]:
+    """yt-dlp의 playliststart/playlistend(1부터 시작, end 포함)와 같은 범위의 영상 목록을 반환합니다."""
+    if end > PLAYLIST_CACHE_MAX_ITEMS:
+        # 캐시 범위를 넘으면 직접 가져옴
+        return await extraction_pool.run(list_playlist_videos, playlist_url, start, end)
+
+    videos, _, _ = await get_playlist_videos(playlist_url)
+    return videos[max(start - 1, 0):end]
+
+def get_playlist_cache_stats():
+    return playlist_cache.stats()
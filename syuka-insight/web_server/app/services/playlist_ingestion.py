@@ -0,0 +1,201 @@
+from typing import Dict, List, Optional
+from services.extraction_pool import extraction_pool
+from services.video_info_service import load_video_info
+from utils.http_client import model_get, model_post, SUBMIT_TIMEOUT
+from utils.youtube_utils import get_videos_from_playlist, get_canonical_video_url
+import asyncio
+import os
+import time
+import uuid
+
+# 단계별 동시 실행 수 (자막 추출 / ChromaDB 생성)
+PLAYLIST_EXTRACT_CONCURRENCY = int(os.getenv("PLAYLIST_EXTRACT_CONCURRENCY", "2"))
+PLAYLIST_INGEST_CONCURRENCY = int(os.getenv("PLAYLIST_INGEST_CONCURRENCY", "2"))
+
+# 모델 서버 작업 상태 확인 주기 및 최대 대기 시간 (초)
+JOB_POLL_INTERVAL = 2.0
+JOB_TIMEOUT = 1800
+
+# 완료된 실행 정보를 보관하는 시간 (초)과 최대 보관 개수
+PLAYLIST_RUN_RETENTION = float(os.getenv("PLAYLIST_RUN_RETENTION", "3600"))
+PLAYLIST_RUNS_MAX = int(os.getenv("PLAYLIST_RUNS_MAX", "100"))
+
+class PlaylistIngestionRun:
+    """플레이리스트 일괄 수집 실행의 진행 상황"""
+
+    def __init__(self, playlist_url: str, start: int, end: int):
+        self.run_id = uuid.uuid4().hex
+        self.playlist_url = playlist_url
+        self.start = start
+        self.end = end
+        self.status = "running"  # running | completed | failed
+        self.total = 0
+        self.results: List[Dict] = []
+        self.message = ""
+        self.started_at = time.time()
+        self.finished_at: Optional[float] = None
+        self.task: Optional[asyncio.Task] = None
+
+    def record(self, video_id: str, title: str, status: str, message: str = ""):
+        """영상 하나의 처리 결과를 기록합니다. (status: succeeded | skipped | failed)"""
+        self.results.append({"video_id": video_id, "title": title, "status": status, "message": message})
+
+    def count(self, status: str) -> int:
+        return sum(1 for r in self.results if r["status"] == status)
+
+    def to_dict(self) -> Dict:
+        elapsed = (self.finished_at or time.time()) - self.started_at
+        processed = self.count("succeeded")
+        return {
+            "run_id": self.run_id,
+            "playlist_url": self.playlist_url,
+            "start": self.start,
+            "end": self.end,
+            "status": self.status,
+            "message": self.message,
+            "total": self.total,
+            "succeeded": processed,
+            "skipped": self.count("skipped"),
+            "failed": self.count("failed"),
+            "elapsed_seconds": round(elapsed, 1),
+            "videos_per_minute": round(processed / elapsed * 60, 2) if elapsed > 0 else 0.0,
+            "results": self.results,
+        }
+
+# run_id -> 실행 정보
+playlist_runs: Dict[str, PlaylistIngestionRun] = {}
+
+def _purge_finished_runs():
+    """보관 시간이 지났거나 최대 개수를 넘은 완료 실행을 오래된 순서로 삭제합니다."""
+    now = time.time()
+    finished = sorted(
+        (run for run in playlist_runs.values() if run.finished_at is not None),
+        key=lambda run: run.finished_at,
+    )
+    overflow = len(playlist_runs) - PLAYLIST_RUNS_MAX
+    for run in finished:
+        if now - run.finished_at > PLAYLIST_RUN_RETENTION or overflow > 0:
+            del playlist_runs[run.run_id]
+            overflow -= 1
+
+def validate_concurrency(extract_concurrency: int, ingest_concurrency: int):
+    """동시 실행 수가 1 이상인지 확인합니다. (0 이하면 작업자가 없어 실행이 끝나지 않음)"""
+    if extract_concurrency < 1 or ingest_concurrency < 1:
+        raise ValueError("extract_concurrency와 ingest_concurrency는 1 이상이어야 합니다.")
+
+async def _is_indexed(video_id: str) -> bool:
+    """모델 서버에 이미 ChromaDB가 있는 영상인지 확인합니다."""
+    response = await model_get(f"/chromadb_videos/{video_id}", name="chromadb_exists")
+    response.raise_for_status()
+    return response.json().get("exists", False)
+
+async def _ingest(video) -> Dict:
+    """모델 서버에 ChromaDB 생성 작업을 등록하고 끝날 때까지 기다립니다."""
+    payload = {"video_id": video.video_id, "title": video.title, "subtitle": video.subtitle}
+    response = await model_post("/create_chromadb", name="create_chromadb", json=payload, timeout=SUBMIT_TIMEOUT)
+    response.raise_for_status()
+    job = response.json()
+
+    deadline = time.monotonic() + JOB_TIMEOUT
+    while job["status"] in ("queued", "running"):
+        if time.monotonic() > deadline:
+            return {"status": "failed", "message": "ChromaDB 생성 대기 시간 초과"}
+        await asyncio.sleep(JOB_POLL_INTERVAL)
+        response = await model_get(f"/jobs/{job['job_id']}", name="jobs")
+        response.raise_for_status()
+        job = response.json()
+    return job
+
+async def run_playlist_ingestion(
+    playlist_url: str,
+    start: int,
+    end: int,
+    extract_concurrency: int = PLAYLIST_EXTRACT_CONCURRENCY,
+    ingest_concurrency: int = PLAYLIST_INGEST_CONCURRENCY,
+    run: Optional[PlaylistIngestionRun] = None,
+) -> PlaylistIngestionRun:
+    """플레이리스트의 영상들을 자막 추출 → ChromaDB 생성 파이프라인으로 일괄 수집합니다.
+
+    자막 추출 단계와 ChromaDB 생성 단계가 큐로 연결되어 동시에 진행됩니다.
+    영상 정보는 /video/info와 같은 경로로 가져와 DB에 저장하므로, 이후 video_id만으로 요약/ChromaDB 생성이 가능합니다.
+    """
+    validate_concurrency(extract_concurrency, ingest_concurrency)
+    run = run or PlaylistIngestionRun(playlist_url, start, end)
+    try:
+        entries = await extraction_pool.run(get_videos_from_playlist, playlist_url, start, end)
+        run.total = len(entries)
+
+        extract_queue: asyncio.Queue = asyncio.Queue()
+        for entry in entries:
+            extract_queue.put_nowait(entry)
+        # 생성 단계가 밀리면 추출 단계도 대기하도록 크기 제한
+        ingest_queue: asyncio.Queue = asyncio.Queue(maxsize=ingest_concurrency * 2)
+
+        async def extract_worker():
+            while not extract_queue.empty():
+                entry = extract_queue.get_nowait()
+                video_id = entry.get("id", "")
+                title = entry.get("title", "")
+                try:
+                    if await _is_indexed(video_id):
+                        run.record(video_id, title, "skipped", "이미 ChromaDB가 있습니다.")
+                        continue
+                    video_url = get_canonical_video_url(video_id) if video_id else entry.get("url", "")
+                    video = await load_video_info(video_url)
+                    if video is None or not video.subtitle or video.subtitle == "자막이 없습니다.":
+                        run.record(video_id, title, "failed", "자막을 가져오지 못했습니다.")
+                        continue
+                    await ingest_queue.put(video)
+                except Exception as e:
+                    run.record(video_id, title, "failed", str(e))
+
+        async def ingest_worker():
+            while True:
+                video = await ingest_queue.get()
+                if video is None:
+                    return
+                try:
+                    job = await _ingest(video)
+                    status = "succeeded" if job["status"] == "succeeded" else "failed"
+                    run.record(video.video_id, video.title, status, job.get("message", ""))
+                except Exception as e:
+                    run.record(video.video_id, video.title, "failed", str(e))
+
+        extractors = [asyncio.create_task(extract_worker()) for _ in range(extract_concurrency)]
+        ingestors = [asyncio.create_task(ingest_worker()) for _ in range(ingest_concurrency)]
+        await asyncio.gather(*extractors)
+        for _ in ingestors:
+            await ingest_queue.put(None)
+        await asyncio.gather(*ingestors)
+
+        run.status = "completed"
+    except Exception as e:
+        run.status = "failed"
+        run.message = str(e)
+    finally:
+        run.finished_at = time.time()
+    return run
+
+def start_playlist_ingestion(
+    playlist_url: str,
+    start: int,
+    end: int,
+    extract_concurrency: Optional[int] = None,
+    ingest_concurrency: Optional[int] = None,
+) -> PlaylistIngestionRun:
+    """플레이리스트 일괄 수집을 백그라운드 태스크로 시작합니다. 동시 실행 수가 0 이하면 ValueError를 발생시킵니다."""
+    extract_concurrency = PLAYLIST_EXTRACT_CONCURRENCY if extract_concurrency is None else extract_concurrency
+    ingest_concurrency = PLAYLIST_INGEST_CONCURRENCY if ingest_concurrency is None else ingest_concurrency
+    validate_concurrency(extract_concurrency, ingest_concurrency)
+
+    _purge_finished_runs()
+    run = PlaylistIngestionRun(playlist_url, start, end)
+    playlist_runs[run.run_id] = run
+    run.task = asyncio.create_task(
+        run_playlist_ingestion(playlist_url, start, end, extract_concurrency, ingest_concurrency, run=run)
+    )
+    return run
+
+def get_playlist_run(run_id: str) -> Optional[PlaylistIngestionRun]:
+    """run_id에 해당하는 일괄 수집 실행 정보를 반환합니다."""
+    return playlist_runs.get(run_id)
@@ -0,0 +1,146 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional, Set
+from datetime import datetime
+from models.database import AsyncSessionLocal
+from models.youtube import Video
+from schemas.responses import VideoInfoResponse
+from services.youtube_service import fetch_video, fetch_video_metadata, build_video_response
+from services.extraction_pool import extraction_pool
+from services.db_service import save_video_info, get_video, get_subtitle_cues, update_video_stats
+from utils.cache_utils import LRUCache
+from utils.metrics import VIDEO_INFO_SOURCE
+from utils.singleflight import request_coalescer
+from utils.youtube_utils import extract_video_id, get_canonical_video_url, generate_markdown_timeline, build_chapter_segments
+from utils.vtt_parser import cues_to_text
+import asyncio
+import os
+
+# 메모리 캐시 최대 항목 수
+VIDEO_INFO_CACHE_MAX_SIZE = int(os.getenv("VIDEO_INFO_CACHE_MAX_SIZE", "256"))
+# 조회수 등 변하는 정보를 다시 가져오는 주기 (초)
+VIDEO_INFO_REFRESH_TTL = float(os.getenv("VIDEO_INFO_REFRESH_TTL", "3600"))
+
+# video_id -> VideoInfoResponse (TTL이 지나면 DB를 다시 확인하고 필요하면 갱신)
+video_info_cache = LRUCache(max_size=VIDEO_INFO_CACHE_MAX_SIZE, ttl=VIDEO_INFO_REFRESH_TTL)
+
+# 백그라운드 갱신 중인 video_id와 태스크 (태스크가 GC되지 않도록 참조 유지)
+_refreshing: Set[str] = set()
+_refresh_tasks: Set[asyncio.Task] = set()
+
+def build_response_from_db(video: Video, cues) -> VideoInfoResponse:
+    """DB에 저장된 영상 정보와 자막 큐로 응답 데이터를 만듭니다."""
+    return VideoInfoResponse(
+        video_id=video.video_id,
+        title=video.title,
+        channel=video.channel,
+        view_count=video.view_count,
+        upload_date=video.upload_date.strftime("%Y.%m.%d") if video.upload_date else "",
+        duration_string=video.duration_string or "",
+        timeline=generate_markdown_timeline(video.chapters),
+        subtitle=cues_to_text(cues),
+    )
+
+async def refresh_video_stats(video_id: str):
+    """조회수 등 자주 바뀌는 영상 정보를 yt-dlp로 다시 가져와 DB와 캐시에 반영합니다."""
+    if video_id in _refreshing:
+        return
+    _refreshing.add(video_id)
+    try:
+        info = await extraction_pool.run(fetch_video_metadata, get_canonical_video_url(video_id))
+        if not info:
+            return
+        async with AsyncSessionLocal() as db:
+            await update_video_stats(db, video_id, info)
+
+        cached = video_info_cache.get(video_id)
+        if cached is not None:
+            video_info_cache.set(
+                video_id,
+                cached.model_copy(update={"title": info.get("title", ""), "view_count": info.get("view_count", 0)}),
+            )
+    except Exception as e:
+        print(f"영상 정보 갱신 중 오류 발생: {e}")
+    finally:
+        _refreshing.discard(video_id)
+
+async def get_video_info_cached(db: AsyncSession, video_url: str) -> Optional[VideoInfoResponse]:
+    """메모리 캐시 → DB → yt-dlp 순서로 영상 정보와 자막을 가져옵니다.
+
+    DB의 정보가 오래되었으면 저장된 정보를 바로 반환하고 조회수 등은 백그라운드에서 갱신합니다.
+    영상 정보를 가져오지 못하면 None을 반환합니다.
+    """
+    video_id = extract_video_id(video_url)
+
+    if video_id:
+        cached = video_info_cache.get(video_id)
+        if cached is not None:
+            VIDEO_INFO_SOURCE.labels(source="memory").inc()
+            return cached
+
+        video = await get_video(db, video_id)
+        if video is not None:
+            cues = await get_subtitle_cues(db, video_id)
+            if cues:
+                result = build_response_from_db(video, cues)
+                video_info_cache.set(video_id, result)
+                VIDEO_INFO_SOURCE.labels(source="db").inc()
+
+                refreshed_at = video.refreshed_at or video.created_at
+                if refreshed_at is None or (datetime.utcnow() - refreshed_at).total_seconds() > VIDEO_INFO_REFRESH_TTL:
+                    task = asyncio.create_task(refresh_video_stats(video_id))
+                    _refresh_tasks.add(task)
+                    task.add_done_callback(_refresh_tasks.discard)
+                return result
+
+    # 캐시와 DB에 없으면 추출 프로세스 풀에서 yt-dlp로 추출
+    info, cues = await extraction_pool.run(
+        fetch_video, get_canonical_video_url(video_id) if video_id else video_url
+    )
+    if not info:
+        return None
+
+    VIDEO_INFO_SOURCE.labels(source="ytdlp").inc()
+    result = build_video_response(info, cues)
+
+    # 영상 정보와 자막 큐를 DB에 저장 (실패해도 응답은 반환)
+    try:
+        await save_video_info(db, result.video_id, info, cues)
+    except Exception as e:
+        await db.rollback()
+        print(f"영상 정보 저장 중 오류 발생: {e}")
+
+    video_info_cache.set(result.video_id, result)
+    return result
+
+async def load_video_info(video_url: str) -> Optional[VideoInfoResponse]:
+    """get_video_info_cached를 별도 세션으로 실행합니다. 같은 영상에 대한 동시 요청은 하나의 결과를 함께 받습니다."""
+    async def load():
+        # 공유 실행이므로 요청에 묶인 세션 대신 별도 세션 사용
+        async with AsyncSessionLocal() as db:
+            return await get_video_info_cached(db, video_url)
+
+    key = ("video_info", extract_video_id(video_url) or video_url)
+    return await request_coalescer.do(key, load)
+
+async def get_video_source(video_id: str) -> Optional[dict]:
+    """요약/ChromaDB 생성에 사용할 제목, 타임라인, 자막, 챕터별 자막을 서버에 저장된 데이터에서 가져옵니다.
+
+    /video/info로 한 번도 가져오지 않은 영상이면 None을 반환합니다.
+    """
+    async with AsyncSessionLocal() as db:
+        video = await get_video(db, video_id)
+        cues = await get_subtitle_cues(db, video_id) if video is not None else []
+
+    if cues:
+        return {
+            "title": video.title,
+            "timeline": generate_markdown_timeline(video.chapters),
+            "subtitle": cues_to_text(cues),
+            "segments": build_chapter_segments(video.chapters, cues),
+        }
+
+    # DB 저장에 실패한 경우 메모리 캐시 사용 (챕터별 자막 없음)
+    cached = video_info_cache.get(video_id)
+    if cached is not None and cached.subtitle and cached.subtitle != "자막이 없습니다.":
+        return {"title": cached.title, "timeline": cached.timeline, "subtitle": cached.subtitle, "segments": None}
+    return None
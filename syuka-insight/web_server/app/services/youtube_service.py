@@ -1,19 +1,35 @@
 from utils.youtube_utils import (
     get_video_info_and_subtitles,
+    get_video_metadata,
     generate_markdown_timeline,
     get_videos_from_playlist,
     format_view_count,
     format_upload_date
 )
+from utils.vtt_parser import cues_to_text
 from schemas.responses import VideoInfoResponse, PlaylistResponse
 
-def process_video_url(video_url: str):
-    """비디오 URL을 처리하여 정보와 자막을 반환합니다."""
-    info, clean_subtitle = get_video_info_and_subtitles(video_url)
-    
-    if not info:
-        return {"error": "영상 정보를 가져오는데 실패했습니다."}
+# 응답/DB 저장에 사용하는 영상 정보 필드 (추출 프로세스에서 돌려받는 데이터를 줄이기 위함)
+VIDEO_INFO_FIELDS = ("id", "title", "channel", "view_count", "upload_date", "duration", "duration_string", "chapters")
 
+def slim_video_info(info: dict):
+    """yt-dlp 영상 정보에서 사용하는 필드만 남깁니다. (formats 등 큰 데이터 제외)"""
+    return {key: info[key] for key in VIDEO_INFO_FIELDS if key in info}
+
+def fetch_video(video_url: str):
+    """비디오 URL에서 영상 정보와 자막 큐 목록을 가져옵니다."""
+    info, cues = get_video_info_and_subtitles(video_url)
+    if isinstance(info, dict):
+        info = slim_video_info(info)
+    return info, cues
+
+def fetch_video_metadata(video_url: str):
+    """자막 없이 영상 정보만 가져옵니다. 실패하면 None을 반환합니다."""
+    info = get_video_metadata(video_url)
+    return slim_video_info(info) if info else None
+
+def build_video_response(info: dict, cues):
+    """영상 정보와 자막 큐 목록으로 응답 데이터를 만듭니다."""
     result = {
         "video_id": info.get("id", ""),
         "title": info.get("title", ""),
@@ -22,37 +38,48 @@ def process_video_url(video_url: str):
         "upload_date": format_upload_date(info.get("upload_date", "")),
         "duration_string": info.get("duration_string", ""),
         "timeline": generate_markdown_timeline(info.get("chapters")) if "chapters" in info else "타임라인 정보가 없습니다.",
-        "subtitle": clean_subtitle,
+        "subtitle": cues_to_text(cues) if cues else "자막이 없습니다.",
     }
     
     # 응답 데이터 준비
     return VideoInfoResponse(**result)
 
+def process_video_url(video_url: str):
+    """비디오 URL을 처리하여 정보와 자막을 반환합니다."""
+    info, cues = fetch_video(video_url)
+    
+    if not info:
+        return {"error": "영상 정보를 가져오는데 실패했습니다."}
+
+    return build_video_response(info, cues)
+
+def format_playlist_entry(video_info: dict):
+    """플레이리스트 항목을 화면 표시용 데이터로 변환합니다."""
+    thumbnails = video_info.get("thumbnails", [])
+    thumbnail_url = thumbnails[-1]["url"] if thumbnails else None
+    duration = video_info.get("duration", 0)
+    formatted_duration = f"{duration // 60:02}:{duration % 60:02}"
+    formatted_view_count = format_view_count(video_info["view_count"])
+
+    return {
+        "title": video_info["title"],
+        "url": video_info["url"],
+        "thumbnail_url": thumbnail_url,
+        "formatted_duration": formatted_duration,
+        "view_count": video_info["view_count"],
+        "formatted_view_count": formatted_view_count,
+    }
+
+def list_playlist_videos(playlist_url: str, start: int, end: int):
+    """플레이리스트의 비디오 목록을 화면 표시용 데이터 목록으로 반환합니다. 실패하면 빈 목록을 반환합니다."""
+    return [format_playlist_entry(video_info) for video_info in get_videos_from_playlist(playlist_url, start, end)]
+
 def process_playlist(playlist_url: str, start: int, end: int):
     """플레이리스트 URL을 처리하여 비디오 목록을 반환합니다."""
-    videos_info = get_videos_from_playlist(playlist_url, start, end) # start=0, end=6 기본값
+    videos = list_playlist_videos(playlist_url, start, end) # start=0, end=6 기본값
 
-    if not videos_info:
+    if not videos:
         return {"error": "플레이리스트 정보를 가져오는데 실패했습니다."}
-    
-    videos = []
-    for video_info in videos_info:
-        thumbnails = video_info.get("thumbnails", [])
-        thumbnail_url = thumbnails[-1]["url"] if thumbnails else None
-        duration = video_info.get("duration", 0)
-        formatted_duration = f"{duration // 60:02}:{duration % 60:02}"
-        formatted_view_count = format_view_count(video_info["view_count"])
-
-        videos.append(
-            {
-                "title": video_info["title"],
-                "url": video_info["url"],
-                "thumbnail_url": thumbnail_url,
-                "formatted_duration": formatted_duration,
-                "view_count": video_info["view_count"],
-                "formatted_view_count": formatted_view_count,
-            }
-        )
 
     # 응답 데이터 준비
-    return PlaylistResponse(videos=videos)
\ No newline at end of file
+    return PlaylistResponse(videos=videos)
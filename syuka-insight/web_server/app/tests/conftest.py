@@ -0,0 +1,11 @@
+"""웹 서버 테스트 공통 설정
+
+실행 (web_server/app에서):
+    pip install pytest
+    python -m pytest -q tests
+"""
+import os
+import sys
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, APP_DIR)
@@ -0,0 +1,61 @@
+"""WebVTT 파서(iter_vtt_cues)가 자동 자막의 반복 줄, 태그, 설정 줄을 처리하는지 확인합니다."""
+from utils.vtt_parser import Cue, iter_vtt_cues, parse_timestamp, vtt_to_text
+
+HEADER = "WEBVTT\nKind: captions\nLanguage: ko\n\n"
+
+def test_parse_timestamp():
+    assert parse_timestamp("00:01:02.500") == 62.5
+    assert parse_timestamp("01:02.500") == 62.5
+    assert parse_timestamp("1:00:00.000") == 3600.0
+
+def test_header_and_settings_lines_are_not_text():
+    content = HEADER + (
+        "NOTE 메모는 무시\n"
+        "\n"
+        "STYLE\n"
+        "::cue { color: white }\n"
+        "\n"
+        "1\n"
+        "00:00:01.000 --> 00:00:03.000 align:start position:0%\n"
+        "안녕하세요\n"
+    )
+    assert list(iter_vtt_cues(content)) == [Cue(1.0, 3.0, "안녕하세요")]
+
+def test_inline_tags_are_removed():
+    content = HEADER + (
+        "00:00:01.000 --> 00:00:03.000\n"
+        "<c>금리가</c><00:00:01.500><c> 오르면</c>\n"
+    )
+    assert [cue.text for cue in iter_vtt_cues(content)] == ["금리가 오르면"]
+
+def test_rolling_duplicates_are_dropped():
+    # 자동 자막은 이전 줄을 다음 큐 첫 줄로 반복함
+    content = HEADER + (
+        "00:00:01.000 --> 00:00:03.000 align:start position:0%\n"
+        "첫 번째 줄\n"
+        "\n"
+        "00:00:03.000 --> 00:00:03.010 align:start position:0%\n"
+        "첫 번째 줄\n"
+        " \n"
+        "\n"
+        "00:00:03.010 --> 00:00:05.000 align:start position:0%\n"
+        "첫 번째 줄\n"
+        "두 번째 줄\n"
+    )
+    cues = list(iter_vtt_cues(content))
+    assert cues == [Cue(1.0, 3.0, "첫 번째 줄"), Cue(3.01, 5.0, "두 번째 줄")]
+    assert vtt_to_text(content) == "첫 번째 줄\n두 번째 줄"
+
+def test_line_repeated_outside_window_is_kept():
+    # 같은 말이 dedupe_window개 줄 이후에 다시 나오면 실제로 다시 말한 것으로 보고 남김
+    lines = ["네", "하나", "둘", "셋", "네"]
+    content = HEADER + "\n".join(
+        f"00:00:0{i}.000 --> 00:00:0{i + 1}.000\n{text}\n" for i, text in enumerate(lines)
+    )
+    assert [cue.text for cue in iter_vtt_cues(content, dedupe_window=3)] == lines
+    # 창 안에서 반복되면 버림
+    assert [cue.text for cue in iter_vtt_cues(content, dedupe_window=4)] == lines[:4]
+
+def test_accepts_line_iterable():
+    lines = (HEADER + "00:00:01.000 --> 00:00:02.000\n자막\n").splitlines(keepends=True)
+    assert list(iter_vtt_cues(iter(lines))) == [Cue(1.0, 2.0, "자막")]
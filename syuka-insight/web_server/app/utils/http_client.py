@@ -0,0 +1,121 @@
+from contextlib import asynccontextmanager
+from typing import Dict, Optional
+import asyncio
+import os
+import time
+
+import httpx
+
+from utils.metrics import MODEL_CALL_SECONDS
+
+MODEL_SERVER_URL = os.getenv("MODEL_SERVER_URL", "http://model-server:8001")
+
+# 모델 서버 연결 풀 설정
+MODEL_HTTP_MAX_CONNECTIONS = int(os.getenv("MODEL_HTTP_MAX_CONNECTIONS", "100"))
+MODEL_HTTP_MAX_KEEPALIVE = int(os.getenv("MODEL_HTTP_MAX_KEEPALIVE", "20"))
+MODEL_HTTP_KEEPALIVE_EXPIRY = float(os.getenv("MODEL_HTTP_KEEPALIVE_EXPIRY", "30"))
+MODEL_HTTP_CONNECT_TIMEOUT = float(os.getenv("MODEL_HTTP_CONNECT_TIMEOUT", "5"))
+# 멱등 요청(GET) 재시도 횟수와 대기 시간 (초, 재시도마다 2배)
+MODEL_HTTP_RETRIES = int(os.getenv("MODEL_HTTP_RETRIES", "2"))
+MODEL_HTTP_RETRY_BACKOFF = float(os.getenv("MODEL_HTTP_RETRY_BACKOFF", "0.2"))
+
+# 라우트별 타임아웃 (스트림의 read는 청크 사이 최대 대기 시간)
+DEFAULT_TIMEOUT = httpx.Timeout(10.0, connect=MODEL_HTTP_CONNECT_TIMEOUT)
+SUBMIT_TIMEOUT = httpx.Timeout(30.0, connect=MODEL_HTTP_CONNECT_TIMEOUT)
+SUMMARIZE_TIMEOUT = httpx.Timeout(120.0, connect=MODEL_HTTP_CONNECT_TIMEOUT)
+CHAT_STREAM_TIMEOUT = httpx.Timeout(60.0, connect=MODEL_HTTP_CONNECT_TIMEOUT)
+SUMMARIZE_STREAM_TIMEOUT = httpx.Timeout(300.0, connect=MODEL_HTTP_CONNECT_TIMEOUT)
+
+# 재시도할 응답 상태 코드
+RETRY_STATUS_CODES = {502, 503, 504}
+
+_client: Optional[httpx.AsyncClient] = None
+
+# 요청 이름 -> 지연 시간 통계 (스트림은 응답 헤더를 받기까지의 시간)
+latency_stats: Dict[str, Dict[str, float]] = {}
+
+def get_model_client() -> httpx.AsyncClient:
+    """앱 전체가 함께 쓰는 모델 서버 클라이언트를 반환합니다. (keep-alive 연결 재사용)"""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            base_url=MODEL_SERVER_URL,
+            timeout=DEFAULT_TIMEOUT,
+            limits=httpx.Limits(
+                max_connections=MODEL_HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=MODEL_HTTP_MAX_KEEPALIVE,
+                keepalive_expiry=MODEL_HTTP_KEEPALIVE_EXPIRY,
+            ),
+        )
+    return _client
+
+async def close_model_client():
+    """모델 서버 클라이언트의 연결을 모두 닫습니다."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+def _record_latency(name: str, elapsed: float, failed: bool = False):
+    stats = latency_stats.setdefault(name, {"count": 0, "errors": 0, "total_ms": 0.0, "max_ms": 0.0})
+    stats["count"] += 1
+    stats["errors"] += int(failed)
+    stats["total_ms"] += elapsed * 1000
+    stats["max_ms"] = max(stats["max_ms"], elapsed * 1000)
+    MODEL_CALL_SECONDS.labels(call=name, outcome="error" if failed else "ok").observe(elapsed)
+
+def get_latency_stats():
+    """요청 이름별 호출 수, 오류 수, 평균/최대 지연 시간(ms)을 반환합니다."""
+    return {
+        name: {
+            "count": stats["count"],
+            "errors": stats["errors"],
+            "avg_ms": round(stats["total_ms"] / stats["count"], 2) if stats["count"] else 0.0,
+            "max_ms": round(stats["max_ms"], 2),
+        }
+        for name, stats in latency_stats.items()
+    }
+
+async def model_get(path: str, name: str, timeout: httpx.Timeout = DEFAULT_TIMEOUT, **kwargs) -> httpx.Response:
+    """모델 서버에 GET 요청을 보냅니다. 연결 오류나 502/503/504 응답은 재시도합니다."""
+    client = get_model_client()
+    start = time.perf_counter()
+    for attempt in range(MODEL_HTTP_RETRIES + 1):
+        last_attempt = attempt == MODEL_HTTP_RETRIES
+        try:
+            response = await client.get(path, timeout=timeout, **kwargs)
+            if response.status_code not in RETRY_STATUS_CODES or last_attempt:
+                _record_latency(name, time.perf_counter() - start, response.is_error)
+                return response
+        except httpx.TransportError:
+            if last_attempt:
+                _record_latency(name, time.perf_counter() - start, True)
+                raise
+        await asyncio.sleep(MODEL_HTTP_RETRY_BACKOFF * (2 ** attempt))
+
+async def model_post(path: str, name: str, timeout: httpx.Timeout = DEFAULT_TIMEOUT, **kwargs) -> httpx.Response:
+    """모델 서버에 POST 요청을 보냅니다. 멱등하지 않으므로 재시도하지 않습니다."""
+    start = time.perf_counter()
+    try:
+        response = await get_model_client().post(path, timeout=timeout, **kwargs)
+    except httpx.HTTPError:
+        _record_latency(name, time.perf_counter() - start, True)
+        raise
+    _record_latency(name, time.perf_counter() - start, response.is_error)
+    return response
+
+@asynccontextmanager
+async def model_stream(path: str, name: str, timeout: httpx.Timeout, **kwargs):
+    """모델 서버에 POST 요청을 보내고 응답을 스트리밍으로 받습니다."""
+    start = time.perf_counter()
+    recorded = False
+    try:
+        async with get_model_client().stream("POST", path, timeout=timeout, **kwargs) as response:
+            _record_latency(name, time.perf_counter() - start, response.is_error)
+            recorded = True
+            yield response
+    except httpx.HTTPError:
+        # 응답 헤더를 받기 전에 실패한 경우만 오류로 기록
+        if not recorded:
+            _record_latency(name, time.perf_counter() - start, True)
+        raise
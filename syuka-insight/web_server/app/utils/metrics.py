@@ -0,0 +1,44 @@
+from fastapi import Response
+from prometheus_client import CONTENT_TYPE_LATEST, Counter, Histogram, generate_latest
+import time
+
+# 단계별 지연 시간 버킷 (초)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+
+# stage: chat_first_chunk | chat_total | summarize_first_chunk | summarize_total
+STAGE_SECONDS = Histogram(
+    "web_stage_seconds", "웹 서버 단계별 소요 시간 (초)", ["stage"], buckets=LATENCY_BUCKETS
+)
+
+# 모델 서버 호출 지연 시간 (스트림은 응답 헤더를 받기까지의 시간)
+MODEL_CALL_SECONDS = Histogram(
+    "web_model_call_seconds", "모델 서버 호출 지연 시간 (초)", ["call", "outcome"], buckets=LATENCY_BUCKETS
+)
+
+# yt-dlp 추출 작업 시간 (대기열 대기 포함)
+EXTRACTION_SECONDS = Histogram(
+    "web_extraction_seconds", "yt-dlp 추출 작업 소요 시간 (초)", ["task", "outcome"], buckets=LATENCY_BUCKETS
+)
+
+# /video/info 응답을 어디서 가져왔는지 (memory | db | ytdlp)
+VIDEO_INFO_SOURCE = Counter("web_video_info_source_total", "/video/info 응답 출처별 횟수", ["source"])
+
+class StreamTimer:
+    """중계하는 스트림의 첫 청크까지의 시간과 전체 시간을 기록합니다."""
+
+    def __init__(self, stream: str):
+        self.stream = stream
+        self.start = time.perf_counter()
+        self.first_chunk_seen = False
+
+    def chunk(self):
+        if not self.first_chunk_seen:
+            self.first_chunk_seen = True
+            STAGE_SECONDS.labels(stage=f"{self.stream}_first_chunk").observe(time.perf_counter() - self.start)
+
+    def finish(self):
+        STAGE_SECONDS.labels(stage=f"{self.stream}_total").observe(time.perf_counter() - self.start)
+
+def metrics_response() -> Response:
+    """Prometheus 텍스트 형식의 지표 응답을 만듭니다."""
+    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
@@ -0,0 +1,40 @@
+from typing import Awaitable, Callable, Dict, Hashable
+import asyncio
+
+class SingleFlight:
+    """같은 키로 동시에 들어온 요청들이 하나의 실행 결과를 함께 받도록 묶습니다."""
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+        self.executed = 0  # 실제로 실행된 횟수
+        self.coalesced = 0  # 진행 중인 실행에 합류한 요청 수
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable]):
+        """key에 대해 진행 중인 실행이 있으면 그 결과를 기다리고, 없으면 func를 실행합니다."""
+        task = self._inflight.get(key)
+        if task is not None:
+            self.coalesced += 1
+        else:
+            # 요청 하나가 취소되어도 공유 중인 실행은 계속되도록 별도 태스크로 실행
+            task = asyncio.ensure_future(func())
+            self._inflight[key] = task
+            self.executed += 1
+            task.add_done_callback(lambda t: self._on_done(key, t))
+        return await asyncio.shield(task)
+
+    def _on_done(self, key: Hashable, task: asyncio.Task):
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # 기다리는 요청이 없을 때 예외가 처리되지 않았다는 경고가 나지 않도록 확인
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self):
+        return {
+            "in_flight": len(self._inflight),
+            "executed": self.executed,
+            "coalesced": self.coalesced,
+        }
+
+# 웹 서버 전체에서 사용하는 요청 병합기 (키: (작업 이름, video_id))
+request_coalescer = SingleFlight()
@@ -0,0 +1,86 @@
+from collections import deque
+from typing import Iterable, Iterator, NamedTuple, Union
+import re
+
+# 큐 타이밍 줄 (예: 00:01:02.345 --> 00:01:04.000 align:start position:0%)
+TIMING_PATTERN = re.compile(r"^((?:\d+:)?\d{2}:\d{2}\.\d{3})\s+-->\s+((?:\d+:)?\d{2}:\d{2}\.\d{3})")
+# <c>, <00:00:01.234> 같은 인라인 태그
+TAG_PATTERN = re.compile(r"<[^>]*>")
+
+class Cue(NamedTuple):
+    start: float  # 초 단위
+    end: float
+    text: str
+
+def parse_timestamp(timestamp: str) -> float:
+    """'HH:MM:SS.mmm' 또는 'MM:SS.mmm' 형식을 초 단위로 변환합니다."""
+    seconds = 0.0
+    for part in timestamp.split(":"):
+        seconds = seconds * 60 + float(part)
+    return seconds
+
+def iter_vtt_cues(content: Union[str, Iterable[str]], dedupe_window: int = 3) -> Iterator[Cue]:
+    """WebVTT를 한 번만 훑으며 (start, end, text) 큐를 순서대로 생성합니다.
+
+    자동 자막은 이전 줄을 다음 큐에 반복하는(rolling) 형식이므로,
+    최근 dedupe_window개 줄과 같은 줄은 버리고 새로 나온 줄만 큐의 text로 남깁니다.
+    새 줄이 없는 큐는 생성하지 않습니다.
+    """
+    lines = content.splitlines() if isinstance(content, str) else content
+    recent = deque(maxlen=dedupe_window)
+
+    timing = None  # 현재 큐의 (start, end)
+    text_lines = []
+    skipping_block = False  # 헤더, NOTE, STYLE 블록
+
+    def flush():
+        new_lines = []
+        for text_line in text_lines:
+            text_line = TAG_PATTERN.sub("", text_line).strip()
+            if text_line and text_line not in recent:
+                recent.append(text_line)
+                new_lines.append(text_line)
+        if new_lines:
+            return Cue(timing[0], timing[1], "\n".join(new_lines))
+        return None
+
+    for line in lines:
+        line = line.rstrip("\r\n")
+
+        if not line:
+            # 빈 줄: 블록 끝 (자동 자막의 공백 한 칸 줄은 큐 내용으로 취급)
+            if timing is not None:
+                cue = flush()
+                if cue is not None:
+                    yield cue
+            timing = None
+            text_lines = []
+            skipping_block = False
+            continue
+
+        if timing is not None:
+            text_lines.append(line)
+            continue
+
+        if skipping_block:
+            continue
+
+        match = TIMING_PATTERN.match(line)
+        if match:
+            timing = (parse_timestamp(match.group(1)), parse_timestamp(match.group(2)))
+        elif line.startswith(("WEBVTT", "NOTE", "STYLE", "REGION")):
+            skipping_block = True
+        # 그 외(큐 식별자 등)는 무시
+
+    if timing is not None:
+        cue = flush()
+        if cue is not None:
+            yield cue
+
+def cues_to_text(cues: Iterable[Cue]) -> str:
+    """큐 목록을 줄 단위 일반 텍스트로 합칩니다."""
+    return "\n".join(cue.text for cue in cues)
+
+def vtt_to_text(content: Union[str, Iterable[str]]) -> str:
+    """WebVTT를 중복이 제거된 일반 텍스트로 변환합니다."""
+    return cues_to_text(iter_vtt_cues(content))
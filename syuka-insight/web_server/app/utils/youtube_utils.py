@@ -1,77 +1,125 @@
 import yt_dlp
-import os
 import re
+import time
 import datetime
+from urllib.parse import urlparse, parse_qs
+from utils.vtt_parser import iter_vtt_cues, vtt_to_text
 
-def get_video_info_and_subtitles(video_url: str):
+# 유튜브 영상 ID 형식 (11자리)
+VIDEO_ID_PATTERN = re.compile(r"^[A-Za-z0-9_-]{11}$")
+
+# 자막 언어와 형식
+SUBTITLE_LANG = "ko"
+SUBTITLE_FORMAT = "vtt"
+
+def extract_video_id(video_url: str):
     """
-    yt-dlp를 이용해 유튜브 영상 정보를 추출하고,
-    한글 자막(ko)이 있으면 VTT 파일을 읽어 텍스트로 정제해 반환합니다.
+    다양한 형태의 유튜브 URL(watch?v=, youtu.be, shorts, embed, live, &t= 등)에서 영상 ID를 추출합니다.
+    영상 ID를 찾지 못하면 None을 반환합니다.
+    """
+    video_url = video_url.strip()
+    if VIDEO_ID_PATTERN.match(video_url):
+        return video_url
+
+    parsed = urlparse(video_url if "://" in video_url else f"https://{video_url}")
+    host = (parsed.hostname or "").lower()
+    path_parts = [part for part in parsed.path.split("/") if part]
+
+    candidate = None
+    if host.endswith("youtu.be"):
+        candidate = path_parts[0] if path_parts else None
+    elif host.endswith("youtube.com") or host.endswith("youtube-nocookie.com"):
+        if parsed.path == "/watch":
+            candidate = parse_qs(parsed.query).get("v", [None])[0]
+        elif len(path_parts) >= 2 and path_parts[0] in ("shorts", "embed", "live", "v"):
+            candidate = path_parts[1]
+
+    if candidate and VIDEO_ID_PATTERN.match(candidate):
+        return candidate
+    return None
+
+def get_canonical_video_url(video_id: str):
+    """영상 ID로 표준 유튜브 URL을 만듭니다."""
+    return f"https://www.youtube.com/watch?v={video_id}"
+
+def get_video_metadata(video_url: str):
+    """
+    자막 없이 영상 정보(조회수 등)만 추출합니다. 실패하면 None을 반환합니다.
     """
     opts = {
-        "writesubtitles": True,           # 자막 다운로드
-        "writeautomaticsub": True,        # 자동 자막 다운로드
-        "skip_download": True,            # 비디오 다운로드는 하지 않음
-        "subtitlesformat": "vtt",         # 자막 형식
-        "outtmpl": "%(id)s.%(ext)s",      # 영상 ID로 파일명 지정
-        "subtitleslangs": ["ko"],         # 한국어 자막만 다운로드
+        "quiet": True,
+        "skip_download": True,
     }
 
     try:
         with yt_dlp.YoutubeDL(opts) as yt:
-            # 영상 정보 추출
-            info = yt.extract_info(video_url, download=False)
-            video_title = info.get('title', None)
-
-            if video_title:
-                # 영상 ID를 기반으로 파일명을 지정
-                video_id = info.get('id', '')
-                subtitle_file = f"{video_id}.ko.vtt"
-                print(f"다운로드된 자막 파일 경로: {subtitle_file}")
-
-                # 자막 다운로드
-                yt.download([video_url])
+            return yt.extract_info(video_url, download=False)
+    except Exception as e:
+        print(f"영상 정보 추출 중 오류 발생: {e}")
+        return None
 
-                # 자막 파일이 존재하면 텍스트 추출
-                if os.path.exists(subtitle_file):
-                    with open(subtitle_file, "r", encoding="utf-8") as f:
-                        content = f.read()
+def find_subtitle_url(info: dict, lang: str = SUBTITLE_LANG, ext: str = SUBTITLE_FORMAT):
+    """
+    extract_info 결과에서 자막 URL을 찾습니다.
+    yt-dlp가 선택한 requested_subtitles를 먼저 보고, 없으면 수동 자막 → 자동 자막 순서로 찾습니다.
+    """
+    requested = (info.get("requested_subtitles") or {}).get(lang)
+    if requested and requested.get("url") and requested.get("ext") == ext:
+        return requested["url"]
 
-                    # 자막 처리 로직
-                    clean_content = clean_subtitle_content(content)
+    for key in ("subtitles", "automatic_captions"):
+        for track in (info.get(key) or {}).get(lang, []):
+            if track.get("ext") == ext and track.get("url"):
+                return track["url"]
+    return None
 
-                    return info, clean_content
-                else:
-                    # 자막이 없는 경우 처리
-                    return info, "자막이 없습니다."
+def get_video_info_and_subtitles(video_url: str):
+    """
+    yt-dlp를 이용해 유튜브 영상 정보를 추출하고,
+    한글 자막(ko)이 있으면 메모리로 받아 (시작, 끝, 텍스트) 큐 목록으로 반환합니다.
+    자막이 없으면 빈 목록을 반환합니다. 디스크에 파일을 쓰지 않습니다.
+    """
+    opts = {
+        "quiet": True,
+        "writesubtitles": True,           # 자막 선택 (requested_subtitles)
+        "writeautomaticsub": True,        # 자동 자막 포함
+        "skip_download": True,            # 비디오 다운로드는 하지 않음
+        "subtitlesformat": SUBTITLE_FORMAT,  # 자막 형식
+        "subtitleslangs": [SUBTITLE_LANG],   # 한국어 자막만
+    }
 
-            else:
-                    # 영상 정보가 없을 경우
-                    return None, "영상 정보를 찾을 수 없습니다."
+    try:
+        with yt_dlp.YoutubeDL(opts) as yt:
+            # 영상 정보 추출 (자막 URL도 함께 얻음)
+            started = time.perf_counter()
+            info = yt.extract_info(video_url, download=False)
+            extracted = time.perf_counter()
+
+            if not info or not info.get('title'):
+                # 영상 정보가 없을 경우
+                return None, "영상 정보를 찾을 수 없습니다."
+
+            subtitle_url = find_subtitle_url(info)
+            if not subtitle_url:
+                # 자막이 없는 경우 처리
+                print(f"[{info.get('id', '')}] 정보 추출 {extracted - started:.2f}s, 자막 없음")
+                return info, []
+
+            # 자막을 파일로 저장하지 않고 바로 읽어 파싱
+            content = yt.urlopen(subtitle_url).read().decode("utf-8")
+            cues = list(iter_vtt_cues(content))
+            print(
+                f"[{info.get('id', '')}] 정보 추출 {extracted - started:.2f}s, "
+                f"자막 가져오기 {time.perf_counter() - extracted:.2f}s ({len(cues)}개 큐)"
+            )
+            return info, cues
     except Exception as e:
         print(f"오류 발생: {e}")
         return None, None
 
 def clean_subtitle_content(content):
-    """자막 콘텐츠 정제 함수"""
-    # 1. 'WEBVTT' 또는 'Kind' 같은 메타데이터 제거
-    clean_content = re.sub(r'WEBVTT.*?Kind.*?Language.*?\n', '', content, flags=re.DOTALL)  # 메타데이터 제거
-    
-    # 2. 타임스탬프 및 HTML 태그 제거
-    clean_content = re.sub(r'<.*?>', '', clean_content)  # <c> 태그 및 HTML 태그 제거
-    clean_content = re.sub(r'<\d{2}:\d{2}:\d{2}\.\d{3}>', '', clean_content)  # 타임스탬프 제거
-    clean_content = re.sub(r'\d{2}:\d{2}:\d{2}\.\d{3} --> \d{2}:\d{2}:\d{2}\.\d{3}', '', clean_content)  # 타임스탬프 형식 제거
-
-    # 3. 'align:start position:0%' 제거
-    clean_content = re.sub(r'align:start position:\d+%', '', clean_content)  # align:start 제거
-
-    # 4. 중복된 자막 제거 (텍스트가 반복되면 중복된 부분 제거)
-    clean_content = "\n".join(sorted(set(clean_content.splitlines()), key=lambda x: clean_content.index(x)))
-
-    # 5. 자막 내용 정리(불필요한 줄이나 빈 줄 제거)
-    clean_content = "\n".join([line.strip() for line in clean_content.splitlines() if line.strip()])
-
-    return clean_content
+    """자막 콘텐츠 정제 함수 (WebVTT → 중복이 제거된 일반 텍스트)"""
+    return vtt_to_text(content)
 
 def generate_markdown_timeline(chapters):
     """
@@ -87,6 +135,20 @@ def generate_markdown_timeline(chapters):
         markdown_text += f"{ch['title']}\n\n"
     return markdown_text
 
+def build_chapter_segments(chapters, cues):
+    """
+    챕터 구간별로 자막 큐를 묶어 [{"title", "text"}] 목록을 만듭니다.
+    챕터가 2개 미만이면 None을 반환합니다. (모델 서버가 길이 기준으로 분할)
+    """
+    if not chapters or len(chapters) < 2:
+        return None
+    segments = []
+    for ch in chapters:
+        text = "\n".join(cue.text for cue in cues if ch['start_time'] <= cue.start < ch['end_time'])
+        if text:
+            segments.append({"title": ch['title'], "text": text})
+    return segments or None
+
 def format_view_count(view_count: int):
     """
     조회수를 한국어 형식에 맞춰 변환합니다.
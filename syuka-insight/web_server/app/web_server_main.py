@@ -1,21 +1,35 @@
 from fastapi import FastAPI
-from routes import youtube, summarize, chat, chromadb
+from fastapi.middleware.gzip import GZipMiddleware
+from routes import youtube, summarize, chat, chromadb, ingest, cache, metrics
+import logging
 import os
 from dotenv import load_dotenv
 from models.database import engine, Base
+from models.youtube import SCHEMA_PATCHES
+from services.extraction_pool import extraction_pool
+from utils.http_client import get_model_client, close_model_client
+from sqlalchemy import text
 
 # 환경 변수 로드
 load_dotenv()
-MODEL_SERVER_URL = os.getenv("MODEL_SERVER_URL", "http://model-server:8001")
+
+# 로그 레벨 설정 (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO").upper())
 
 # FastAPI 앱 생성
 app = FastAPI(title="Web Server for Video Processing and Model API")
 
+# 자막 등 큰 응답 본문 압축 (Accept-Encoding: gzip 요청만, Starlette는 text/event-stream 응답을 압축하지 않음)
+app.add_middleware(GZipMiddleware, minimum_size=int(os.getenv("GZIP_MINIMUM_SIZE", "1000")))
+
 # 라우터 등록
 app.include_router(youtube.router)
 app.include_router(summarize.router)
 app.include_router(chat.router)
 app.include_router(chromadb.router)
+app.include_router(ingest.router)
+app.include_router(cache.router)
+app.include_router(metrics.router)
 
 @app.get("/health")
 def health_check():
@@ -23,9 +37,20 @@ def health_check():
 
 @app.on_event("startup")
 async def startup():
+    # 모델 서버 연결 풀 생성 (앱이 떠 있는 동안 재사용)
+    get_model_client()
+
     # 데이터베이스 테이블 생성
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        for statement in SCHEMA_PATCHES:
+            await conn.execute(text(statement))
+
+@app.on_event("shutdown")
+async def shutdown():
+    # yt-dlp 추출 프로세스 종료
+    extraction_pool.shutdown()
+    await close_model_client()
 
 if __name__ == "__main__":
     import uvicorn